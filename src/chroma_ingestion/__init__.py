@@ -2,19 +2,51 @@
 
 A semantic-aware code extraction and storage system that intelligently chunks code
 repositories and stores them in Chroma Cloud for AI agent retrieval and context generation.
+
+Public classes are resolved lazily (PEP 562) so that importing the package, or
+running ``chroma-ingest --help``, does not pull in chromadb and langchain.
 """
 
-from chroma_ingestion.clients.chroma import get_chroma_client
-from chroma_ingestion.ingestion.agents import AgentIngester
-from chroma_ingestion.ingestion.base import CodeIngester
-from chroma_ingestion.retrieval import CodeRetriever, MultiCollectionSearcher
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from chroma_ingestion._version import __version__
+
+if TYPE_CHECKING:
+    from chroma_ingestion.clients.chroma import get_chroma_client
+    from chroma_ingestion.ingestion.agents import AgentIngester
+    from chroma_ingestion.ingestion.base import CodeIngester
+    from chroma_ingestion.retrieval import CodeRetriever, MultiCollectionSearcher
+
+_LAZY_ATTRS = {
+    "AgentIngester": "chroma_ingestion.ingestion.agents",
+    "CodeIngester": "chroma_ingestion.ingestion.base",
+    "CodeRetriever": "chroma_ingestion.retrieval",
+    "MultiCollectionSearcher": "chroma_ingestion.retrieval",
+    "get_chroma_client": "chroma_ingestion.clients.chroma",
+}
 
 __all__ = [
     "AgentIngester",
     "CodeIngester",
     "CodeRetriever",
     "MultiCollectionSearcher",
+    "__version__",
     "get_chroma_client",
 ]
 
-__version__ = "0.2.0"
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
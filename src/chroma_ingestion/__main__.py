@@ -0,0 +1,45 @@
+"""Entry point for ``chroma-ingest`` and ``python -m chroma_ingestion``.
+
+``--version`` is answered straight from :mod:`chroma_ingestion._version` and
+``--help`` (top-level or per command) from the pre-rendered text in
+:mod:`chroma_ingestion._help`, without importing Click; every other
+invocation is dispatched to the Click command group in :mod:`chroma_ingestion.cli`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+PROG_NAME = "chroma-ingest"
+
+
+def run(argv: list[str] | None = None) -> None:
+    """Run the CLI.
+
+    Args:
+        argv: Command-line arguments without the program name
+            (defaults to ``sys.argv[1:]``)
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    if args == ["--version"]:
+        from chroma_ingestion._version import __version__
+
+        sys.stdout.write(f"{PROG_NAME}, version {__version__}\n")
+        return
+
+    if args and args[-1] == "--help" and len(args) <= 2:
+        from chroma_ingestion._help import COMMAND_HELP, MAIN_HELP
+
+        text = MAIN_HELP if len(args) == 1 else COMMAND_HELP.get(args[0])
+        if text is not None:
+            sys.stdout.write(text)
+            return
+
+    from chroma_ingestion.cli import main
+
+    main(args=args, prog_name=PROG_NAME)
+
+
+if __name__ == "__main__":
+    run()
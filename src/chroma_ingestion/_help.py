@@ -0,0 +1,180 @@
+"""Pre-rendered ``--help`` text for the chroma-ingest CLI.
+
+`chroma_ingestion.__main__` prints these strings for ``chroma-ingest --help``
+and ``chroma-ingest <command> --help`` without importing Click or building
+the command group. tests/unit/test_cli.py checks that they still match what
+Click renders (at 80 columns) from the definitions in `chroma_ingestion.cli`.
+"""
+
+MAIN_HELP = """\
+Usage: chroma-ingest [OPTIONS] COMMAND [ARGS]...
+
+  Chroma Ingestion - Semantic code search for ChromaDB.
+
+  A semantic-aware code extraction and storage system that intelligently chunks
+  code repositories and stores them in ChromaDB for AI agent retrieval and
+  context generation.
+
+Options:
+  --version        Show the version and exit.
+  --debug          Enable debug logging.
+  --log-file PATH  Write logs to this file.
+  --help           Show this message and exit.
+
+Commands:
+  audit-agents       Audit agent portfolio for quality, coverage, and...
+  enrich-collection  Enrich collection documents with inferred metadata.
+  info               Display information about a collection.
+  ingest             Ingest code files into ChromaDB.
+  list-collections   List all collections in ChromaDB.
+  rag-query          Perform semantic search on agents using RAG.
+  search             Search ingested code with semantic queries.
+"""
+
+COMMAND_HELP = {
+    "ingest": """\
+Usage: chroma-ingest ingest [OPTIONS] FOLDER
+
+  Ingest code files into ChromaDB.
+
+  Discovers code files in FOLDER, intelligently chunks them using code-aware
+  splitting, and stores them in ChromaDB with metadata.
+
+  Example:     chroma-ingest ingest ./my-project --collection my_agents --verify
+
+Options:
+  --collection TEXT               ChromaDB collection name to ingest into.
+  --chunk-size INTEGER            Token size per chunk (default: 1000).
+  --chunk-overlap INTEGER         Token overlap between chunks (default: 200).
+  --batch-size INTEGER            Chunks per batch upsert (default: 100).
+  --agents                        Use AgentIngester for .agent.md files instead
+                                  of CodeIngester.
+  --verify                        Run verification queries after ingestion.
+  --upsert-workers INTEGER RANGE  Batches upserted concurrently (default: 4).
+                                  [x>=1]
+  --no-cache                      Re-split every file instead of reusing chunks
+                                  cached by earlier runs.
+  --help                          Show this message and exit.
+""",
+    "search": """\
+Usage: chroma-ingest search [OPTIONS] QUERY
+
+  Search ingested code with semantic queries.
+
+  Performs semantic search on the specified collection using natural language.
+
+  Example:     chroma-ingest search "authentication middleware" --num-results 3
+
+Options:
+  --collection TEXT          ChromaDB collection to search.
+  -n, --num-results INTEGER  Number of results to return (default: 5).
+  --threshold FLOAT          Distance threshold (lower = more similar, 0.0-1.0).
+  --json                     Output results as JSON.
+  --no-cache                 Always query Chroma instead of reusing results from
+                             the last few minutes.
+  --help                     Show this message and exit.
+""",
+    "info": """\
+Usage: chroma-ingest info [OPTIONS]
+
+  Display information about a collection.
+
+  Shows statistics about the ingested code in the specified collection.
+
+  Example:     chroma-ingest info --collection my_agents
+
+Options:
+  --collection TEXT  ChromaDB collection to get info about.
+  --help             Show this message and exit.
+""",
+    "list-collections": """\
+Usage: chroma-ingest list-collections [OPTIONS]
+
+  List all collections in ChromaDB.
+
+  Shows all available collections with their document counts and basic metadata.
+
+  Example:     chroma-ingest list-collections     chroma-ingest list-collections
+  --limit 10 --offset 20
+
+Options:
+  --limit INTEGER   Maximum number of collections to list (default: 100).
+  --offset INTEGER  Offset for pagination (default: 0).
+  --help            Show this message and exit.
+""",
+    "rag-query": """\
+Usage: chroma-ingest rag-query [OPTIONS] QUERY
+
+  Perform semantic search on agents using RAG.
+
+  Queries ingested agents/prompts/instructions using semantic similarity. Great
+  for finding agents matching your needs.
+
+  Example:     chroma-ingest rag-query "nextjs testing framework"     chroma-
+  ingest rag-query "security authentication" --num-results 10     chroma-ingest
+  rag-query "python fastapi" --collection agents_discovery
+
+Options:
+  --collection TEXT          Chroma collection to search (default:
+                             agents_discovery).
+  -n, --num-results INTEGER  Number of results to return (default: 5).
+  --threshold FLOAT          Distance threshold (lower = more similar, 0.0-1.0,
+                             default: 0.5).
+  --json                     Output results as JSON.
+  --no-cache                 Always query Chroma instead of reusing results from
+                             the last few minutes.
+  --help                     Show this message and exit.
+""",
+    "audit-agents": """\
+Usage: chroma-ingest audit-agents [OPTIONS]
+
+  Audit agent portfolio for quality, coverage, and consolidation opportunities.
+
+  Analyzes all agents in the collection and produces a comprehensive report
+  showing category distribution, tech stack coverage, gaps, and consolidation
+  candidates (agents that could be merged).
+
+  Example:     chroma-ingest audit-agents     chroma-ingest audit-agents
+  --collection agents_raw --similarity 0.65     chroma-ingest audit-agents
+  --json
+
+Options:
+  --collection TEXT          Chroma collection to audit (default: agents_raw).
+  --similarity FLOAT         Similarity threshold for consolidation (0.0-1.0,
+                             default: 0.7).
+  --page-size INTEGER RANGE  Chunks fetched per request while loading agents
+                             (default: 1024).  [x>=1]
+  --json                     Output results as JSON.
+  --help                     Show this message and exit.
+""",
+    "enrich-collection": """\
+Usage: chroma-ingest enrich-collection [OPTIONS] COLLECTION
+
+  Enrich collection documents with inferred metadata.
+
+  Analyzes document content to automatically infer category, tech stack, and
+  description metadata for documents lacking enriched information.
+
+  Useful for enriching agents_raw collection to enable full portfolio analysis
+  on all 26K documents.
+
+  Example:     chroma-ingest enrich-collection agents_raw     chroma-ingest
+  enrich-collection agents_raw --batch-size 50     chroma-ingest enrich-
+  collection agents_raw --dry-run     chroma-ingest enrich-collection agents_raw
+  --workers 8
+
+Options:
+  --batch-size INTEGER         Documents to write back per update call (default:
+                               100).
+  --page-size INTEGER RANGE    Documents to fetch per read (default: same as
+                               --batch-size).  [x>=1]
+  --concurrency INTEGER RANGE  Page reads and batch writes kept in flight
+                               (default: 4).  [x>=1]
+  --workers INTEGER RANGE      Processes to run inference in (default: 1, in-
+                               process).  [x>=1]
+  --dry-run                    Preview enrichment without saving changes.
+  --skip-existing              Skip documents that already have category
+                               metadata.
+  --help                       Show this message and exit.
+""",
+}
@@ -0,0 +1,3 @@
+"""Package version, kept dependency-free so the CLI can report it cheaply."""
+
+__version__ = "0.2.0"
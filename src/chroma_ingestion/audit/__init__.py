@@ -3,6 +3,32 @@
 Analyzes ingested agents for quality, coverage, and consolidation opportunities.
 """
 
-from chroma_ingestion.audit.agent_auditor import AgentAuditor
+from __future__ import annotations
 
-__all__ = ["AgentAuditor"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chroma_ingestion.audit.agent_auditor import AgentAuditor
+
+_LAZY_ATTRS = {
+    "AgentAuditor": "chroma_ingestion.audit.agent_auditor",
+}
+
+__all__ = [
+    "AgentAuditor",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,16 +2,122 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import logging
+import sys
 from collections import Counter, defaultdict
+from itertools import chain
 from typing import Any
 
-from chroma_ingestion.clients.chroma import get_chroma_client
+import numpy as np
+
+from chroma_ingestion.clients.chroma import get_async_chroma_client, get_chroma_client
 from chroma_ingestion.retrieval.rag_chain import RAGChain
 
+try:
+    # orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Workspace root stripped from agent paths in the report for readability
+_PATH_PREFIX = "/home/ollie/Tools/vibe-tools/"
+
+# Agents scored per matrix product when searching for consolidation pairs
+_PAIR_BLOCK_ROWS = 64
+
+# (overlap, category, agent1, agent2, tech1, tech2) for a qualifying agent pair
+_ScoredPair = tuple[float, str, dict[str, Any], dict[str, Any], frozenset[str], frozenset[str]]
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated categories/techs share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _tech_set(agent: dict[str, Any]) -> frozenset[str]:
+    """Return an agent's normalized (stripped, non-empty) tech set.
+
+    The set is cached on the agent dict under `_tech_set` so the analysis passes
+    never re-strip or rebuild it; `tech_stack` stays as the human-facing list.
+    """
+    techs = agent.get("_tech_set")
+    if techs is None:
+        techs = frozenset(t.strip() for t in agent.get("tech_stack", []) if t.strip())
+        agent["_tech_set"] = techs
+    return techs
+
+
+def _overlapping_pairs(
+    tech_sets: list[frozenset[str]], threshold: float
+) -> list[tuple[int, int, float]]:
+    """Find pairs of tech sets whose overlap meets a threshold.
+
+    Overlap is |A & B| / max(|A|, |B|). Since |A & B| <= min(|A|, |B|), a pair
+    can only qualify when min/max >= threshold, so agents are ordered by set size
+    and each block of agents (0/1 rows of an agent x tech matrix) is compared only
+    with the window of larger agents that passes this length-ratio gate.
+
+    Args:
+        tech_sets: Normalized tech stack of each agent
+        threshold: Minimum overlap score for a pair to be returned
+
+    Returns:
+        `(i, j, overlap)` triples with i < j for pairs sharing at least one tech,
+        in index order
+    """
+    n = len(tech_sets)
+    tech_to_col = {tech: col for col, tech in enumerate(sorted(frozenset().union(*tech_sets)))}
+    sizes = np.fromiter((len(t) for t in tech_sets), dtype=np.int64, count=n)
+    order = np.argsort(sizes, kind="stable")
+    sorted_sizes = sizes[order].astype(np.float64)
+
+    # 0/1 entries and their integer dot products are exact in float32, which
+    # halves the memory moved per product; scores are computed in float64.
+    matrix = np.zeros((n, len(tech_to_col)), dtype=np.float32)
+    for row, idx in enumerate(order.tolist()):
+        matrix[row, [tech_to_col[t] for t in tech_sets[idx]]] = 1.0
+
+    # Exclusive end of each row's feasible partner window (sizes are ascending)
+    if threshold > 0:
+        upper = np.searchsorted(sorted_sizes, sorted_sizes / threshold + 1e-9, side="right")
+    else:
+        upper = np.full(n, n)
+
+    # Rows are scored in blocks: one GEMM per block against the union of the
+    # block's partner windows, keeping only the above-threshold upper triangle.
+    # Empty sets sort first and can never share a tech, so they are skipped.
+    first = int(np.searchsorted(sorted_sizes, 0, side="right"))
+    pairs: list[tuple[int, int, float]] = []
+    for r0 in range(first, n - 1, _PAIR_BLOCK_ROWS):
+        r1 = min(r0 + _PAIR_BLOCK_ROWS, n - 1)
+        c0, c1 = r0 + 1, int(upper[r0:r1].max())
+        if c1 <= c0:
+            continue
+
+        # Only techs present in this block can contribute to an intersection
+        block = matrix[r0:r1]
+        cols = np.flatnonzero(block.any(axis=0))
+        inter = (block[:, cols] @ matrix[c0:c1, cols].T).astype(np.float64)
+        scores = inter / sorted_sizes[c0:c1]  # for col > row the partner is the larger set
+        above_diag = np.arange(c0, c1)[None, :] > np.arange(r0, r1)[:, None]
+        hit_rows, hit_cols = np.nonzero(above_diag & (inter > 0) & (scores >= threshold))
+
+        for r, c, score in zip(
+            order[r0 + hit_rows].tolist(),
+            order[c0 + hit_cols].tolist(),
+            scores[hit_rows, hit_cols].tolist(),
+            strict=True,
+        ):
+            pairs.append((r, c, score) if r < c else (c, r, score))
+
+    pairs.sort()
+    return pairs
+
 
 class AgentAuditor:
     """Analyze agents in Chroma for value, coverage, and consolidation opportunities.
@@ -24,25 +130,65 @@ class AgentAuditor:
     - Value metrics (agent complexity, specificity)
     """
 
-    def __init__(self, collection_name: str = "agents_raw"):
+    def __init__(self, collection_name: str = "agents_raw", async_client: Any | None = None):
         """Initialize auditor.
 
         Args:
             collection_name: Collection to analyze (default: agents_raw)
+            async_client: Optional Chroma AsyncHttpClient used by `aload_agents`
+                (created on demand when omitted)
         """
         self.collection_name = collection_name
-        self.rag = RAGChain(collection_name=collection_name)
-        self.agents: list[dict[str, Any]] = []
+        self.async_client = async_client
+        self._rag: RAGChain | None = None
+        self._agents: list[dict[str, Any]] = []
         self.coverage_analysis: dict[str, Any] = {}
         self.consolidation_candidates: list[dict[str, Any]] = []
 
-    def load_agents(self, limit: int = 1000) -> int:
+        # Cache bookkeeping: `_agents_version` changes whenever `agents` is
+        # replaced; each analysis records the version it was computed for, and
+        # `_results_version` changes whenever any analysis result is recomputed.
+        self._agents_version = 0
+        self._analytics_version = -1
+        self._coverage_version = -1
+        self._candidates_version = -1
+        self._results_version = 0
+        self._report_cache: tuple[tuple[int, bool], str] | None = None
+
+        # Shared single-pass analytics (see `_compute_analytics`)
+        self._category_counts: Counter[str] = Counter()
+        self._type_counts: Counter[str] = Counter()
+        self._tech_counts: Counter[str] = Counter()
+        self._by_category: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    @property
+    def agents(self) -> list[dict[str, Any]]:
+        """Aggregated agents; assigning a new list invalidates cached analyses."""
+        return self._agents
+
+    @agents.setter
+    def agents(self, agents: list[dict[str, Any]]) -> None:
+        self._agents = agents
+        self._agents_version += 1
+
+    @property
+    def rag(self) -> RAGChain:
+        """RAG chain over the audited collection, created on first access."""
+        if self._rag is None:
+            self._rag = RAGChain(collection_name=self.collection_name)
+        return self._rag
+
+    def load_agents(self, limit: int | None = 1000, page_size: int = 500) -> int:
         """Load all agents from collection.
 
         Aggregates document chunks by file path to create unique "agents".
+        Chunks are fetched in pages so each batch is aggregated and released
+        before the next one is requested.
 
         Args:
-            limit: Maximum chunks to load (will aggregate into fewer unique agents)
+            limit: Maximum chunks to load (will aggregate into fewer unique agents),
+                or None to stream the whole collection
+            page_size: Chunks fetched per `collection.get` call
 
         Returns:
             Number of unique agents loaded
@@ -51,67 +197,194 @@ class AgentAuditor:
             client = get_chroma_client()
             collection = client.get_collection(self.collection_name)
 
-            # Get all chunks
-            results = collection.get(limit=limit)
+            # Aggregate chunks by file path (everything before the `:`)
+            agents_by_file: defaultdict[str, dict[str, Any]] = defaultdict(
+                lambda: {"chunk_count": 0, "tech_stack": set()}
+            )
+
+            offset = 0
+            while limit is None or offset < limit:
+                page = page_size if limit is None else min(page_size, limit - offset)
+                # Only metadata is aggregated; ids are always returned
+                results = collection.get(limit=page, offset=offset, include=["metadatas"])
+                ids = results.get("ids") if results else None
+                if not ids:
+                    break
+
+                self._merge_chunks(agents_by_file, ids, results.get("metadatas") or [])
+                offset += len(ids)
+                if len(ids) < page:
+                    break
+
+            return self._set_agents(agents_by_file)
 
-            if not results or not results.get("documents"):
-                logger.warning("⚠️  No agents found in collection")
-                return 0
+        except Exception as e:
+            logger.error("❌ Error loading agents: %s", e)
+            return 0
 
-            # Aggregate chunks by file path (everything before the `:`)
-            agents_by_file: dict[str, dict[str, Any]] = {}
-            
-            for doc_id, meta in zip(results.get("ids", []), results.get("metadatas", [])):
-                # Extract file path (everything before `:chunk_number`)
-                file_path = doc_id.split(':')[0]
-                
-                # Parse tech_stack from JSON string
-                tech_stack = []
-                tech_stack_raw = meta.get("tech_stack", "")
-                if tech_stack_raw:
-                    if isinstance(tech_stack_raw, str):
-                        try:
-                            # Try to parse as JSON array
-                            if tech_stack_raw.startswith('['):
-                                tech_stack = json.loads(tech_stack_raw)
-                            else:
-                                # Fallback to comma-separated
-                                tech_stack = [t.strip() for t in tech_stack_raw.split(",") if t.strip()]
-                        except json.JSONDecodeError:
-                            tech_stack = [t.strip() for t in tech_stack_raw.split(",") if t.strip()]
-                    else:
-                        tech_stack = tech_stack_raw if isinstance(tech_stack_raw, list) else []
-                
-                if file_path not in agents_by_file:
-                    # First chunk for this file
-                    agents_by_file[file_path] = {
-                        "name": file_path.split('/')[-1],  # Use filename as agent name
-                        "path": file_path,
-                        "type": meta.get("agent_type", "agent"),
-                        "category": meta.get("category", "unknown"),
-                        "tech_stack": tech_stack,
-                        "description": meta.get("description", ""),
-                        "source": meta.get("source", "unknown"),
-                        "complexity": meta.get("complexity", "unknown"),
-                        "chunk_count": 1,
-                        "raw_metadata": meta,
-                    }
-                else:
-                    # Subsequent chunk - merge data
-                    agents_by_file[file_path]["chunk_count"] += 1
-                    agents_by_file[file_path]["tech_stack"] = list(set(
-                        agents_by_file[file_path]["tech_stack"] + tech_stack
-                    ))
-
-            # Convert to list
-            self.agents = list(agents_by_file.values())
-            logger.info("✅ Loaded %d unique agents from %s", len(self.agents), self.collection_name)
-            return len(self.agents)
+    async def aload_agents(
+        self,
+        limit: int = 1000,
+        page_size: int = 200,
+        max_concurrency: int = 4,
+    ) -> int:
+        """Load agents using the async Chroma client with concurrent page fetches.
+
+        Up to `max_concurrency` pages are in flight at once; completed pages are
+        merged in offset order while later pages are still being fetched, so
+        parsing overlaps network I/O and the aggregation matches `load_agents`.
+
+        Args:
+            limit: Maximum chunks to load (will aggregate into fewer unique agents)
+            page_size: Chunks fetched per `collection.get` call
+            max_concurrency: Maximum concurrent `collection.get` requests
+
+        Returns:
+            Number of unique agents loaded
+        """
+        tasks: list[asyncio.Task[Any]] = []
+        try:
+            client = self.async_client
+            if client is None:
+                client = self.async_client = await get_async_chroma_client()
+            collection = await client.get_collection(self.collection_name)
+
+            total = min(limit, await collection.count())
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_page(offset: int) -> Any:
+                async with semaphore:
+                    return await collection.get(
+                        limit=min(page_size, total - offset),
+                        offset=offset,
+                        include=["metadatas"],
+                    )
+
+            tasks = [
+                asyncio.create_task(fetch_page(offset)) for offset in range(0, total, page_size)
+            ]
+
+            agents_by_file: defaultdict[str, dict[str, Any]] = defaultdict(
+                lambda: {"chunk_count": 0, "tech_stack": set()}
+            )
+            for task in tasks:
+                results = await task
+                ids = results.get("ids") if results else None
+                if ids:
+                    self._merge_chunks(agents_by_file, ids, results.get("metadatas") or [])
+
+            return self._set_agents(agents_by_file)
 
         except Exception as e:
             logger.error("❌ Error loading agents: %s", e)
             return 0
 
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _set_agents(self, agents_by_file: defaultdict[str, dict[str, Any]]) -> int:
+        """Finalize aggregated agents and make them the current agent list.
+
+        Args:
+            agents_by_file: Aggregated agents keyed by file path
+
+        Returns:
+            Number of unique agents loaded
+        """
+        if not agents_by_file:
+            logger.warning("⚠️  No agents found in collection")
+            return 0
+
+        # Convert to list, freezing each merged tech set into a sorted list
+        agents = list(agents_by_file.values())
+        for agent in agents:
+            agent["tech_stack"] = sorted(agent["tech_stack"])
+            _tech_set(agent)
+        self.agents = agents
+        logger.info("✅ Loaded %d unique agents from %s", len(self.agents), self.collection_name)
+        return len(self.agents)
+
+    def _merge_chunks(
+        self,
+        agents_by_file: defaultdict[str, dict[str, Any]],
+        ids: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Merge one page of chunk ids/metadata into the per-file agent map.
+
+        Args:
+            agents_by_file: Aggregated agents keyed by file path (updated in place);
+                entries start as `{"chunk_count": 0, "tech_stack": set()}`
+            ids: Chunk ids (`<file_path>:<chunk_number>`)
+            metadatas: Chunk metadata aligned with `ids`
+        """
+        for doc_id, meta in zip(ids, metadatas):
+            # Extract file path (everything before `:chunk_number`)
+            file_path = doc_id.partition(':')[0]
+
+            # Parse tech_stack: JSON array string, comma-separated string, or list
+            tech_stack = []
+            tech_stack_raw = meta.get("tech_stack", "")
+            if isinstance(tech_stack_raw, str):
+                raw = tech_stack_raw.lstrip()
+                if raw[:1] == "[":
+                    try:
+                        tech_stack = _json_loads(raw)
+                    except json.JSONDecodeError:
+                        tech_stack = [t.strip() for t in raw.split(",") if t.strip()]
+                elif raw:
+                    # Comma-separated: no JSON decode attempt at all
+                    tech_stack = [t.strip() for t in raw.split(",") if t.strip()]
+            elif isinstance(tech_stack_raw, list):
+                tech_stack = tech_stack_raw
+
+            entry = agents_by_file[file_path]
+            if not entry["chunk_count"]:
+                # First chunk for this file
+                entry.update(
+                    name=file_path.rpartition('/')[2],  # Use filename as agent name
+                    path=file_path,
+                    type=_intern(meta.get("agent_type", "agent")),
+                    category=_intern(meta.get("category", "unknown")),
+                    description=meta.get("description", ""),
+                    source=_intern(meta.get("source", "unknown")),
+                    complexity=meta.get("complexity", "unknown"),
+                    raw_metadata=meta,
+                )
+            entry["chunk_count"] += 1
+            entry["tech_stack"].update(map(_intern, tech_stack))
+
+    def _compute_analytics(self) -> None:
+        """Count categories, types and techs and group agents by category in one pass.
+
+        Shared by `analyze_coverage` and `find_consolidation_candidates` so the
+        agent list is scanned once per load rather than once per statistic.
+        """
+        if self._analytics_version == self._agents_version:
+            return
+
+        categories: Counter[str] = Counter()
+        types: Counter[str] = Counter()
+        tech_sets: list[frozenset[str]] = []
+        by_category: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+
+        for agent in self.agents:
+            category = agent.get("category", "unknown")
+            categories[category] += 1
+            types[agent.get("type", "unknown")] += 1
+            tech_sets.append(_tech_set(agent))
+            by_category[category].append(agent)
+
+        # One Counter call over the flattened techs keeps the counting loop in C
+        techs = Counter(chain.from_iterable(tech_sets))
+
+        self._category_counts = categories
+        self._type_counts = types
+        self._tech_counts = techs
+        self._by_category = by_category
+        self._analytics_version = self._agents_version
+
     def analyze_coverage(self) -> dict[str, Any]:
         """Analyze coverage of agents by category and tech stack.
 
@@ -121,17 +394,9 @@ class AgentAuditor:
         if not self.agents:
             self.load_agents()
 
-        # Count by category
-        categories = Counter(a.get("category", "unknown") for a in self.agents)
-        
-        # Count by tech stack
-        all_techs: list[str] = []
-        for agent in self.agents:
-            all_techs.extend([t.strip() for t in agent.get("tech_stack", []) if t.strip()])
-        tech_counts = Counter(all_techs)
-
-        # Count by type
-        types = Counter(a.get("type", "unknown") for a in self.agents)
+        self._compute_analytics()
+        categories = self._category_counts
+        tech_counts = self._tech_counts
 
         # Identify gaps (tech stacks with <2 agents)
         gaps = [tech for tech, count in tech_counts.items() if count < 2]
@@ -140,14 +405,19 @@ class AgentAuditor:
             "total_agents": len(self.agents),
             "categories": dict(categories.most_common(10)),
             "top_tech_stacks": dict(tech_counts.most_common(15)),
-            "agent_types": dict(types),
+            "agent_types": dict(self._type_counts),
             "coverage_gaps": gaps[:10],  # Tech stacks with poor coverage
             "category_balance": {
                 "most_common": categories.most_common(1)[0] if categories else None,
-                "least_common": categories.most_common()[-1] if categories else None,
+                # Single O(n) pass; reversed() keeps the old tie-break (last inserted)
+                "least_common": (
+                    min(reversed(categories.items()), key=lambda kv: kv[1]) if categories else None
+                ),
                 "spread": len(categories),
             },
         }
+        self._coverage_version = self._agents_version
+        self._results_version += 1
 
         return self.coverage_analysis
 
@@ -172,57 +442,67 @@ class AgentAuditor:
 
         logger.info("🔍 Analyzing %d agents for consolidation opportunities...", len(self.agents))
 
-        candidates: list[dict[str, Any]] = []
+        self._compute_analytics()
 
-        # Group agents by category
-        by_category = defaultdict(list)
-        for agent in self.agents:
-            cat = agent.get("category", "unknown")
-            by_category[cat].append(agent)
+        scored: list[_ScoredPair] = []
 
         # Within each category, find similar agents
-        for category, agents_in_cat in by_category.items():
+        for category, agents_in_cat in self._by_category.items():
             if len(agents_in_cat) < 2:
                 continue
 
-            # Simple similarity: tech stack overlap
-            for i, agent1 in enumerate(agents_in_cat):
-                for agent2 in agents_in_cat[i + 1 :]:
-                    # Skip self-comparison (compare by name AND path for safety)
-                    if (agent1.get("name") == agent2.get("name") and 
+            tech_sets = [_tech_set(a) for a in agents_in_cat]
+            for i, j, score in _overlapping_pairs(tech_sets, similarity_threshold):
+                agent1 = agents_in_cat[i]
+                agent2 = agents_in_cat[j]
+
+                # Skip self-comparison (compare by name AND path for safety)
+                if (agent1.get("name") == agent2.get("name") and
                         agent1.get("path") == agent2.get("path")):
-                        continue
-                    
-                    tech1 = set(a.strip() for a in agent1.get("tech_stack", []) if a.strip())
-                    tech2 = set(a.strip() for a in agent2.get("tech_stack", []) if a.strip())
-
-                    if tech1 and tech2:
-                        overlap = len(tech1 & tech2) / max(len(tech1), len(tech2))
-
-                        # Skip 100% overlap with same name (likely duplicates from different processes)
-                        if overlap >= 0.99 and agent1.get("name") == agent2.get("name"):
-                            continue
-
-                        if overlap >= similarity_threshold:
-                            candidates.append({
-                                "agent1": agent1["name"],
-                                "agent2": agent2["name"],
-                                "category": category,
-                                "overlap_score": overlap,
-                                "shared_techs": list(tech1 & tech2),
-                                "recommendation": (
-                                    f"Consider merging {agent1['name']} and {agent2['name']} "
-                                    f"(share {overlap*100:.0f}% tech stack in {category})"
-                                ),
-                            })
-
-        # Sort by overlap and limit
-        candidates.sort(key=lambda x: x["overlap_score"], reverse=True)
-        self.consolidation_candidates = candidates[:max_candidates]
+                    continue
+
+                # Skip 100% overlap with same name (likely duplicates from different processes)
+                if score >= 0.99 and agent1.get("name") == agent2.get("name"):
+                    continue
+
+                scored.append((score, category, agent1, agent2, tech_sets[i], tech_sets[j]))
+
+        # Keep the top-K by overlap (O(M log K), same order as a stable sort);
+        # shared techs are only materialized for survivors
+        top = heapq.nlargest(max_candidates, scored, key=lambda x: x[0])
+        self.consolidation_candidates = [
+            {
+                "agent1": agent1["name"],
+                "agent2": agent2["name"],
+                "agent1_path": agent1.get("path", agent1["name"]),
+                "agent2_path": agent2.get("path", agent2["name"]),
+                "category": category,
+                "overlap_score": overlap,
+                "shared_techs": list(tech1 & tech2),
+                "recommendation": (
+                    f"Consider merging {agent1['name']} and {agent2['name']} "
+                    f"(share {overlap*100:.0f}% tech stack in {category})"
+                ),
+            }
+            for overlap, category, agent1, agent2, tech1, tech2 in top
+        ]
+        self._candidates_version = self._agents_version
+        self._results_version += 1
 
         logger.info("✅ Found %d consolidation candidates", len(self.consolidation_candidates))
         return self.consolidation_candidates
 
+    def _ensure_analysis(self) -> None:
+        """Run coverage/consolidation analysis unless it is current for the loaded agents.
+
+        Results computed explicitly (e.g. with a custom similarity threshold) are
+        kept as long as the agent list has not been replaced since.
+        """
+        if self._coverage_version != self._agents_version:
+            self.analyze_coverage()
+        if self._candidates_version != self._agents_version:
+            self.find_consolidation_candidates()
+
     def generate_report(self, include_details: bool = False) -> str:
         """Generate a comprehensive audit report.
 
@@ -232,87 +512,84 @@ class AgentAuditor:
         Returns:
             Formatted report string
         """
-        # Ensure analysis is done
-        if not self.coverage_analysis:
-            self.analyze_coverage()
-        if not self.consolidation_candidates:
-            self.find_consolidation_candidates()
+        self._ensure_analysis()
 
-        report = "\n" + "=" * 80 + "\n"
-        report += "🔍 AGENT PORTFOLIO AUDIT REPORT\n"
-        report += "=" * 80 + "\n\n"
+        # Reuse the last report while agents and analysis results are unchanged
+        cache_key = (self._results_version, include_details)
+        if self._report_cache is not None and self._report_cache[0] == cache_key:
+            return self._report_cache[1]
 
-        # Summary
         coverage = self.coverage_analysis
-        report += f"📊 SUMMARY\n"
-        report += f"{'─' * 40}\n"
-        report += f"Total Agents: {coverage['total_agents']}\n"
-        report += f"Categories Represented: {coverage['category_balance']['spread']}\n"
-        report += f"Unique Tech Stacks: {len(coverage['top_tech_stacks'])}\n"
-        report += f"Consolidation Candidates: {len(self.consolidation_candidates)}\n"
-        report += f"Coverage Gaps: {len(coverage['coverage_gaps'])} tech stacks\n\n"
+        rule = "─" * 40
+        parts: list[str] = ["\n", "=" * 80, "\n"]
+        parts.extend(["🔍 AGENT PORTFOLIO AUDIT REPORT\n", "=" * 80, "\n\n"])
+
+        # Summary
+        parts.extend([
+            "📊 SUMMARY\n",
+            f"{rule}\n",
+            f"Total Agents: {coverage['total_agents']}\n",
+            f"Categories Represented: {coverage['category_balance']['spread']}\n",
+            f"Unique Tech Stacks: {len(coverage['top_tech_stacks'])}\n",
+            f"Consolidation Candidates: {len(self.consolidation_candidates)}\n",
+            f"Coverage Gaps: {len(coverage['coverage_gaps'])} tech stacks\n\n",
+        ])
 
         # Category Balance
-        report += f"📈 CATEGORY DISTRIBUTION\n"
-        report += f"{'─' * 40}\n"
+        parts.extend(["📈 CATEGORY DISTRIBUTION\n", f"{rule}\n"])
         for cat, count in sorted(coverage["categories"].items(), key=lambda x: x[1], reverse=True):
             pct = (count / coverage["total_agents"]) * 100
             bar = "█" * int(pct / 5)
-            report += f"{cat:20} {count:3d} agents  {pct:5.1f}% {bar}\n"
-        report += "\n"
+            parts.append(f"{cat:20} {count:3d} agents  {pct:5.1f}% {bar}\n")
+        parts.append("\n")
 
         # Top Tech Stacks
-        report += f"🛠️  TOP TECH STACKS\n"
-        report += f"{'─' * 40}\n"
+        parts.extend(["🛠️  TOP TECH STACKS\n", f"{rule}\n"])
         for tech, count in list(coverage["top_tech_stacks"].items())[:8]:
-            report += f"{tech:20} {count:3d} agents\n"
-        report += "\n"
+            parts.append(f"{tech:20} {count:3d} agents\n")
+        parts.append("\n")
 
         # Coverage Gaps
-        report += f"⚠️  COVERAGE GAPS (< 2 agents)\n"
-        report += f"{'─' * 40}\n"
+        parts.extend(["⚠️  COVERAGE GAPS (< 2 agents)\n", f"{rule}\n"])
         if coverage["coverage_gaps"]:
-            for tech in coverage["coverage_gaps"][:10]:
-                report += f"• {tech}\n"
+            parts.extend(f"• {tech}\n" for tech in coverage["coverage_gaps"][:10])
         else:
-            report += "✅ No significant gaps detected\n"
-        report += "\n"
+            parts.append("✅ No significant gaps detected\n")
+        parts.append("\n")
 
         # Consolidation Candidates
-        report += f"🔗 CONSOLIDATION CANDIDATES\n"
-        report += f"{'─' * 40}\n"
+        parts.extend(["🔗 CONSOLIDATION CANDIDATES\n", f"{rule}\n"])
         if self.consolidation_candidates:
-            # Load agents for path display
-            agents_by_name = {a["name"]: a for a in self.agents}
-            
             for i, cand in enumerate(self.consolidation_candidates[:5], 1):
-                agent1_name = cand['agent1']
-                agent2_name = cand['agent2']
-                agent1_path = agents_by_name.get(agent1_name, {}).get("path", agent1_name)
-                agent2_path = agents_by_name.get(agent2_name, {}).get("path", agent2_name)
-                
+                agent1_path = cand["agent1_path"]
+                agent2_path = cand["agent2_path"]
+
                 # Extract just the relative path for readability
-                agent1_short = agent1_path.replace("/home/ollie/Tools/vibe-tools/", "")
-                agent2_short = agent2_path.replace("/home/ollie/Tools/vibe-tools/", "")
-                
-                report += (
+                agent1_short = agent1_path.removeprefix(_PATH_PREFIX)
+                agent2_short = agent2_path.removeprefix(_PATH_PREFIX)
+
+                parts.append(
                     f"{i}. {agent1_short} ↔\n   {agent2_short}\n"
                     f"   Overlap: {cand['overlap_score']*100:.0f}% | "
                     f"Shared: {', '.join(cand['shared_techs'][:3])}\n\n"
                 )
         else:
-            report += "✅ No consolidation needed\n"
-        report += "\n"
+            parts.append("✅ No consolidation needed\n")
+        parts.append("\n")
 
         # Value Metrics
-        report += f"⭐ VALUE ASSESSMENT\n"
-        report += f"{'─' * 40}\n"
-        report += f"Portfolio Health: {'🟢 Good' if len(self.consolidation_candidates) < 5 else '🟡 Fair' if len(self.consolidation_candidates) < 10 else '🔴 Review'}\n"
-        report += f"Specialization: {'🟢 Diverse' if coverage['category_balance']['spread'] >= 8 else '🟡 Moderate' if coverage['category_balance']['spread'] >= 5 else '🔴 Limited'}\n"
-        report += f"Tech Coverage: {'🟢 Comprehensive' if len(coverage['top_tech_stacks']) >= 10 else '🟡 Good' if len(coverage['top_tech_stacks']) >= 5 else '🔴 Narrow'}\n"
-
-        report += "\n" + "=" * 80 + "\n"
-
+        parts.extend([
+            "⭐ VALUE ASSESSMENT\n",
+            f"{rule}\n",
+            f"Portfolio Health: {'🟢 Good' if len(self.consolidation_candidates) < 5 else '🟡 Fair' if len(self.consolidation_candidates) < 10 else '🔴 Review'}\n",
+            f"Specialization: {'🟢 Diverse' if coverage['category_balance']['spread'] >= 8 else '🟡 Moderate' if coverage['category_balance']['spread'] >= 5 else '🔴 Limited'}\n",
+            f"Tech Coverage: {'🟢 Comprehensive' if len(coverage['top_tech_stacks']) >= 10 else '🟡 Good' if len(coverage['top_tech_stacks']) >= 5 else '🔴 Narrow'}\n",
+        ])
+
+        parts.extend(["\n", "=" * 80, "\n"])
+
+        report = "".join(parts)
+        self._report_cache = (cache_key, report)
         return report
 
     def get_audit_summary(self) -> dict[str, Any]:
@@ -321,10 +598,7 @@ class AgentAuditor:
         Returns:
             Dictionary with audit findings
         """
-        if not self.coverage_analysis:
-            self.analyze_coverage()
-        if not self.consolidation_candidates:
-            self.find_consolidation_candidates()
+        self._ensure_analysis()
 
         return {
             "timestamp": None,
@@ -7,20 +7,33 @@ the ingested code using semantic queries.
 from __future__ import annotations
 
 import logging
+import os
 import sys
-from pathlib import Path
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import click
 
-from chroma_ingestion import (
-    AgentIngester,
-    CodeIngester,
-    CodeRetriever,
-    __version__,
-)
+from chroma_ingestion._version import __version__
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+        """Pretty-print JSON output with orjson's C encoder."""
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    def _dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+        """Pretty-print JSON output with the standard library encoder."""
+        return json.dumps(obj, indent=2, default=default)
+
 
 def configure_logging(debug: bool = False, log_file: str | None = None) -> None:
     """Configure root logging for the CLI."""
@@ -46,7 +59,49 @@ def configure_logging(debug: bool = False, log_file: str | None = None) -> None:
         root.addHandler(fh)
 
 
-@click.group()
+def _invalidate_query_cache(collection: str) -> None:
+    """Drop cached search results and handles for a collection that was just modified."""
+    from chroma_ingestion.retrieval.cache import QueryCache
+    from chroma_ingestion.retrieval.retriever_clean import clear_cache
+
+    QueryCache().invalidate(collection)
+    clear_cache(collection)
+
+
+class CLIError(Exception):
+    """Expected failure reported to the user as a one-line error, without a traceback."""
+
+
+def _is_user_error(exc: Exception) -> bool:
+    """Return True for failures caused by user input rather than a bug."""
+    if isinstance(exc, CLIError):
+        return True
+    # Only consult chromadb's error types if chromadb has already been imported
+    chroma_errors = sys.modules.get("chromadb.errors")
+    return chroma_errors is not None and isinstance(exc, chroma_errors.NotFoundError)
+
+
+class _CLIGroup(click.Group):
+    """Click group that reports command failures in one place.
+
+    Expected errors (`CLIError`, missing collections) are logged as a single
+    line; anything else is logged with its traceback. Both exit with status 1.
+    """
+
+    def invoke(self, ctx: click.Context) -> Any:
+        try:
+            return super().invoke(ctx)
+        except (click.ClickException, click.exceptions.Exit, click.Abort):
+            raise
+        except Exception as e:
+            if _is_user_error(e):
+                logger.error("❌ %s", e)
+            else:
+                logger.exception("❌ %s error: %s", ctx.invoked_subcommand, e)
+            sys.exit(1)
+
+
+@click.group(cls=_CLIGroup)
 @click.version_option(version=__version__)
 @click.option("--debug", is_flag=True, help="Enable debug logging.")
 @click.option("--log-file", type=click.Path(), default=None, help="Write logs to this file.")
@@ -100,6 +155,17 @@ def main(ctx, debug: bool, log_file: str | None) -> None:
     is_flag=True,
     help="Run verification queries after ingestion.",
 )
+@click.option(
+    "--upsert-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Batches upserted concurrently (default: 4).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-split every file instead of reusing chunks cached by earlier runs.",
+)
 def ingest(
     folder: str,
     collection: str,
@@ -108,6 +174,8 @@ def ingest(
     batch_size: int,
     agents: bool,
     verify: bool,
+    upsert_workers: int,
+    no_cache: bool,
 ) -> None:
     """Ingest code files into ChromaDB.
 
@@ -117,44 +185,53 @@ def ingest(
     Example:
         chroma-ingest ingest ./my-project --collection my_agents --verify
     """
-    try:
-        folder_path = Path(folder).resolve()
-
-        if agents:
-            logger.info("🤖 Starting agent ingestion from %s", folder_path)
-            ingester = AgentIngester(
-                target_folder=str(folder_path),
-                collection_name=collection,
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                batch_size=batch_size,
-            )
-        else:
-            logger.info("📂 Starting code ingestion from %s", folder_path)
-            ingester = CodeIngester(
-                target_folder=str(folder_path),
-                collection_name=collection,
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                batch_size=batch_size,
-            )
-
-        # Run ingestion
-        ingester.run()
-        logger.info("✅ Ingestion complete! Stored in collection: %s", collection)
-
-        # Run verification if requested
-        if verify:
-            logger.info("🔍 Running verification queries...")
-            retriever = CodeRetriever(collection)
-            info = retriever.get_collection_info()
-            # `get_collection_info()` returns {'total_chunks': count}
-            total = info.get("total_chunks", info.get("count", 0))
-            logger.info("📊 Collection stats: %s chunks ingested", total)
-
-    except Exception as e:
-        logger.exception("❌ Error during ingestion: %s", e)
-        sys.exit(1)
+    from chroma_ingestion.ingestion.agents import AgentIngester
+    from chroma_ingestion.ingestion.base import CodeIngester
+    from chroma_ingestion.ingestion.chunk_cache import ChunkCache
+
+    chunk_cache = None if no_cache else ChunkCache()
+
+    # abspath is pure string work; Path.resolve() would stat every component
+    folder_path = os.path.abspath(folder)
+
+    if agents:
+        logger.info("🤖 Starting agent ingestion from %s", folder_path)
+        ingester = AgentIngester(
+            target_folder=folder_path,
+            collection_name=collection,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            batch_size=batch_size,
+            chunk_cache=chunk_cache,
+            upsert_workers=upsert_workers,
+        )
+    else:
+        logger.info("📂 Starting code ingestion from %s", folder_path)
+        ingester = CodeIngester(
+            target_folder=folder_path,
+            collection_name=collection,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            batch_size=batch_size,
+            chunk_cache=chunk_cache,
+            upsert_workers=upsert_workers,
+        )
+
+    # Run ingestion
+    ingester.run()
+    logger.info("✅ Ingestion complete! Stored in collection: %s", collection)
+    _invalidate_query_cache(collection)
+
+    # Run verification if requested
+    if verify:
+        from chroma_ingestion.retrieval import CodeRetriever
+
+        logger.info("🔍 Running verification queries...")
+        retriever = CodeRetriever(collection)
+        info = retriever.get_collection_info()
+        # `get_collection_info()` returns {'total_chunks': count}
+        total = info.get("total_chunks", info.get("count", 0))
+        logger.info("📊 Collection stats: %s chunks ingested", total)
 
 
 @main.command()
@@ -183,12 +260,18 @@ def ingest(
     is_flag=True,
     help="Output results as JSON.",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always query Chroma instead of reusing results from the last few minutes.",
+)
 def search(
     query: str,
     collection: str,
     num_results: int,
     threshold: float,
     output_json: bool,
+    no_cache: bool,
 ) -> None:
     """Search ingested code with semantic queries.
 
@@ -197,47 +280,51 @@ def search(
     Example:
         chroma-ingest search "authentication middleware" --num-results 3
     """
-    try:
-        retriever = CodeRetriever(collection)
-        logger.info("🔍 Searching for: %s", query)
+    from chroma_ingestion.retrieval import CodeRetriever, QueryCache
 
-        results = retriever.query(query, n_results=num_results)
+    retriever = CodeRetriever(collection, cache=None if no_cache else QueryCache())
+    logger.info("🔍 Searching for: %s", query)
 
-        if not results:
-            logger.warning("❌ No results found.")
-            return
+    results = retriever.query(query, n_results=num_results)
 
-        # Filter by threshold if specified
-        filtered_results = [r for r in results if r.get("distance", 1.0) <= threshold]
+    if not results:
+        logger.warning("❌ No results found.")
+        return
 
-        if not filtered_results:
-            click.echo(
-                f"⚠️  No results below threshold {threshold}. "
-                f"Found {len(results)} results with lower confidence."
-            )
-            return
+    # Filter by threshold, reading each distance once and keeping its confidence
+    scored = [
+        (r, max(0.0, 1.0 - distance))
+        for r in results
+        if (distance := r.get("distance", 1.0)) <= threshold
+    ]
+    filtered_results = [r for r, _ in scored]
 
-        click.echo(f"✅ Found {len(filtered_results)} results:\n")
+    if not filtered_results:
+        click.echo(
+            f"⚠️  No results below threshold {threshold}. "
+            f"Found {len(results)} results with lower confidence."
+        )
+        return
 
-        if output_json:
-            import json
+    click.echo(f"✅ Found {len(filtered_results)} results:\n")
 
-            logger.info(json.dumps(filtered_results, indent=2))
-        else:
-            for i, result in enumerate(filtered_results, 1):
-                distance = result.get("distance", 0)
-                confidence = max(0, 1.0 - distance)
-                filename = result.get("metadata", {}).get("filename", "Unknown")
-                source = result.get("metadata", {}).get("source", "Unknown")
+    if output_json:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_dumps(filtered_results))
+    else:
+        # Render every hit first and write once, instead of 4 log records per hit
+        lines: list[str] = []
+        for i, (result, confidence) in enumerate(scored, 1):
+            metadata = result.get("metadata") or {}
+            filename = metadata.get("filename", "Unknown")
+            source = metadata.get("source", "Unknown")
 
-                logger.info("%d. %s (confidence: %.2f%%)", i, filename, confidence * 100)
-                logger.info("   📍 %s", source)
-                logger.info("   %s...", result["document"][:150].strip())
-                logger.info("")
+            lines.append(f"{i}. {filename} (confidence: {confidence * 100:.2f}%)")
+            lines.append(f"   📍 {source}")
+            lines.append(f"   {result['document'][:150].strip()}...")
+            lines.append("")
 
-    except Exception as e:
-        logger.exception("❌ Search error: %s", e)
-        sys.exit(1)
+        click.echo("\n".join(lines))
 
 
 @main.command()
@@ -254,20 +341,19 @@ def info(collection: str) -> None:
     Example:
         chroma-ingest info --collection my_agents
     """
-    try:
-        retriever = CodeRetriever(collection)
-        info_dict = retriever.get_collection_info()
+    from chroma_ingestion.retrieval import CodeRetriever
 
-        logger.info("📊 Collection: %s", collection)
-        logger.info("   Chunks: %s", info_dict.get("total_chunks", info_dict.get("count", 0)))
+    retriever = CodeRetriever(collection)
+    info_dict = retriever.get_collection_info()
+    if not info_dict:
+        raise CLIError(f"Could not read collection '{collection}'")
 
-        # Display additional metadata if available
-        if "metadata_count" in info_dict:
-            logger.info("   Metadata entries: %s", info_dict["metadata_count"])
+    logger.info("📊 Collection: %s", collection)
+    logger.info("   Chunks: %s", info_dict.get("total_chunks", info_dict.get("count", 0)))
 
-    except Exception as e:
-        logger.exception("❌ Error: %s", e)
-        sys.exit(1)
+    # Display additional metadata if available
+    if "metadata_count" in info_dict:
+        logger.info("   Metadata entries: %s", info_dict["metadata_count"])
 
 
 @main.command("list-collections")
@@ -292,41 +378,48 @@ def list_collections_cmd(limit: int, offset: int) -> None:
         chroma-ingest list-collections
         chroma-ingest list-collections --limit 10 --offset 20
     """
-    try:
-        from chroma_ingestion.clients.chroma import get_chroma_client
-
-        client = get_chroma_client()
-        collections = client.list_collections(limit=limit, offset=offset)
-
-        if not collections:
-            logger.info("📭 No collections found.")
-            return
-
-        logger.info("📚 Collections (%d):\n", len(collections))
-
-        # Display as a formatted table
-        for i, collection in enumerate(collections, 1):
-            try:
-                doc_count = collection.count()
-                metadata = collection.metadata or {}
-                metadata_str = " | ".join(f"{k}={v}" for k, v in list(metadata.items())[:2])
-
-                if metadata_str:
-                    logger.info(
-                        "%d. %s (docs: %d) [%s]",
-                        i,
-                        collection.name,
-                        doc_count,
-                        metadata_str,
-                    )
-                else:
-                    logger.info("%d. %s (docs: %d)", i, collection.name, doc_count)
-            except Exception as e:
-                logger.warning("%d. %s (error: %s)", i, collection.name, str(e))
-
-    except Exception as e:
-        logger.exception("❌ Error listing collections: %s", e)
-        sys.exit(1)
+    from chroma_ingestion.clients.chroma import get_chroma_client
+
+    client = get_chroma_client()
+    collections = client.list_collections(limit=limit, offset=offset)
+
+    if not collections:
+        logger.info("📭 No collections found.")
+        return
+
+    logger.info("📚 Collections (%d):\n", len(collections))
+
+    def count_docs(collection: Any) -> int | Exception:
+        try:
+            count: int = collection.count()
+        except Exception as e:
+            return e
+        return count
+
+    # Each count is its own HTTP round-trip; issue them concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(collections))) as pool:
+        counts = list(pool.map(count_docs, collections))
+
+    # Display as a formatted table
+    for i, (collection, doc_count) in enumerate(zip(collections, counts, strict=True), 1):
+        try:
+            if isinstance(doc_count, Exception):
+                raise doc_count
+            metadata = collection.metadata or {}
+            metadata_str = " | ".join(f"{k}={v}" for k, v in list(metadata.items())[:2])
+
+            if metadata_str:
+                logger.info(
+                    "%d. %s (docs: %d) [%s]",
+                    i,
+                    collection.name,
+                    doc_count,
+                    metadata_str,
+                )
+            else:
+                logger.info("%d. %s (docs: %d)", i, collection.name, doc_count)
+        except Exception as e:
+            logger.warning("%d. %s (error: %s)", i, collection.name, str(e))
 
 
 @main.command("rag-query")
@@ -355,12 +448,18 @@ def list_collections_cmd(limit: int, offset: int) -> None:
     is_flag=True,
     help="Output results as JSON.",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always query Chroma instead of reusing results from the last few minutes.",
+)
 def rag_query(
     query: str,
     collection: str,
     num_results: int,
     threshold: float,
     output_json: bool,
+    no_cache: bool,
 ) -> None:
     """Perform semantic search on agents using RAG.
 
@@ -372,29 +471,25 @@ def rag_query(
         chroma-ingest rag-query "security authentication" --num-results 10
         chroma-ingest rag-query "python fastapi" --collection agents_discovery
     """
-    try:
-        from chroma_ingestion.retrieval.rag_chain import RAGChain
-
-        rag = RAGChain(
-            collection_name=collection,
-            n_results=num_results,
-            distance_threshold=threshold,
-        )
-
-        logger.info("🔍 Searching agents for: %s", query)
+    from chroma_ingestion.retrieval.cache import QueryCache
+    from chroma_ingestion.retrieval.rag_chain import RAGChain
 
-        if output_json:
-            import json
+    rag = RAGChain(
+        collection_name=collection,
+        n_results=num_results,
+        distance_threshold=threshold,
+        cache=None if no_cache else QueryCache(),
+    )
 
-            result = rag.query(query, format_output=False, include_raw=False)
-            logger.info(json.dumps(result, indent=2))
-        else:
-            result = rag.query(query, format_output=True)
-            logger.info(result)
+    logger.info("🔍 Searching agents for: %s", query)
 
-    except Exception as e:
-        logger.exception("❌ Query error: %s", e)
-        sys.exit(1)
+    if output_json:
+        result = rag.query(query, format_output=False, include_raw=False)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_dumps(result))
+    else:
+        result = rag.query(query, format_output=True)
+        logger.info(result)
 
 
 @main.command("audit-agents")
@@ -409,6 +504,12 @@ def rag_query(
     default=0.7,
     help="Similarity threshold for consolidation (0.0-1.0, default: 0.7).",
 )
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=1024,
+    help="Chunks fetched per request while loading agents (default: 1024).",
+)
 @click.option(
     "--json",
     "output_json",
@@ -418,6 +519,7 @@ def rag_query(
 def audit_agents(
     collection: str,
     similarity: float,
+    page_size: int,
     output_json: bool,
 ) -> None:
     """Audit agent portfolio for quality, coverage, and consolidation opportunities.
@@ -431,28 +533,23 @@ def audit_agents(
         chroma-ingest audit-agents --collection agents_raw --similarity 0.65
         chroma-ingest audit-agents --json
     """
-    try:
-        from chroma_ingestion.audit.agent_auditor import AgentAuditor
+    from chroma_ingestion.audit.agent_auditor import AgentAuditor
 
-        auditor = AgentAuditor(collection_name=collection)
-        
-        logger.info("📊 Auditing agent portfolio...")
-        auditor.load_agents(limit=100000)  # Load all agents (26K+ documents)
-        auditor.analyze_coverage()
-        auditor.find_consolidation_candidates(similarity_threshold=similarity)
+    auditor = AgentAuditor(collection_name=collection)
 
-        if output_json:
-            import json
+    logger.info("📊 Auditing agent portfolio...")
+    # Stream every chunk page by page; only per-agent aggregates are kept
+    auditor.load_agents(limit=None, page_size=page_size)
+    auditor.analyze_coverage()
+    auditor.find_consolidation_candidates(similarity_threshold=similarity)
 
-            summary = auditor.get_audit_summary()
-            logger.info(json.dumps(summary, indent=2, default=str))
-        else:
-            report = auditor.generate_report()
-            logger.info(report)
-
-    except Exception as e:
-        logger.exception("❌ Audit error: %s", e)
-        sys.exit(1)
+    if output_json:
+        summary = auditor.get_audit_summary()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_dumps(summary, default=str))
+    else:
+        report = auditor.generate_report()
+        logger.info(report)
 
 
 @main.command("enrich-collection")
@@ -461,7 +558,25 @@ def audit_agents(
     "--batch-size",
     type=int,
     default=100,
-    help="Documents to process per batch (default: 100).",
+    help="Documents to write back per update call (default: 100).",
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Documents to fetch per read (default: same as --batch-size).",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Page reads and batch writes kept in flight (default: 4).",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Processes to run inference in (default: 1, in-process).",
 )
 @click.option(
     "--dry-run",
@@ -477,6 +592,9 @@ def audit_agents(
 def enrich_collection(
     collection: str,
     batch_size: int,
+    page_size: int | None,
+    concurrency: int,
+    workers: int,
     dry_run: bool,
     skip_existing: bool,
 ) -> None:
@@ -492,45 +610,45 @@ def enrich_collection(
         chroma-ingest enrich-collection agents_raw
         chroma-ingest enrich-collection agents_raw --batch-size 50
         chroma-ingest enrich-collection agents_raw --dry-run
+        chroma-ingest enrich-collection agents_raw --workers 8
     """
-    try:
-        from chroma_ingestion.enrichment.metadata_inferrer import MetadataInferrer
-
-        inferrer = MetadataInferrer()
-        
-        logger.info(f"🔍 Starting enrichment of {collection}...")
-        if dry_run:
-            logger.info("⚠️  Running in DRY-RUN mode (no changes will be saved)")
-
-        result = inferrer.enrich_collection(
-            collection_name=collection,
-            batch_size=batch_size,
-            dry_run=dry_run,
-            skip_existing=skip_existing,
-        )
-
-        logger.info(f"📊 Enrichment Summary:")
-        logger.info(f"  Total documents: {result['total_documents']}")
-        logger.info(f"  Processed: {result['processed']}")
-        logger.info(f"  Enriched: {result['enriched']}")
-        logger.info(f"  Skipped: {result['skipped']}")
-        logger.info(f"  Failed: {result['failed_count']}")
-
-        if result["failed_count"] > 0:
-            logger.warning(f"⚠️  {result['failed_count']} documents failed to enrich:")
-            for doc_id, error in result["failed_ids"][:5]:  # Show first 5
-                logger.warning(f"    - {doc_id}: {error}")
-            if len(result["failed_ids"]) > 5:
-                logger.warning(f"    ... and {len(result['failed_ids']) - 5} more")
-
-        if not dry_run and result["enriched"] > 0:
-            logger.info(f"✅ Successfully enriched {result['enriched']} documents")
-        elif dry_run:
-            logger.info(f"✅ Dry-run complete: would enrich {result['enriched']} documents")
-
-    except Exception as e:
-        logger.exception("❌ Enrichment error: %s", e)
-        sys.exit(1)
+    from chroma_ingestion.enrichment.metadata_inferrer import MetadataInferrer
+
+    inferrer = MetadataInferrer()
+
+    logger.info("🔍 Starting enrichment of %s...", collection)
+    if dry_run:
+        logger.info("⚠️  Running in DRY-RUN mode (no changes will be saved)")
+
+    result = inferrer.enrich_collection(
+        collection_name=collection,
+        batch_size=batch_size,
+        page_size=page_size,
+        concurrency=concurrency,
+        workers=workers,
+        dry_run=dry_run,
+        skip_existing=skip_existing,
+    )
+
+    logger.info("📊 Enrichment Summary:")
+    logger.info("  Total documents: %s", result["total_documents"])
+    logger.info("  Processed: %s", result["processed"])
+    logger.info("  Enriched: %s", result["enriched"])
+    logger.info("  Skipped: %s", result["skipped"])
+    logger.info("  Failed: %s", result["failed_count"])
+
+    if result["failed_count"] > 0:
+        logger.warning("⚠️  %s documents failed to enrich:", result["failed_count"])
+        for doc_id, error in result["failed_ids"][:5]:  # Show first 5
+            logger.warning("    - %s: %s", doc_id, error)
+        if len(result["failed_ids"]) > 5:
+            logger.warning("    ... and %d more", len(result["failed_ids"]) - 5)
+
+    if not dry_run and result["enriched"] > 0:
+        _invalidate_query_cache(collection)
+        logger.info("✅ Successfully enriched %s documents", result["enriched"])
+    elif dry_run:
+        logger.info("✅ Dry-run complete: would enrich %s documents", result["enriched"])
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 """Chroma client module for connection management."""
 
-from chroma_ingestion.clients.chroma import get_chroma_client
+from chroma_ingestion.clients.chroma import get_async_chroma_client, get_chroma_client
 
 __all__ = [
+    "get_async_chroma_client",
     "get_chroma_client",
 ]
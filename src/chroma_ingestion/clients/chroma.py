@@ -4,9 +4,11 @@ This module provides initialization and utility functions for the Chroma
 HttpClient, following best practices for client management and configuration.
 """
 
+import threading
 from typing import Any
 
 import chromadb
+from chromadb.config import Settings
 
 from chroma_ingestion.config import get_chroma_config
 
@@ -15,6 +17,17 @@ from chroma_ingestion.config import get_chroma_config
 # expose callables that mypy may not consider valid types. This avoids
 # spurious mypy errors while preserving runtime behavior.
 _client: Any | None = None
+# Guards first-time construction when worker threads race for the client
+_client_lock = threading.Lock()
+
+
+def _client_settings() -> Settings:
+    """Client settings shared by the sync and async clients.
+
+    Anonymized telemetry is disabled so client start-up does not issue
+    extra outbound requests.
+    """
+    return Settings(anonymized_telemetry=False)
 
 
 def get_chroma_client() -> Any:
@@ -22,7 +35,9 @@ def get_chroma_client() -> Any:
 
     Uses a singleton pattern to ensure a single client instance is reused
     across the application. Connects to a local ChromaDB HTTP server.
-    Configuration is loaded from environment variables.
+    Configuration is loaded from environment variables on first use only.
+    Construction is guarded by a lock, so concurrent first calls from a
+    thread pool still share one client and connection pool.
 
     Returns:
         chromadb.HttpClient: Initialized Chroma HttpClient
@@ -33,20 +48,43 @@ def get_chroma_client() -> Any:
     global _client
 
     if _client is None:
-        config = get_chroma_config()
-        # Coerce types to satisfy downstream expectations: host=str, port=int
-        host = str(config.get("host", "localhost"))
-        port = int(config.get("port", 9500))
+        with _client_lock:
+            if _client is None:
+                config = get_chroma_config()
+                # Coerce types to satisfy downstream expectations: host=str, port=int
+                host = str(config.get("host", "localhost"))
+                port = int(config.get("port", 9500))
 
-        _client = chromadb.HttpClient(host=host, port=port)
+                _client = chromadb.HttpClient(host=host, port=port, settings=_client_settings())
 
     return _client
 
 
+async def get_async_chroma_client() -> Any:
+    """Create a Chroma AsyncHttpClient from the same configuration.
+
+    Async clients are bound to the event loop they were created on, so unlike
+    `get_chroma_client` this is not cached as a module-level singleton; callers
+    should create one per loop and reuse it.
+
+    Returns:
+        chromadb.api.AsyncClientAPI: Initialized Chroma AsyncHttpClient
+
+    Raises:
+        ValueError: If required configuration is missing or invalid
+    """
+    config = get_chroma_config()
+    host = str(config.get("host", "localhost"))
+    port = int(config.get("port", 9500))
+
+    return await chromadb.AsyncHttpClient(host=host, port=port, settings=_client_settings())
+
+
 def reset_client() -> None:
     """Reset the global client instance.
 
     Useful for testing or when you need to reinitialize with new configuration.
     """
     global _client
-    _client = None
+    with _client_lock:
+        _client = None
@@ -4,6 +4,30 @@ Provides tools for automatically inferring category, tech stack, and description
 for documents using RAG-based analysis.
 """
 
-from chroma_ingestion.enrichment.metadata_inferrer import MetadataInferrer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chroma_ingestion.enrichment.metadata_inferrer import MetadataInferrer
+
+_LAZY_ATTRS = {
+    "MetadataInferrer": "chroma_ingestion.enrichment.metadata_inferrer",
+}
 
 __all__ = ["MetadataInferrer"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,11 +4,20 @@ Uses RAG-based similarity analysis to automatically infer category, tech stack,
 and descriptions for documents that lack enriched metadata.
 """
 
+import hashlib
+import json
 import logging
+import multiprocessing
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
-from chroma_ingestion.retrieval.rag_chain import RAGChain
+if TYPE_CHECKING:
+    from chroma_ingestion.retrieval.rag_chain import RAGChain
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +35,9 @@ TECH_KEYWORDS = {
     "planning": ["requirements", "prd", "task", "planning", "roadmap", "specification", "design doc"],
 }
 
+# Every tech keyword, flattened once in TECH_KEYWORDS order
+_TECH_TERMS = tuple(tech for techs in TECH_KEYWORDS.values() for tech in techs)
+
 # Category mapping (inferred from tech stacks)
 CATEGORY_KEYWORDS = {
     "frontend": ["react", "nextjs", "vue", "ui", "component", "css", "tailwind", "shadcn"],
@@ -40,6 +52,43 @@ CATEGORY_KEYWORDS = {
     "planning": ["requirements", "prd", "planning", "task"],
 }
 
+# Reverse index: keyword -> category, plus keyword count per category
+_KW_TO_CATEGORY = {kw: category for category, kws in CATEGORY_KEYWORDS.items() for kw in kws}
+_CATEGORY_SIZES = {category: len(kws) for category, kws in CATEGORY_KEYWORDS.items()}
+
+# Keyword inference results remembered per inferrer, keyed by text digest
+KEYWORD_CACHE_SIZE = 4096
+# (infer_category result, infer_tech_stack result)
+_KeywordResults = tuple[tuple[str, float], tuple[list[str], float]]
+
+
+def content_hash(text: str) -> str:
+    """Return a short digest of document text, stored to detect changes.
+
+    Args:
+        text: Document content
+
+    Returns:
+        32-character hex BLAKE2b digest
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def tech_stack_json(tech_stack: tuple[str, ...]) -> str:
+    """Serialize a tech stack for Chroma metadata, which only stores scalars.
+
+    Uses compact separators; results are cached because many documents
+    share the same stack.
+
+    Args:
+        tech_stack: Technologies in ranked order
+
+    Returns:
+        JSON array string
+    """
+    return json.dumps(list(tech_stack), separators=(",", ":"))
+
 
 @dataclass
 class EnrichedMetadata:
@@ -56,7 +105,7 @@ class EnrichedMetadata:
 class MetadataInferrer:
     """Infer metadata for documents using semantic similarity and RAG."""
 
-    def __init__(self, rag_chain: Optional[RAGChain] = None, use_keywords: bool = True):
+    def __init__(self, rag_chain: Optional["RAGChain"] = None, use_keywords: bool = True):
         """Initialize metadata inferrer.
 
         Args:
@@ -65,6 +114,9 @@ class MetadataInferrer:
         """
         self.rag = rag_chain
         self.use_keywords = use_keywords
+        # digest of lowercased text -> (category result, tech stack result),
+        # least recently used first
+        self._keyword_cache: dict[bytes, _KeywordResults] = {}
 
     def extract_agent_name(self, doc_text: str, filename: Optional[str] = None) -> str:
         """Extract agent name from document.
@@ -93,13 +145,14 @@ class MetadataInferrer:
         # Fallback
         return "unknown-agent"
 
-    def infer_category(self, doc_text: str) -> Tuple[str, float]:
+    def infer_category(self, doc_text: str, text_lower: str | None = None) -> Tuple[str, float]:
         """Infer category from document content.
 
         Uses keyword matching and optionally RAG similarity.
 
         Args:
             doc_text: Document content (first 500 chars)
+            text_lower: `doc_text.lower()`, if the caller already has it
 
         Returns:
             Tuple of (category, confidence_score)
@@ -108,27 +161,32 @@ class MetadataInferrer:
             return "unknown", 0.0
 
         # Keyword-based inference
-        text_lower = doc_text.lower()[:1000]  # First 1000 chars
-        scores = {}
+        if text_lower is None:
+            text_lower = doc_text.lower()
+        text_lower = text_lower[:1000]  # First 1000 chars
+        matches: Counter[str] = Counter()
+        for kw, category in _KW_TO_CATEGORY.items():
+            if kw in text_lower:
+                matches[category] += 1
 
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            matches = sum(1 for kw in keywords if kw in text_lower)
-            if matches > 0:
-                scores[category] = matches / len(keywords)
+        scores = {category: n / _CATEGORY_SIZES[category] for category, n in matches.items()}
 
         if scores:
             best_category = max(scores, key=scores.get)
             confidence = scores[best_category]
-            logger.info(f"  Inferred category: {best_category} ({confidence:.2f})")
+            logger.info("  Inferred category: %s (%.2f)", best_category, confidence)
             return best_category, min(confidence, 0.99)
 
         return "unknown", 0.0
 
-    def infer_tech_stack(self, doc_text: str) -> Tuple[List[str], float]:
+    def infer_tech_stack(
+        self, doc_text: str, text_lower: str | None = None
+    ) -> Tuple[List[str], float]:
         """Extract technology keywords from document.
 
         Args:
             doc_text: Document content
+            text_lower: `doc_text.lower()`, if the caller already has it
 
         Returns:
             Tuple of (tech_stack_list, confidence_score)
@@ -136,24 +194,23 @@ class MetadataInferrer:
         if not doc_text:
             return [], 0.0
 
-        text_lower = doc_text.lower()
-        found_techs = set()
+        if text_lower is None:
+            text_lower = doc_text.lower()
         matches_per_tech = {}
 
-        # Search all tech keywords
-        for category, techs in TECH_KEYWORDS.items():
-            for tech in techs:
-                if tech in text_lower:
-                    found_techs.add(tech)
-                    matches_per_tech[tech] = text_lower.count(tech)
+        # Search all tech keywords; one count() scan both finds and counts
+        for tech in _TECH_TERMS:
+            count = text_lower.count(tech)
+            if count:
+                matches_per_tech[tech] = count
 
-        # Sort by frequency and take top 5-10
-        sorted_techs = sorted(found_techs, key=lambda t: matches_per_tech.get(t, 1), reverse=True)
+        # Sort by frequency (ties keep keyword order) and take top 5-10
+        sorted_techs = sorted(matches_per_tech, key=matches_per_tech.__getitem__, reverse=True)
         tech_stack = sorted_techs[:10]
 
         if tech_stack:
             confidence = min(len(tech_stack) / 10, 1.0)  # More techs = higher confidence
-            logger.info(f"  Inferred tech stack: {tech_stack} ({confidence:.2f})")
+            logger.info("  Inferred tech stack: %s (%.2f)", tech_stack, confidence)
             return tech_stack, confidence
 
         return [], 0.0
@@ -175,12 +232,15 @@ class MetadataInferrer:
 
         lines = doc_text.split("\n")
         description_lines = []
+        # Length of "\n".join(description_lines), tracked instead of re-joined
+        joined_length = -1
 
         for line in lines[1:]:  # Skip title
             line = line.strip()
             if line and not line.startswith("#"):
                 description_lines.append(line)
-            if len("\n".join(description_lines)) > max_length:
+                joined_length += len(line) + 1
+            if joined_length > max_length:
                 break
 
         description = " ".join(description_lines)[:max_length].strip()
@@ -191,6 +251,35 @@ class MetadataInferrer:
 
         return "", 0.0
 
+    def _infer_keywords(self, doc_text: str, text_lower: str) -> _KeywordResults:
+        """Run category and tech stack inference, reusing results for repeated text.
+
+        Templated and duplicated agent docs are common, and both inferences
+        depend only on the lowercased text. Results are keyed by a digest, so
+        the cache never holds document text.
+
+        Args:
+            doc_text: Document content
+            text_lower: `doc_text.lower()`
+
+        Returns:
+            Tuple of (infer_category result, infer_tech_stack result)
+        """
+        key = hashlib.blake2b(text_lower.encode("utf-8"), digest_size=16).digest()
+        cached = self._keyword_cache.pop(key, None)
+        if cached is None:
+            cached = (
+                self.infer_category(doc_text, text_lower),
+                self.infer_tech_stack(doc_text, text_lower),
+            )
+            while len(self._keyword_cache) >= KEYWORD_CACHE_SIZE:
+                del self._keyword_cache[next(iter(self._keyword_cache))]
+        # (Re-)insert as most recently used
+        self._keyword_cache[key] = cached
+
+        category_result, (tech_stack, tech_conf) = cached
+        return category_result, (list(tech_stack), tech_conf)
+
     def enrich_document(
         self,
         doc_id: str,
@@ -207,11 +296,15 @@ class MetadataInferrer:
         Returns:
             EnrichedMetadata with all inferred fields
         """
-        logger.info(f"Enriching document: {doc_id}")
+        logger.info("Enriching document: %s", doc_id)
+
+        # Lowercase once; both keyword passes scan the same text
+        text_lower = doc_text.lower()
 
         agent_name = self.extract_agent_name(doc_text, filename)
-        category, category_conf = self.infer_category(doc_text)
-        tech_stack, tech_conf = self.infer_tech_stack(doc_text)
+        (category, category_conf), (tech_stack, tech_conf) = self._infer_keywords(
+            doc_text, text_lower
+        )
         description, desc_conf = self.infer_description(doc_text)
 
         confidence_scores = {
@@ -235,86 +328,196 @@ class MetadataInferrer:
         batch_size: int = 100,
         dry_run: bool = False,
         skip_existing: bool = True,
+        page_size: int | None = None,
+        concurrency: int = 4,
+        workers: int = 1,
     ) -> Dict:
         """Enrich all documents in a Chroma collection.
 
+        The collection's IDs are listed once, then documents are read a page of
+        IDs at a time (documents and metadatas only, no embeddings) and the
+        enriched fields are written back with one
+        ``collection.update`` call per batch. Page reads and batch writes run
+        on a small thread pool so they overlap with inference. With
+        ``workers > 1`` the inference itself runs in a process pool, while all
+        Chroma calls stay in this process.
+
         Args:
             collection_name: Name of collection to enrich
-            batch_size: Number of documents to process per batch
+            batch_size: Number of documents to write back per update call
             dry_run: If True, don't save changes to Chroma
-            skip_existing: Skip documents that already have metadata
+            skip_existing: Skip documents that already have metadata. Documents
+                enriched by an earlier run whose text has not changed since are
+                always skipped.
+            page_size: Number of documents to fetch per read (defaults to batch_size)
+            concurrency: Maximum page reads, and separately batch writes, in flight
+            workers: Processes to run inference in (1 runs it in this process)
 
         Returns:
             Summary dict with processing stats
         """
         from chroma_ingestion.clients.chroma import get_chroma_client
 
+        page_size = page_size or batch_size
         client = get_chroma_client()
         collection = client.get_collection(name=collection_name)
-        total_docs = collection.count()
+        # List IDs up front; fetching pages by ID avoids Chroma re-scanning
+        # `offset` rows for every page of an offset/limit walk
+        all_ids = collection.get(include=[])["ids"]
+        total_docs = len(all_ids)
 
-        logger.info(f"Starting enrichment of {collection_name} ({total_docs} documents)")
+        logger.info("Starting enrichment of %s (%d documents)", collection_name, total_docs)
 
         processed = 0
         enriched = 0
-        failed = []
+        failed: list[tuple[str, str]] = []
         skipped = 0
-
-        try:
-            # Get all documents in batches
-            for offset in range(0, total_docs, batch_size):
-                batch_results = collection.get(limit=batch_size, offset=offset)
-                batch_ids = batch_results.get("ids", [])
-                batch_docs = batch_results.get("documents", [])
-                batch_metadata = batch_results.get("metadatas", [])
-
-                logger.info(f"Processing batch {offset // batch_size + 1} ({len(batch_ids)} docs)...")
-
-                for doc_id, doc_text, metadata in zip(batch_ids, batch_docs, batch_metadata):
-                    processed += 1
-                    try:
+        pending_ids: list[str] = []
+        pending_metadatas: list[dict[str, Any]] = []
+        # (future, ids) for batch writes still in flight, oldest first
+        writes: deque[tuple[Future[None], list[str]]] = deque()
+
+        def fetch(page_ids: list[str]) -> dict[str, Any]:
+            """Read one page of documents and metadatas, without embeddings."""
+            return cast(
+                dict[str, Any], collection.get(ids=page_ids, include=["documents", "metadatas"])
+            )
+
+        def settle(future: Future[None], ids: list[str]) -> int:
+            """Wait for a batch write and return the number of docs it saved."""
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Failed to update batch of %d docs: %s", len(ids), e)
+                failed.extend((doc_id, str(e)) for doc_id in ids)
+                return 0
+            return len(ids)
+
+        def flush(pool: ThreadPoolExecutor) -> int:
+            """Submit pending metadata as one update call.
+
+            Keeps at most ``concurrency`` writes in flight and returns the number
+            of docs saved by writes that had to be awaited.
+            """
+            nonlocal pending_ids, pending_metadatas
+            if pending_ids:
+                future = pool.submit(collection.update, ids=pending_ids, metadatas=pending_metadatas)
+                writes.append((future, pending_ids))
+                pending_ids, pending_metadatas = [], []
+            saved = 0
+            while len(writes) > concurrency:
+                saved += settle(*writes.popleft())
+            return saved
+
+        # Pages are prefetched and batch writes run in the background, so
+        # inference on one page overlaps the network I/O for its neighbours.
+        with ExitStack() as stack:
+            procs = None
+            if workers > 1:
+                # Spawn, not fork: the thread pool below is already running
+                procs = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=(self.use_keywords,),
+                    )
+                )
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+            id_pages = (all_ids[i : i + page_size] for i in range(0, total_docs, page_size))
+            pages = deque(pool.submit(fetch, ids) for ids in islice(id_pages, concurrency))
+            page_number = 0
+            try:
+                while pages:
+                    batch_results = pages.popleft().result()
+                    next_ids = next(id_pages, None)
+                    if next_ids is not None:
+                        pages.append(pool.submit(fetch, next_ids))
+
+                    batch_ids = batch_results.get("ids", [])
+                    batch_docs = batch_results.get("documents", [])
+                    batch_metadata = batch_results.get("metadatas", [])
+
+                    page_number += 1
+                    logger.info("Processing page %d (%d docs)...", page_number, len(batch_ids))
+
+                    jobs = []
+                    digests = []
+                    for doc_id, doc_text, metadata in zip(
+                        batch_ids, batch_docs, batch_metadata, strict=False
+                    ):
+                        processed += 1
+                        metadata = metadata or {}
                         # Skip if already enriched
                         if skip_existing and metadata.get("category"):
                             skipped += 1
                             continue
-
-                        # Enrich document
-                        enriched_meta = self.enrich_document(
-                            doc_id,
-                            doc_text or "",
-                            filename=metadata.get("filename"),
-                        )
-
-                        # Update metadata in Chroma (unless dry run)
-                        if not dry_run:
-                            import json
-
-                            updated_metadata = {
-                                **metadata,
-                                "category": enriched_meta.category,
-                                "tech_stack": json.dumps(enriched_meta.tech_stack),  # Convert to JSON string
-                                "description": enriched_meta.description,
-                                "enrichment_confidence": enriched_meta.confidence_scores["overall"],
-                                "enriched": "true",
-                            }
-
-                            # Update document with new metadata
-                            collection.update(
-                                ids=[doc_id],
-                                documents=[doc_text],
-                                metadatas=[updated_metadata],
+                        doc_text = doc_text or ""
+                        digest = content_hash(doc_text)
+                        if (
+                            metadata.get("enriched") == "true"
+                            and metadata.get("content_hash") == digest
+                        ):
+                            skipped += 1
+                            continue
+                        jobs.append((doc_id, doc_text, metadata.get("filename")))
+                        digests.append(digest)
+
+                    # Enrich documents
+                    if procs is not None:
+                        results = procs.map(_enrich_worker, jobs, chunksize=16)
+                    else:
+                        results = (_enrich_or_error(self, *job) for job in jobs)
+
+                    for (doc_id, _, _), digest, enriched_meta in zip(
+                        jobs, digests, results, strict=True
+                    ):
+                        try:
+                            if isinstance(enriched_meta, Exception):
+                                raise enriched_meta
+
+                            if dry_run:
+                                enriched += 1
+                                continue
+
+                            # Queue metadata update for the next batch write. Chroma
+                            # merges updated keys into the stored metadata, so only
+                            # the enriched fields are sent.
+                            pending_ids.append(doc_id)
+                            pending_metadatas.append(
+                                {
+                                    "category": enriched_meta.category,
+                                    "tech_stack": tech_stack_json(tuple(enriched_meta.tech_stack)),
+                                    "description": enriched_meta.description,
+                                    "enrichment_confidence": enriched_meta.confidence_scores["overall"],
+                                    "enriched": "true",
+                                    "content_hash": digest,
+                                }
                             )
+                            if len(pending_ids) >= batch_size:
+                                enriched += flush(pool)
 
-                        enriched += 1
+                        except Exception as e:
+                            logger.error("Failed to enrich %s: %s", doc_id, e)
+                            failed.append((doc_id, str(e)))
 
-                    except Exception as e:
-                        logger.error(f"Failed to enrich {doc_id}: {e}")
-                        failed.append((doc_id, str(e)))
+                enriched += flush(pool)
 
-        except Exception as e:
-            logger.error(f"Error during collection enrichment: {e}")
+            except Exception as e:
+                logger.error("Error during collection enrichment: %s", e)
 
-        logger.info(f"✅ Enrichment complete: {enriched} docs enriched, {skipped} skipped, {len(failed)} failed")
+            finally:
+                for future in pages:
+                    future.cancel()
+                while writes:
+                    enriched += settle(*writes.popleft())
+
+        logger.info(
+            "✅ Enrichment complete: %d docs enriched, %d skipped, %d failed",
+            enriched,
+            skipped,
+            len(failed),
+        )
 
         return {
             "collection": collection_name,
@@ -339,8 +542,6 @@ class MetadataInferrer:
         Returns:
             Comparison report with matches and mismatches
         """
-        import json
-
         # Parse tech_stack if it's a JSON string
         known_techs = known_meta.get("tech_stack", [])
         if isinstance(known_techs, str):
@@ -360,3 +561,29 @@ class MetadataInferrer:
         }
 
         return report
+
+
+def _enrich_or_error(
+    inferrer: MetadataInferrer, doc_id: str, doc_text: str, filename: str | None
+) -> EnrichedMetadata | Exception:
+    """Enrich one document, returning the exception instead of raising it."""
+    try:
+        return inferrer.enrich_document(doc_id, doc_text, filename=filename)
+    except Exception as e:
+        return e
+
+
+# Per-process inferrer used by enrich_collection's worker processes
+_worker_inferrer: MetadataInferrer | None = None
+
+
+def _init_worker(use_keywords: bool) -> None:
+    """Create the worker process's inferrer (no RAG chain; Chroma stays in the parent)."""
+    global _worker_inferrer
+    _worker_inferrer = MetadataInferrer(use_keywords=use_keywords)
+
+
+def _enrich_worker(job: tuple[str, str, str | None]) -> EnrichedMetadata | Exception:
+    """Process pool entry point: enrich one (doc_id, doc_text, filename) job."""
+    assert _worker_inferrer is not None, "worker process was not initialized"
+    return _enrich_or_error(_worker_inferrer, *job)
@@ -1,9 +1,37 @@
 """Ingestion module for code extraction and chunking."""
 
-from chroma_ingestion.ingestion.agents import AgentIngester
-from chroma_ingestion.ingestion.base import CodeIngester
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chroma_ingestion.ingestion.agents import AgentIngester
+    from chroma_ingestion.ingestion.base import CodeIngester
+    from chroma_ingestion.ingestion.chunk_cache import ChunkCache
+
+_LAZY_ATTRS = {
+    "AgentIngester": "chroma_ingestion.ingestion.agents",
+    "ChunkCache": "chroma_ingestion.ingestion.chunk_cache",
+    "CodeIngester": "chroma_ingestion.ingestion.base",
+}
 
 __all__ = [
     "AgentIngester",
+    "ChunkCache",
     "CodeIngester",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
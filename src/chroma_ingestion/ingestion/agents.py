@@ -7,14 +7,28 @@ Extends CodeIngester with agent-aware features:
 - Rich metadata for semantic analysis
 """
 
-import glob
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, ClassVar
 
 import yaml
 
-from chroma_ingestion.ingestion.base import CodeIngester
+from chroma_ingestion.ingestion.base import (
+    _READ_AHEAD_PER_READER,
+    DEFAULT_MAX_BATCH_BYTES,
+    CodeIngester,
+    _BatchWriter,
+    _read_files,
+    _read_text,
+)
+from chroma_ingestion.ingestion.chunk_cache import ChunkCache
+
+try:
+    # libyaml's C loader parses frontmatter several times faster
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - exercised only without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -74,14 +88,42 @@ class AgentIngester(CodeIngester):
         "planning": ["plan", "requirement", "pm", "product", "task"],
     }
 
+    # Flattened forms of the keyword tables, built once per class by
+    # `_compile_keywords` so the per-file scans loop over flat tuples
+    _TECH_TERMS: ClassVar[tuple[str, ...]] = ()
+    _CATEGORY_TERMS: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile_keywords()
+
+    @classmethod
+    def _compile_keywords(cls) -> None:
+        """Flatten TECH_KEYWORDS and CATEGORY_KEYWORDS for this class.
+
+        Runs when the class is defined, so subclasses that override the
+        tables get their own flattened copies.
+        """
+        cls._TECH_TERMS = tuple(
+            dict.fromkeys(kw for keywords in cls.TECH_KEYWORDS.values() for kw in keywords)
+        )
+        cls._CATEGORY_TERMS = tuple(
+            (kw, category)
+            for category, keywords in cls.CATEGORY_KEYWORDS.items()
+            for kw in keywords
+        )
+
     def __init__(
         self,
-        target_folder: str | list[str],
+        target_folder: str | os.PathLike[str] | list[str | os.PathLike[str]],
         collection_name: str = "agents_analysis",
         chunk_size: int = 1500,  # Larger for agent files
         chunk_overlap: int = 300,
         exclusions: list[str] | None = None,
         batch_size: int = 50,
+        chunk_cache: ChunkCache | None = None,
+        upsert_workers: int = 4,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
     ):
         """Initialize agent ingester with multiple source folders.
 
@@ -91,12 +133,15 @@ class AgentIngester(CodeIngester):
             chunk_size: Tokens per chunk (larger for agents)
             chunk_overlap: Token overlap between chunks
             exclusions: List of filenames to exclude
+            chunk_cache: Cache of splitter output reused across runs (optional)
+            upsert_workers: Batches upserted concurrently (default: 4)
+            max_batch_bytes: Text size at which a batch is flushed early (default: 4 MiB)
         """
         # Normalize input: accept either a single target_folder or a list of folders
         if isinstance(target_folder, list | tuple):
-            self.source_folders = list(target_folder)
+            self.source_folders = [os.fspath(folder) for folder in target_folder]
         else:
-            self.source_folders = [target_folder]
+            self.source_folders = [os.fspath(target_folder)]
 
         self.exclusions = exclusions or []
 
@@ -108,6 +153,9 @@ class AgentIngester(CodeIngester):
             chunk_overlap=chunk_overlap,
             batch_size=batch_size,
             file_patterns=["**/*.md", "**/*.agent.md", "**/*.prompt.md"],
+            chunk_cache=chunk_cache,
+            upsert_workers=upsert_workers,
+            max_batch_bytes=max_batch_bytes,
         )
 
         # Keep `batch_size` attribute consistent with parent
@@ -120,10 +168,8 @@ class AgentIngester(CodeIngester):
         reads the file, extracts YAML frontmatter if present, and returns a
         dict with those keys (falling back to sensible defaults).
         """
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-        except Exception:
+        content = _read_text(file_path)
+        if isinstance(content, Exception):
             return {}
 
         frontmatter, _ = self.parse_frontmatter(content)
@@ -142,15 +188,12 @@ class AgentIngester(CodeIngester):
         Returns:
             Sorted list of unique absolute file paths
         """
-        all_files = []
+        all_files: set[str] = set()
         for folder in self.source_folders:
-            for pattern in self.file_patterns:
-                full_pattern = os.path.join(folder, pattern)
-                files = glob.glob(full_pattern, recursive=True)
-                all_files.extend(files)
+            all_files.update(self._find_files(folder))
 
-        # Filter exclusions and duplicates
-        filtered = [
+        # Filter exclusions
+        return sorted(
             f
             for f in all_files
             if (
@@ -158,9 +201,7 @@ class AgentIngester(CodeIngester):
                 and "__init__.py" not in f
                 and "README.md" not in os.path.basename(f)
             )
-        ]
-
-        return sorted(list(set(filtered)))
+        )
 
     def parse_frontmatter(self, content: str) -> tuple[dict[str, Any], str]:
         """Parse YAML frontmatter from agent file.
@@ -174,53 +215,54 @@ class AgentIngester(CodeIngester):
         frontmatter: dict[str, Any] = {}
         body = content
 
-        # Check for YAML frontmatter
+        # Check for YAML frontmatter; locate the closing delimiter rather than
+        # splitting, so the (possibly large) body is only copied once
         if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
+            end = content.find("---", 3)
+            if end != -1:
                 try:
-                    frontmatter = yaml.safe_load(parts[1]) or {}
-                    body = parts[2].strip()
+                    frontmatter = yaml.load(content[3:end], Loader=_SafeLoader) or {}
+                    body = content[end + 3 :].strip()
                 except yaml.YAMLError as e:
                     logger.warning("YAML parse error: %s", e)
 
         return frontmatter, body
 
-    def extract_tech_stack(self, content: str) -> list[str]:
+    def extract_tech_stack(self, content: str, content_lower: str | None = None) -> list[str]:
         """Extract tech stack keywords from content.
 
         Args:
             content: Full file content
+            content_lower: `content.lower()`, if the caller already has it
 
         Returns:
             List of identified tech keywords
         """
-        content_lower = content.lower()
-        found_tech = set()
-
-        for keywords in self.TECH_KEYWORDS.values():
-            for keyword in keywords:
-                if keyword in content_lower:
-                    found_tech.add(keyword)
-
-        return sorted(list(found_tech))
+        if content_lower is None:
+            content_lower = content.lower()
+        return sorted(kw for kw in self._TECH_TERMS if kw in content_lower)
 
-    def classify_category(self, filename: str, content: str) -> str:
+    def classify_category(
+        self, filename: str, content: str, content_lower: str | None = None
+    ) -> str:
         """Classify agent into a category.
 
         Args:
             filename: Agent filename
             content: Full file content
+            content_lower: `content.lower()`, if the caller already has it
 
         Returns:
             Classified category name
         """
-        text = (filename + " " + content).lower()
+        if content_lower is None:
+            content_lower = content.lower()
+        text = filename.lower() + " " + content_lower
 
-        category_scores = {}
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text)
-            category_scores[category] = score
+        category_scores = dict.fromkeys(self.CATEGORY_KEYWORDS, 0)
+        for kw, category in self._CATEGORY_TERMS:
+            if kw in text:
+                category_scores[category] += 1
 
         # Return highest scoring category
         return max(category_scores, key=lambda k: category_scores[k], default="general")
@@ -237,6 +279,8 @@ class AgentIngester(CodeIngester):
         """
         frontmatter, body = self.parse_frontmatter(content)
         filename = os.path.basename(file_path)
+        # Lowercase once for both keyword passes
+        content_lower = content.lower()
 
         # Parse agent name from filename or title
         agent_name = frontmatter.get(
@@ -251,10 +295,9 @@ class AgentIngester(CodeIngester):
             "description": frontmatter.get("description", "")[:500],  # Truncate
             "model": frontmatter.get("model", ""),
             "tools": ",".join(frontmatter.get("tools", [])) if frontmatter.get("tools") else "",
-            "category": self.classify_category(filename, content),
-            "tech_stack": ",".join(
-                self.extract_tech_stack(content)
-            ),  # Chroma requires string, not list
+            "category": self.classify_category(filename, content, content_lower),
+            # Chroma requires string, not list
+            "tech_stack": ",".join(self.extract_tech_stack(content, content_lower)),
             "folder": os.path.dirname(file_path),
             "file_type": os.path.splitext(file_path)[1],
             "source_collection": self._get_source_collection(file_path),
@@ -304,67 +347,66 @@ class AgentIngester(CodeIngester):
                 f"📂 Found {len(agent_files)} agent files across {len(self.source_folders)} folders"
             )
 
-        documents: list[str] = []
-        ids: list[str] = []
-        metadatas: list[dict[str, Any]] = []
+        logger.info(
+            "Ingesting into collection '%s' in batches of %d...", self.collection_name, batch_size
+        )
+
         files_processed = 0
         files_failed = 0
+        total_chunks = 0
+        writer = _BatchWriter(
+            self._upsert_batch,
+            batch_size=batch_size,
+            max_batch_bytes=self.max_batch_bytes,
+            workers=self.upsert_workers,
+        )
 
-        for file_path in agent_files:
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                # Extract enhanced metadata
-                base_metadata, body = self.extract_metadata(file_path, content)
-
-                # Create semantic chunks
-                chunks = self.splitter.create_documents([content])
-
-                if chunks:
-                    files_processed += 1
-                    for i, chunk in enumerate(chunks):
-                        # Use agent name + normalized path + chunk index to ensure
-                        # uniqueness across files with same agent_name.
-                        normalized_path = os.path.normpath(file_path)
-                        doc_id = (
-                            f"{base_metadata.get('agent_name','unknown')}:{normalized_path}:{i}"
-                        )
-
-                        # Add chunk-specific metadata
-                        chunk_metadata = {
-                            **base_metadata,
-                            "chunk_index": i,
-                            "total_chunks": len(chunks),
-                        }
-
-                        documents.append(chunk.page_content)
-                        ids.append(doc_id)
-                        metadatas.append(chunk_metadata)
-
-            except Exception as e:
-                files_failed += 1
-                logger.warning("Could not process %s: %s", os.path.basename(file_path), e)
-
-        # Batch upsert
-        if documents:
-            logger.info(
-                "Ingesting %d chunks into collection '%s'...", len(documents), self.collection_name
-            )
-
-            for i in range(0, len(documents), batch_size):
-                batch_docs = documents[i : i + batch_size]
-                batch_ids = ids[i : i + batch_size]
-                batch_metas = metadatas[i : i + batch_size]
-
-                self.collection.upsert(documents=batch_docs, ids=batch_ids, metadatas=batch_metas)
-                logger.info("Batch %d complete (%d chunks)", i // batch_size + 1, len(batch_docs))
-
-            logger.info("Done! Ingested %d chunks from %d agents", len(documents), files_processed)
+        # Reads run on a thread pool, overlapping disk I/O with the parsing and
+        # splitting below; results come back in file order, with only a small
+        # window of files read ahead. Chunks are streamed to the writer, which
+        # upserts each batch as soon as it fills.
+        readers = min(32, len(agent_files))
+        with writer, ThreadPoolExecutor(max_workers=readers) as pool:
+            for file_path, content in _read_files(
+                pool, agent_files, _READ_AHEAD_PER_READER * readers
+            ):
+                try:
+                    if isinstance(content, Exception):
+                        raise content
+
+                    # Extract enhanced metadata
+                    base_metadata, body = self.extract_metadata(file_path, content)
+
+                    # Create semantic chunks
+                    chunks = self.split_content(content)
+                except Exception as e:
+                    files_failed += 1
+                    logger.warning("Could not process %s: %s", os.path.basename(file_path), e)
+                    continue
+
+                if not chunks:
+                    continue
+
+                files_processed += 1
+                total_chunks += len(chunks)
+                # Use agent name + normalized path + chunk index to ensure
+                # uniqueness across files with same agent_name.
+                agent_name = base_metadata.get("agent_name", "unknown")
+                id_prefix = f"{agent_name}:{os.path.normpath(file_path)}:"
+                base_metadata["total_chunks"] = len(chunks)
+                for i, chunk in enumerate(chunks):
+                    # Add chunk-specific metadata (dict.copy is cheaper
+                    # than rebuilding the dict with ** unpacking)
+                    chunk_metadata = base_metadata.copy()
+                    chunk_metadata["chunk_index"] = i
+                    writer.add(chunk, id_prefix + str(i), chunk_metadata)
+
+        if total_chunks:
+            logger.info("Done! Ingested %d chunks from %d agents", total_chunks, files_processed)
             if files_failed > 0:
                 logger.warning("%d files failed to process", files_failed)
 
-            return files_processed, len(documents)
+            return files_processed, total_chunks
 
         logger.info("No documents created.")
         return files_processed, 0
@@ -376,3 +418,6 @@ class AgentIngester(CodeIngester):
         either `CodeIngester` or `AgentIngester` instances.
         """
         return self.ingest_agents(batch_size=batch_size or self.batch_size, verbose=True)
+
+
+AgentIngester._compile_keywords()
@@ -10,21 +10,270 @@ Supports:
 - Agent definitions and prompts
 """
 
+import fnmatch
 import glob
 import logging
 import os
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any
 
 from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
 
 from chroma_ingestion.clients.chroma import get_chroma_client
 from chroma_ingestion.config import get_chroma_config
 
+if TYPE_CHECKING:
+    from chroma_ingestion.ingestion.chunk_cache import ChunkCache
+
 # Module logger
 logger = logging.getLogger(__name__)
 
 
+# Default cap on the document text sent in one upsert request
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+# Files read ahead of the splitter, per reader thread
+_READ_AHEAD_PER_READER = 2
+
+# Characters that make a file pattern a wildcard rather than a literal
+_GLOB_CHARS = frozenset("*?[")
+
+# Directories never searched for files to ingest
+PRUNE_DIRS = frozenset({".git", ".venv", "node_modules", "__pycache__"})
+
+
+def _walk(folder: str) -> Iterator[os.DirEntry[str]]:
+    """Yield the files under a folder with a single `os.scandir` pass per directory.
+
+    Hidden files and directories are skipped, as glob's `*` and `**` skip them,
+    and directories in `PRUNE_DIRS` are never descended into.
+
+    Args:
+        folder: Root folder to walk
+
+    Yields:
+        Directory entries for regular files
+    """
+    pending = [folder]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug("Skipping unreadable directory: %s", e)
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                if entry.name not in PRUNE_DIRS:
+                    pending.append(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+# Code-aware splitter per file extension; other files are split as Markdown
+SPLITTER_LANGUAGES: dict[str, Language] = {
+    ".py": Language.PYTHON,
+    ".js": Language.JS,
+    ".ts": Language.TS,
+    ".go": Language.GO,
+    ".rs": Language.RUST,
+    ".java": Language.JAVA,
+}
+
+
+@lru_cache(maxsize=16)
+def _get_splitter(
+    language: Language, chunk_size: int, chunk_overlap: int
+) -> RecursiveCharacterTextSplitter:
+    """Return a shared splitter for a language and chunk settings.
+
+    Splitters hold no per-call state, so ingesters (and repeated runs in one
+    process) with the same settings reuse one instance and its separator list.
+    """
+    return RecursiveCharacterTextSplitter.from_language(
+        language=language,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    )
+
+
+def _read_text(file_path: str) -> str | Exception:
+    """Read a UTF-8 file, returning the exception instead of raising it.
+
+    Used from reader threads (see `_read_files`), where a raised exception
+    would end the iteration over the remaining files.
+
+    The file is read with `os.read` on a raw descriptor, sized from `fstat`,
+    which skips the buffered text I/O stack. Decoding stays strict, and
+    CRLF/CR line endings are translated to match a text-mode read.
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return ""
+            # Ask for one byte more than fstat reports so a file that grew
+            # (or a short read) is picked up by the loop instead of truncated
+            parts = []
+            want = size + 1
+            while block := os.read(fd, want):
+                parts.append(block)
+                want = 65536
+        finally:
+            os.close(fd)
+        content = b"".join(parts).decode("utf-8")
+    except Exception as e:
+        return e
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read_files(
+    pool: ThreadPoolExecutor, paths: list[str], window: int
+) -> Iterator[tuple[str, str | Exception]]:
+    """Yield ``(path, _read_text(path))`` in path order, reading ahead on `pool`.
+
+    Unlike `pool.map`, which submits every read up front, at most `window`
+    reads are outstanding ahead of the consumer. When splitting and upserting
+    fall behind the disk, memory is bounded by the window, not the corpus.
+
+    Args:
+        pool: Executor running the reads
+        paths: Files to read, in the order results are wanted
+        window: Maximum number of reads submitted but not yet consumed
+    """
+    remaining = iter(paths)
+    pending: deque[tuple[str, Future[str | Exception]]] = deque(
+        (path, pool.submit(_read_text, path)) for path in islice(remaining, window)
+    )
+    while pending:
+        path, future = pending.popleft()
+        next_path = next(remaining, None)
+        if next_path is not None:
+            pending.append((next_path, pool.submit(_read_text, next_path)))
+        yield path, future.result()
+
+
+_Batch = tuple[list[str], list[str], list[dict[str, Any]]]
+
+
+class _BatchWriter:
+    """Upsert batches on background threads while the caller keeps producing them.
+
+    Chunks passed to `add` are collected into batches of up to `batch_size`
+    chunks or `max_batch_bytes` of UTF-8 text, so only the current batch and
+    the queued ones are held in memory. Batches are handed over through a
+    bounded queue, so the producer blocks once `max_pending` batches are
+    waiting. With several workers, batches are written
+    concurrently and may complete out of order. After the first upsert error the
+    writers discard the rest, and the error is re-raised by the next `submit` or
+    on leaving the ``with`` block.
+    """
+
+    def __init__(
+        self,
+        upsert: Callable[[list[str], list[str], list[dict[str, Any]]], Any],
+        batch_size: int = 100,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        workers: int = 1,
+        max_pending: int = 4,
+    ):
+        """Start the writer threads.
+
+        Args:
+            upsert: Called with (documents, ids, metadatas) for each batch
+            batch_size: Maximum number of chunks per batch
+            max_batch_bytes: Text size at which a batch is flushed early
+            workers: Number of batches written concurrently
+            max_pending: Maximum number of batches waiting to be written
+        """
+        self._upsert = upsert
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self._documents: list[str] = []
+        self._ids: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        self._batch_bytes = 0
+        self._queue: queue.Queue[_Batch | None] = queue.Queue(maxsize=max(max_pending, workers))
+        self._error: BaseException | None = None
+        self._lock = threading.Lock()
+        self.batches_written = 0
+        self._threads = [
+            threading.Thread(target=self._run, name=f"chroma-upsert-{n}", daemon=True)
+            for n in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self) -> None:
+        while (batch := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                self._upsert(*batch)
+            except BaseException as e:
+                self._error = e
+                continue
+            with self._lock:
+                self.batches_written += 1
+                batch_number = self.batches_written
+            logger.info("  ✓ Batch %d complete (%d chunks)", batch_number, len(batch[0]))
+
+    def add(self, document: str, doc_id: str, metadata: dict[str, Any]) -> None:
+        """Add one chunk to the current batch, queueing the batch once it is full.
+
+        Raises:
+            Exception: The error raised by an earlier batch
+        """
+        self._documents.append(document)
+        self._ids.append(doc_id)
+        self._metadatas.append(metadata)
+        # isascii() is O(1), so only non-ASCII chunks pay for an encode
+        self._batch_bytes += len(document) if document.isascii() else len(document.encode())
+        if len(self._documents) >= self.batch_size or self._batch_bytes >= self.max_batch_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """Queue the current partial batch, blocking while the queue is full.
+
+        Raises:
+            Exception: The error raised by an earlier batch
+        """
+        if not self._documents:
+            return
+        if self._error is not None:
+            raise self._error
+        self._queue.put((self._documents, self._ids, self._metadatas))
+        self._documents, self._ids, self._metadatas = [], [], []
+        self._batch_bytes = 0
+
+    def __enter__(self) -> "_BatchWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc is None:
+                self.flush()
+        finally:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+        if exc is None and self._error is not None:
+            raise self._error
+
+
 class CodeIngester:
     """Intelligent code/document ingestion for Chroma with semantic splitting.
 
@@ -37,12 +286,15 @@ class CodeIngester:
 
     def __init__(
         self,
-        target_folder: str,
+        target_folder: str | os.PathLike[str],
         collection_name: str,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         batch_size: int = 100,
         file_patterns: list[str] | None = None,
+        chunk_cache: "ChunkCache | None" = None,
+        upsert_workers: int = 4,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
     ):
         """Initialize the code ingester.
 
@@ -52,8 +304,14 @@ class CodeIngester:
             chunk_size: Approximate tokens per chunk (default: 1000)
             chunk_overlap: Token overlap between chunks (default: 200)
             file_patterns: File patterns to ingest (default: *.py, *.md, *.agent.md, *.prompt.md)
+            chunk_cache: Cache of splitter output reused across runs (optional)
+            upsert_workers: Batches upserted concurrently (default: 4); lower it if
+                the server rejects or throttles parallel writes
+            max_batch_bytes: Flush a batch early once its UTF-8 text reaches this
+                size (default: 4 MiB), keeping requests of large chunks under
+                server payload limits
         """
-        self.target_folder = target_folder
+        self.target_folder = os.fspath(target_folder)
         self.collection_name = collection_name
         self.chunk_size = chunk_size
         # Ensure overlap is smaller than chunk_size to avoid splitter errors.
@@ -70,17 +328,17 @@ class CodeIngester:
             "**/*.agent.md",
             "**/*.prompt.md",
         ]
+        self.chunk_cache = chunk_cache
+        self.upsert_workers = upsert_workers
+        self.max_batch_bytes = max_batch_bytes
 
         # Initialize Chroma client and collection
         self.client = get_chroma_client()
         self.collection = self.client.get_or_create_collection(name=collection_name)
 
-        # Configure splitter - use markdown for all files (more general)
-        self.splitter = RecursiveCharacterTextSplitter.from_language(
-            language=Language.MARKDOWN,
-            chunk_size=chunk_size,
-            chunk_overlap=self.chunk_overlap,
-        )
+        # Markdown splitter for prose and unknown file types; source files in a
+        # language from SPLITTER_LANGUAGES get a code-aware splitter instead
+        self.splitter = _get_splitter(Language.MARKDOWN, chunk_size, self.chunk_overlap)
 
     def prepare_metadata(self, file_path: str, chunk_index: int) -> dict[str, Any]:
         """Prepare metadata dict for a given file chunk.
@@ -88,27 +346,104 @@ class CodeIngester:
         This helper centralizes metadata construction so unit tests and other
         ingesters can reuse consistent keys.
         """
+        # One split yields both folder and filename (basename and dirname
+        # would each split the path again)
+        folder, filename = os.path.split(file_path)
         return {
             "source": file_path,
-            "filename": os.path.basename(file_path),
+            "filename": filename,
             "chunk_index": chunk_index,
-            "folder": os.path.dirname(file_path),
-            "file_type": os.path.splitext(file_path)[1],
+            "folder": folder,
+            "file_type": os.path.splitext(filename)[1],
         }
 
+    def split_content(self, content: str, language: Language = Language.MARKDOWN) -> list[str]:
+        """Split file content into chunk texts, reusing cached output if available.
+
+        Args:
+            content: Full file content
+            language: Splitter language (default: Markdown)
+
+        Returns:
+            Chunk texts
+        """
+        # Content that fits in one chunk always comes back from the splitter as
+        # a single whitespace-stripped chunk (or none), so skip the splitter and
+        # the cache for it; most files in a typical tree are this small.
+        if len(content) <= self.chunk_size:
+            stripped = content.strip()
+            return [stripped] if stripped else []
+
+        if self.chunk_cache is not None:
+            cached = self.chunk_cache.get(
+                content, self.chunk_size, self.chunk_overlap, language=language.value
+            )
+            if cached is not None:
+                return cached
+
+        if language is Language.MARKDOWN:
+            splitter = self.splitter
+        else:
+            splitter = _get_splitter(language, self.chunk_size, self.chunk_overlap)
+        chunks = splitter.split_text(content)
+        if self.chunk_cache is not None:
+            self.chunk_cache.put(
+                content, self.chunk_size, self.chunk_overlap, chunks, language=language.value
+            )
+        return chunks
+
+    def _find_files(self, folder: str) -> set[str]:
+        """Find files under one folder matching `file_patterns`.
+
+        Patterns of the form ``**/<name>`` (the defaults) are matched during a
+        single `_walk` of the folder, which skips `PRUNE_DIRS`, instead of one
+        glob traversal per pattern. When every name is ``*<suffix>``, each file
+        is matched with one `str.endswith` call instead of one `fnmatch` per
+        pattern. Any other pattern falls back to `glob`.
+
+        Args:
+            folder: Root folder to search
+
+        Returns:
+            Set of matching file paths
+        """
+        name_patterns = [p[3:] for p in self.file_patterns if p.startswith("**/")]
+        walkable = len(name_patterns) == len(self.file_patterns)
+        if walkable and not any("/" in p for p in name_patterns):
+            suffixes = tuple(
+                os.path.normcase(p[1:])
+                for p in name_patterns
+                if p.startswith("*") and _GLOB_CHARS.isdisjoint(p[1:])
+            )
+            if len(suffixes) == len(name_patterns):
+                # normcase mirrors fnmatch's case handling on each platform
+                return {
+                    entry.path
+                    for entry in _walk(folder)
+                    if os.path.normcase(entry.name).endswith(suffixes)
+                }
+            return {
+                entry.path
+                for entry in _walk(folder)
+                if any(fnmatch.fnmatch(entry.name, p) for p in name_patterns)
+            }
+
+        # A set drops files matched by more than one pattern as they are found;
+        # iglob streams matches into it without building a list per pattern
+        return set(
+            chain.from_iterable(
+                glob.iglob(os.path.join(folder, pattern), recursive=True)
+                for pattern in self.file_patterns
+            )
+        )
+
     def discover_files(self) -> list[str]:
         """Discover files in target folder recursively.
 
         Returns:
             List of absolute paths to matching files
         """
-        all_files = []
-        for pattern in self.file_patterns:
-            full_pattern = os.path.join(self.target_folder, pattern)
-            files = glob.glob(full_pattern, recursive=True)
-            all_files.extend(files)
-
-        return sorted(list(set(all_files)))  # Remove duplicates and sort
+        return sorted(self._find_files(self.target_folder))
 
     def ingest_files(self, batch_size: int | None = None) -> tuple[int, int]:
         """Ingest files from target folder into Chroma.
@@ -117,7 +452,8 @@ class CodeIngester:
         Batch upserts to avoid memory limits.
 
         Args:
-            batch_size: Number of chunks to upsert per batch
+            batch_size: Maximum number of chunks to upsert per batch; a batch is
+                flushed earlier once it reaches `max_batch_bytes`
 
         Returns:
             Tuple of (total_files_processed, total_chunks_ingested)
@@ -151,70 +487,67 @@ class CodeIngester:
         logger.info("📂 Scanning: %s", self.target_folder)
         logger.info("📦 Found %d file(s)", len(py_files))
 
-        documents: list[str] = []
-        ids: list[str] = []
-        metadatas: list[dict[str, Any]] = []
-        files_processed = 0
+        logger.info("🚀 Ingesting into Chroma Cloud in batches of %d...", batch_size)
 
-        # Process each file
-        for file_path in py_files:
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                # Create semantic chunks
-                chunks = self.splitter.create_documents([content])
-
-                if chunks:
-                    files_processed += 1
-                    for i, chunk in enumerate(chunks):
-                        # Unique ID: use full file path + chunk index to avoid
-                        # collisions when multiple files share the same basename
-                        # (e.g., many README.md files). Use normalized path for
-                        # readability.
-                        normalized_path = os.path.normpath(file_path)
-                        doc_id = f"{normalized_path}:{i}"
-
-                        documents.append(chunk.page_content)
-                        ids.append(doc_id)
-                        metadatas.append(
-                            {
-                                "source": file_path,
-                                "filename": os.path.basename(file_path),
-                                "chunk_index": i,
-                                "folder": os.path.dirname(file_path),
-                                "file_type": os.path.splitext(file_path)[1],
-                            }
-                        )
-
-            except Exception as e:
-                logger.warning("⚠️  Could not read %s: %s", file_path, e)
-
-        # Batch upsert to Chroma Cloud
-        if documents:
-            logger.info("🚀 Ingesting %d chunks into Chroma Cloud...", len(documents))
-
-            for i in range(0, len(documents), batch_size):
-                batch_docs = documents[i : i + batch_size]
-                batch_ids = ids[i : i + batch_size]
-                batch_metas = metadatas[i : i + batch_size]
-
-                self.collection.upsert(
-                    documents=batch_docs,
-                    ids=batch_ids,
-                    metadatas=batch_metas,
-                )
-                logger.info(
-                    "  ✓ Batch %d complete (%d chunks)", i // batch_size + 1, len(batch_docs)
-                )
+        files_processed = 0
+        total_chunks = 0
+        writer = _BatchWriter(
+            self._upsert_batch,
+            batch_size=batch_size,
+            max_batch_bytes=self.max_batch_bytes,
+            workers=self.upsert_workers,
+        )
 
+        # Process each file. Reads run on a thread pool so disk I/O overlaps the
+        # splitting below; results come back in file order, keeping chunk IDs
+        # deterministic, and only a small window of files is read ahead.
+        # Splitting stays on this thread, and each full batch goes to the
+        # writer threads so upserts overlap the remaining splitting.
+        readers = min(32, len(py_files))
+        with writer, ThreadPoolExecutor(max_workers=readers) as pool:
+            for file_path, content in _read_files(pool, py_files, _READ_AHEAD_PER_READER * readers):
+                # _read_text hands back read and decode errors as values, so the
+                # loop needs no exception handling of its own
+                if isinstance(content, Exception):
+                    logger.warning("⚠️  Could not read %s: %s", file_path, content)
+                    continue
+
+                # Path-derived fields are computed once per file; each chunk
+                # gets a shallow copy with its own index
+                base_metadata = self.prepare_metadata(file_path, 0)
+
+                # Create semantic chunks with a splitter suited to the file type
+                language = SPLITTER_LANGUAGES.get(base_metadata["file_type"], Language.MARKDOWN)
+                chunks = self.split_content(content, language)
+
+                if not chunks:
+                    continue
+
+                files_processed += 1
+                total_chunks += len(chunks)
+                # Unique ID: use full file path + chunk index to avoid
+                # collisions when multiple files share the same basename
+                # (e.g., many README.md files). Use normalized path for
+                # readability. The path part of the ID is built once per file.
+                id_prefix = os.path.normpath(file_path) + ":"
+                for i, chunk in enumerate(chunks):
+                    chunk_metadata = base_metadata.copy()
+                    chunk_metadata["chunk_index"] = i
+                    writer.add(chunk, id_prefix + str(i), chunk_metadata)
+
+        if total_chunks:
             logger.info(
-                "✅ Done! Ingested %d chunks from %d file(s)", len(documents), files_processed
+                "✅ Done! Ingested %d chunks from %d file(s)", total_chunks, files_processed
             )
-            return files_processed, len(documents)
         else:
             logger.info("❌ No documents created.")
-            return files_processed, 0
+        return files_processed, total_chunks
+
+    def _upsert_batch(
+        self, documents: list[str], ids: list[str], metadatas: list[dict[str, Any]]
+    ) -> None:
+        """Upsert one batch of chunks; the `_BatchWriter` callback."""
+        self.collection.upsert(documents=documents, ids=ids, metadatas=metadatas)
 
     def get_collection_stats(self) -> dict[str, Any]:
         """Get statistics about the ingested collection.
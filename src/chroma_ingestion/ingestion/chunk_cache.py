@@ -0,0 +1,116 @@
+"""On-disk cache of text splitter output.
+
+Splitting is the main CPU cost of an ingestion run, and most files are
+unchanged between runs. `ChunkCache` stores the chunk texts for each file
+content under a key made of the content hash and the splitter settings, so a
+re-run only splits files that actually changed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def default_chunk_cache_dir() -> Path:
+    """Return the default chunk cache directory.
+
+    The directory is ``$XDG_CACHE_HOME/chroma-ingest/chunks`` (``~/.cache`` by
+    default). Entries are never pruned: every distinct file version (and
+    splitter setting) adds one small JSON file, so the directory grows with
+    edits over time. Delete it to reclaim the space; ``ingest --no-cache``
+    skips the cache entirely.
+
+    Returns:
+        Path of the cache directory (it may not exist yet)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base, "chroma-ingest", "chunks")
+
+
+class ChunkCache:
+    """Chunk texts keyed by content hash and splitter settings, one JSON file each.
+
+    Any I/O error degrades to a cache miss.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: `default_chunk_cache_dir()`)
+        """
+        self.directory = Path(directory) if directory is not None else default_chunk_cache_dir()
+
+    def _path(self, content: str, chunk_size: int, chunk_overlap: int, language: str) -> Path:
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / f"{digest}_{language}_{chunk_size}_{chunk_overlap}.json"
+
+    def get(
+        self, content: str, chunk_size: int, chunk_overlap: int, language: str = "markdown"
+    ) -> list[str] | None:
+        """Return the cached chunks for content, or None on a miss.
+
+        Args:
+            content: Full file content
+            chunk_size: Splitter chunk size
+            chunk_overlap: Splitter chunk overlap
+            language: Splitter language (default: "markdown")
+
+        Returns:
+            Chunk texts, or None
+        """
+        path = self._path(content, chunk_size, chunk_overlap, language)
+        try:
+            # json.loads decodes UTF-8 bytes itself, so skip the text I/O layer
+            with open(path, "rb") as f:
+                chunks = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable chunk cache entry %s: %s", path, e)
+            return None
+        if not isinstance(chunks, list) or not all(isinstance(c, str) for c in chunks):
+            logger.debug("Ignoring malformed chunk cache entry %s", path)
+            return None
+        return chunks
+
+    def put(
+        self,
+        content: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        chunks: list[str],
+        language: str = "markdown",
+    ) -> None:
+        """Store the chunks produced for content.
+
+        Args:
+            content: Full file content
+            chunk_size: Splitter chunk size
+            chunk_overlap: Splitter chunk overlap
+            chunks: Chunk texts produced by the splitter
+            language: Splitter language (default: "markdown")
+        """
+        path = self._path(content, chunk_size, chunk_overlap, language)
+        tmp: str | None = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(chunks, f, separators=(",", ":"))
+            os.replace(tmp, path)
+            tmp = None
+        except OSError as e:
+            logger.debug("Could not write chunk cache entry %s: %s", path, e)
+        finally:
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
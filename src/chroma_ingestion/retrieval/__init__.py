@@ -5,9 +5,37 @@ tests and the CLI can import `chroma_ingestion.retrieval.CodeRetriever` while
 we repair the original `retriever.py` in-place.
 """
 
-from chroma_ingestion.retrieval.retriever_clean import CodeRetriever, MultiCollectionSearcher
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chroma_ingestion.retrieval.cache import QueryCache
+    from chroma_ingestion.retrieval.retriever_clean import CodeRetriever, MultiCollectionSearcher
+
+_LAZY_ATTRS = {
+    "CodeRetriever": "chroma_ingestion.retrieval.retriever_clean",
+    "MultiCollectionSearcher": "chroma_ingestion.retrieval.retriever_clean",
+    "QueryCache": "chroma_ingestion.retrieval.cache",
+}
 
 __all__ = [
     "CodeRetriever",
     "MultiCollectionSearcher",
+    "QueryCache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,175 @@
+"""On-disk cache of recent query results.
+
+CLI invocations are short-lived, so repeating a `search` or `rag-query` would
+otherwise load the embedding model, re-embed the query and re-run the vector
+search every time. `QueryCache` keeps the most recent results per (collection,
+query, n_results) in a small JSON file with a TTL, so repeats within a few
+minutes skip all of that.
+
+Keys use the query with whitespace collapsed. The query vector is computed by
+the collection's embedding function inside the client, so matching
+near-duplicate queries would mean loading the model and embedding on every
+lookup, hits included, which is most of the cost a hit is meant to avoid.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from chroma_ingestion.config import get_chroma_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+def default_cache_path() -> Path:
+    """Return the cache file for the configured Chroma server.
+
+    The file lives under ``$XDG_CACHE_HOME/chroma-ingest`` (``~/.cache`` by
+    default) and is named after the server so results from different servers
+    never mix.
+
+    Returns:
+        Path of the cache file (it may not exist yet)
+    """
+    config = get_chroma_config()
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base, "chroma-ingest", f"queries-{config['host']}-{config['port']}.json")
+
+
+class QueryCache:
+    """LRU cache of query results with a time-to-live, persisted as JSON.
+
+    Entries are ordered least- to most-recently used; the oldest are evicted
+    once `max_entries` is exceeded. Only writes (`put`, `invalidate`) save the
+    file. Any I/O error degrades to a cache miss.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Cache file location (default: `default_cache_path()`)
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum number of cached queries
+        """
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    @staticmethod
+    def _key(collection_name: str, query_text: str, n_results: int) -> str:
+        return json.dumps([collection_name, " ".join(query_text.split()), n_results])
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.debug("Ignoring unreadable query cache %s: %s", self.path, e)
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        tmp: str | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+            tmp = None
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError/ValueError: results that are not JSON-serializable
+            logger.debug("Could not write query cache %s: %s", self.path, e)
+        finally:
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+
+    def get(
+        self, collection_name: str, query_text: str, n_results: int
+    ) -> list[dict[str, Any]] | None:
+        """Return cached results, or None on a miss or expired entry.
+
+        Args:
+            collection_name: Collection the query ran against
+            query_text: Query text
+            n_results: Requested number of results
+
+        Returns:
+            A copy of the cached results, or None
+        """
+        entries = self._load()
+        key = self._key(collection_name, query_text, n_results)
+        entry = entries.pop(key, None)
+        if entry is None:
+            return None
+        if time.time() - entry["time"] > self.ttl:
+            return None
+
+        # Re-insert to mark as most recently used. Reads never rewrite the
+        # file: the new order (and any dropped expired entry) is persisted by
+        # the next `put` or `invalidate`
+        entries[key] = entry
+        results: list[dict[str, Any]] = copy.deepcopy(entry["results"])
+        return results
+
+    def put(
+        self,
+        collection_name: str,
+        query_text: str,
+        n_results: int,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Store results for a query, evicting the least recently used entries.
+
+        Args:
+            collection_name: Collection the query ran against
+            query_text: Query text
+            n_results: Requested number of results
+            results: Results to cache (must be JSON-serializable)
+        """
+        entries = self._load()
+        key = self._key(collection_name, query_text, n_results)
+        entries.pop(key, None)
+        entries[key] = {
+            "collection": collection_name,
+            "time": time.time(),
+            "results": copy.deepcopy(results),
+        }
+        while len(entries) > self.max_entries:
+            del entries[next(iter(entries))]
+        self._save()
+
+    def invalidate(self, collection_name: str) -> None:
+        """Drop every cached query for a collection after it changes.
+
+        Args:
+            collection_name: Collection whose entries should be removed
+        """
+        entries = self._load()
+        stale = [k for k, v in entries.items() if v.get("collection") == collection_name]
+        if stale:
+            for key in stale:
+                del entries[key]
+            self._save()
@@ -7,11 +7,15 @@ Uses Chroma as the vector store and LangChain for orchestration.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from itertools import takewhile
+from typing import TYPE_CHECKING, Any
 
 from chroma_ingestion.clients.chroma import get_chroma_client
 from chroma_ingestion.retrieval.retriever import CodeRetriever
 
+if TYPE_CHECKING:
+    from chroma_ingestion.retrieval.cache import QueryCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +31,7 @@ class RAGChain:
         collection_name: str = "agents_discovery",
         n_results: int = 5,
         distance_threshold: float = 0.5,
+        cache: QueryCache | None = None,
     ):
         """Initialize RAG chain.
 
@@ -34,11 +39,12 @@ class RAGChain:
             collection_name: Chroma collection to query
             n_results: Number of results to retrieve (default: 5)
             distance_threshold: Maximum distance for inclusion (lower = more similar)
+            cache: Optional query result cache consulted before Chroma
         """
         self.collection_name = collection_name
         self.n_results = n_results
         self.distance_threshold = distance_threshold
-        self.retriever = CodeRetriever(collection_name)
+        self.retriever = CodeRetriever(collection_name, cache=cache)
 
     def retrieve(
         self,
@@ -68,8 +74,9 @@ class RAGChain:
             logger.warning("⚠️  No results found for query: %s", query)
             return []
 
-        # Filter by threshold
-        filtered = [r for r in results if r.get("distance", 1.0) <= thresh]
+        # Filter by threshold. Results arrive nearest first, so the matches are
+        # a prefix of the list and the scan stops at the first one past it.
+        filtered = list(takewhile(lambda r: r.get("distance", 1.0) <= thresh, results))
 
         if not filtered:
             logger.warning(
@@ -94,23 +101,24 @@ class RAGChain:
         if not results:
             return "No agents found matching your query."
 
-        output = f"Found {len(results)} matching agents:\n\n"
+        parts = [f"Found {len(results)} matching agents:\n\n"]
 
         for i, result in enumerate(results, 1):
             distance = result.get("distance", 0)
             confidence = max(0, 1.0 - distance)
-            filename = result.get("metadata", {}).get("filename", "Unknown")
-            source = result.get("metadata", {}).get("source", "Unknown")
-            agent_name = (
-                result.get("metadata", {}).get("agent_name") or filename
+            metadata = result.get("metadata") or {}
+            source = metadata.get("source", "Unknown")
+            agent_name = metadata.get("agent_name") or metadata.get("filename", "Unknown")
+            preview = result.get("document", "")[:100].strip()
+
+            parts.append(
+                f"{i}. {agent_name}\n"
+                f"   📍 Source: {source}\n"
+                f"   ⭐ Confidence: {confidence * 100:.1f}%\n"
+                f"   Preview: {preview}...\n\n"
             )
 
-            output += f"{i}. {agent_name}\n"
-            output += f"   📍 Source: {source}\n"
-            output += f"   ⭐ Confidence: {confidence * 100:.1f}%\n"
-            output += f"   Preview: {result.get('document', '')[:100].strip()}...\n\n"
-
-        return output
+        return "".join(parts)
 
     def query(
         self,
@@ -139,15 +147,19 @@ class RAGChain:
         return {
             "query": query,
             "results_count": len(results),
-            "results": results if include_raw else [
-                {
-                    "agent_name": r.get("metadata", {}).get("agent_name", "Unknown"),
-                    "source": r.get("metadata", {}).get("source", "Unknown"),
-                    "confidence": max(0, 1.0 - r.get("distance", 1.0)),
-                    "distance": r.get("distance", 1.0),
-                }
-                for r in results
-            ],
+            "results": results if include_raw else [self._summarize(r) for r in results],
+        }
+
+    @staticmethod
+    def _summarize(result: dict[str, Any]) -> dict[str, Any]:
+        """Reduce a raw result to the fields shown in structured output."""
+        metadata = result.get("metadata") or {}
+        distance = result.get("distance", 1.0)
+        return {
+            "agent_name": metadata.get("agent_name", "Unknown"),
+            "source": metadata.get("source", "Unknown"),
+            "confidence": max(0, 1.0 - distance),
+            "distance": distance,
         }
 
     def get_collection_stats(self) -> dict[str, Any]:
@@ -11,14 +11,60 @@ and `get_collection_info()` return shapes.
 
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import Any
+import math
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, takewhile
+from typing import TYPE_CHECKING, Any
 
 from chroma_ingestion.clients.chroma import get_chroma_client as _get_chroma_client
 
+if TYPE_CHECKING:
+    from chroma_ingestion.retrieval.cache import QueryCache
+
 logger = logging.getLogger(__name__)
 
 
+# Collection handles by name, per client. Keyed weakly so a client dropped by
+# `reset_client()` (or a test's mock) takes its handles with it
+_handles: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _get_collection(client: Any, collection_name: str) -> Any:
+    """Return a collection handle, fetched once per (client, name).
+
+    `get_or_create_collection` is a server round-trip; retrievers for the same
+    collection share the handle instead of repeating it.
+    """
+    handles = _handles.get(client)
+    if handles is None:
+        handles = _handles[client] = {}
+    handle = handles.get(collection_name)
+    if handle is None:
+        handle = handles[collection_name] = client.get_or_create_collection(name=collection_name)
+    return handle
+
+
+def clear_cache(collection_name: str | None = None) -> None:
+    """Forget cached collection handles, e.g. after a collection is recreated.
+
+    Args:
+        collection_name: Only forget handles for this collection (default: all)
+    """
+    if collection_name is None:
+        _handles.clear()
+        return
+    for handles in list(_handles.values()):
+        handles.pop(collection_name, None)
+
+
+def _distance(result: dict[str, Any]) -> float:
+    """Sort key ranking results without a distance last."""
+    return float(result.get("distance", math.inf))
+
+
 # Expose module-level symbol for test patching
 get_chroma_client = _get_chroma_client
 
@@ -28,18 +74,19 @@ class CodeRetriever:
 
     Behavior matches expectations in `tests/unit/test_retrieval.py`:
     - `query()` returns a list of dicts with keys: `document`, `metadata`, `distance`.
-    - Results are ordered by ascending `distance`.
+    - Results keep Chroma's order, which is by ascending `distance`.
     - Empty or nested-empty `documents` produce an empty list.
     """
 
-    def __init__(self, collection_name: str):
+    def __init__(self, collection_name: str, cache: QueryCache | None = None):
         self.collection_name = collection_name
+        self.cache = cache
         # Read module-level symbol so tests can patch it
         client = get_chroma_client()
         self.client = client
         # call get_or_create_collection on the returned client (may be mocked)
         try:
-            self.collection = client.get_or_create_collection(name=collection_name)
+            self.collection = _get_collection(client, collection_name)
         except Exception:
             # If the client is None or does not support the call, allow None
             self.collection = None
@@ -48,6 +95,11 @@ class CodeRetriever:
         if not self.collection:
             return []
 
+        if self.cache is not None:
+            cached = self.cache.get(self.collection_name, query_text, n_results)
+            if cached is not None:
+                return cached
+
         try:
             # Pass n_results explicitly as keyword to satisfy test assertions
             results = self.collection.query(query_texts=[query_text], n_results=n_results)
@@ -66,23 +118,27 @@ class CodeRetriever:
         if not docs or not docs[0]:
             return []
 
-        formatted: list[dict[str, Any]] = []
-        for doc, meta, dist in zip(docs[0], metas[0], dists[0], strict=False):
-            formatted.append({"document": doc, "metadata": meta, "distance": dist})
+        formatted = [
+            {"document": doc, "metadata": meta, "distance": dist}
+            for doc, meta, dist in zip(docs[0], metas[0], dists[0], strict=False)
+        ]
 
-        # Ensure ordering by distance ascending
-        formatted.sort(key=lambda r: r.get("distance", float("inf")))
+        # Chroma returns at most n_results hits, nearest first, so the list
+        # needs no re-sorting or trimming
+        if self.cache is not None:
+            self.cache.put(self.collection_name, query_text, n_results, formatted)
 
-        return formatted[:n_results]
+        return formatted
 
     def query_semantic(
         self, query_text: str, n_results: int = 5, distance_threshold: float = 1.0
     ) -> list[dict[str, Any]]:
         # Request a larger set then filter by threshold
         results = self.query(query_text, n_results=n_results * 2)
-        filtered = [r for r in results if r.get("distance", float("inf")) <= distance_threshold]
-        filtered.sort(key=lambda r: r.get("distance", float("inf")))
-        return filtered[:n_results]
+        # Results arrive nearest first: take the prefix within the threshold
+        # and stop scanning at the first result past it
+        within = takewhile(lambda r: r.get("distance", math.inf) <= distance_threshold, results)
+        return list(islice(within, n_results))
 
     def query_by_metadata(
         self,
@@ -109,7 +165,6 @@ class CodeRetriever:
         if not docs:
             return []
 
-        formatted: list[dict[str, Any]] = []
         # `collection.get` may return flat lists (not nested), handle both
         if isinstance(docs[0], list):
             iter_docs = docs[0]
@@ -118,10 +173,10 @@ class CodeRetriever:
             iter_docs = docs
             iter_metas = metas
 
-        for doc, meta in zip(iter_docs, iter_metas, strict=False):
-            formatted.append({"document": doc, "metadata": meta})
-
-        return formatted[:n_results]
+        return [
+            {"document": doc, "metadata": meta}
+            for doc, meta in islice(zip(iter_docs, iter_metas, strict=False), n_results)
+        ]
 
     def get_context(
         self, query_text: str, n_results: int = 3, include_metadata: bool = True
@@ -157,7 +212,6 @@ class CodeRetriever:
         if not docs:
             return []
 
-        formatted: list[dict[str, Any]] = []
         if isinstance(docs[0], list):
             iter_docs = docs[0]
             iter_metas = metas[0]
@@ -165,10 +219,10 @@ class CodeRetriever:
             iter_docs = docs
             iter_metas = metas
 
-        for doc, meta in zip(iter_docs, iter_metas, strict=False):
-            formatted.append({"document": doc, "metadata": meta})
-
-        return formatted
+        return [
+            {"document": doc, "metadata": meta}
+            for doc, meta in zip(iter_docs, iter_metas, strict=False)
+        ]
 
     def get_collection_info(self) -> dict[str, Any]:
         """Return collection info in the shape tests expect.
@@ -199,6 +253,25 @@ class MultiCollectionSearcher:
             name: CodeRetriever(name) for name in self.collection_names
         }
 
+    def _query_each(self, query_text: str, n_results: int) -> dict[str, list[dict[str, Any]]]:
+        """Query every collection concurrently, keyed by name in collection order.
+
+        Each query is a separate server round-trip, so running them on a thread
+        pool makes the total latency that of the slowest collection rather than
+        the sum.
+        """
+        if len(self.retrievers) <= 1:
+            return {
+                name: retriever.query(query_text, n_results=n_results)
+                for name, retriever in self.retrievers.items()
+            }
+        with ThreadPoolExecutor(max_workers=len(self.retrievers)) as pool:
+            futures = {
+                name: pool.submit(retriever.query, query_text, n_results=n_results)
+                for name, retriever in self.retrievers.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def search(self, query_text: str, n_results: int = 5) -> list[dict[str, Any]]:
         """Query all collections and return combined list (unsorted).
 
@@ -206,23 +279,19 @@ class MultiCollectionSearcher:
         `search_ranked()` when ordering is required.
         """
         out: list[dict[str, Any]] = []
-        for name, retriever in self.retrievers.items():
-            res = retriever.query(query_text, n_results=n_results)
+        for name, res in self._query_each(query_text, n_results).items():
             for r in res:
                 r["collection"] = name
             out.extend(res)
         return out
 
     def search_all(self, query_text: str, n_results: int = 3) -> dict[str, list[dict[str, Any]]]:
-        return {
-            name: retriever.query(query_text, n_results=n_results)
-            for name, retriever in self.retrievers.items()
-        }
+        return self._query_each(query_text, n_results)
 
     def search_ranked(self, query_text: str, n_results: int = 5) -> list[dict[str, Any]]:
         all_results: list[dict[str, Any]] = self.search(query_text, n_results=n_results * 2)
-        all_results.sort(key=lambda r: r.get("distance", float("inf")))
-        return all_results[:n_results]
+        # Only the top n_results of the merged hits are needed; no full sort
+        return heapq.nsmallest(n_results, all_results, key=_distance)
 
 
-__all__ = ["CodeRetriever", "MultiCollectionSearcher", "get_chroma_client"]
+__all__ = ["CodeRetriever", "MultiCollectionSearcher", "clear_cache", "get_chroma_client"]
@@ -6,35 +6,94 @@ beside the original `retriever.py` to avoid risky in-place edits of a large
 malformed file during repair iterations.
 """
 
+from __future__ import annotations
+
+import heapq
 import logging
-from typing import Any
+import math
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, takewhile
+from typing import TYPE_CHECKING, Any
 
 from chroma_ingestion.clients.chroma import get_chroma_client
 
+if TYPE_CHECKING:
+    from chroma_ingestion.retrieval.cache import QueryCache
+
 logger = logging.getLogger(__name__)
 
 
+# Collection handles by name, per client. Keyed weakly so a client dropped by
+# `reset_client()` (or a test's mock) takes its handles with it
+_handles: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _get_collection(client: Any, collection_name: str) -> Any:
+    """Return a collection handle, fetched once per (client, name).
+
+    `get_or_create_collection` is a server round-trip; retrievers for the same
+    collection share the handle instead of repeating it.
+    """
+    handles = _handles.get(client)
+    if handles is None:
+        handles = _handles[client] = {}
+    handle = handles.get(collection_name)
+    if handle is None:
+        handle = handles[collection_name] = client.get_or_create_collection(name=collection_name)
+    return handle
+
+
+def clear_cache(collection_name: str | None = None) -> None:
+    """Forget cached collection handles, e.g. after a collection is recreated.
+
+    Args:
+        collection_name: Only forget handles for this collection (default: all)
+    """
+    if collection_name is None:
+        _handles.clear()
+        return
+    for handles in list(_handles.values()):
+        handles.pop(collection_name, None)
+
+
+def _distance(result: dict[str, Any]) -> float:
+    """Sort key ranking results without a distance last."""
+    return float(result.get("distance", math.inf))
+
+
 class CodeRetriever:
-    def __init__(self, collection_name: str):
+    def __init__(self, collection_name: str, cache: QueryCache | None = None):
         self.collection_name = collection_name
+        self.cache = cache
         self.client = get_chroma_client()
-        self.collection = self.client.get_or_create_collection(name=collection_name)
+        self.collection = _get_collection(self.client, collection_name)
 
     def query(self, query_text: str, n_results: int = 3) -> list[dict[str, Any]]:
+        if self.cache is not None:
+            cached = self.cache.get(self.collection_name, query_text, n_results)
+            if cached is not None:
+                return cached
+
         try:
             results = self.collection.query(query_texts=[query_text], n_results=n_results)
         except Exception:
             logger.exception("Query failed")
             return []
 
-        formatted: list[dict[str, Any]] = []
         docs = results.get("documents")
         metas = results.get("metadatas")
         dists = results.get("distances")
 
+        formatted: list[dict[str, Any]] = []
         if docs and docs[0]:
-            for doc, meta, dist in zip(docs[0], metas[0], dists[0], strict=False):
-                formatted.append({"document": doc, "metadata": meta, "distance": dist})
+            formatted = [
+                {"document": doc, "metadata": meta, "distance": dist}
+                for doc, meta, dist in zip(docs[0], metas[0], dists[0], strict=False)
+            ]
+
+        if self.cache is not None and formatted:
+            self.cache.put(self.collection_name, query_text, n_results, formatted)
 
         return formatted
 
@@ -42,8 +101,10 @@ class CodeRetriever:
         self, query_text: str, n_results: int = 5, distance_threshold: float = 1.0
     ) -> list[dict[str, Any]]:
         results = self.query(query_text, n_results=n_results * 2)
-        filtered = [r for r in results if r.get("distance", float("inf")) <= distance_threshold]
-        return filtered[:n_results]
+        # Results arrive nearest first: take the prefix within the threshold
+        # and stop scanning at the first result past it
+        within = takewhile(lambda r: r.get("distance", math.inf) <= distance_threshold, results)
+        return list(islice(within, n_results))
 
     def query_by_metadata(
         self,
@@ -59,13 +120,11 @@ class CodeRetriever:
             logger.exception("Metadata query failed")
             return []
 
-        formatted: list[dict[str, Any]] = []
         docs = results.get("documents")
         metas = results.get("metadatas")
-        if docs:
-            for doc, meta in zip(docs, metas, strict=False):
-                formatted.append({"document": doc, "metadata": meta})
-        return formatted
+        if not docs:
+            return []
+        return [{"document": doc, "metadata": meta} for doc, meta in zip(docs, metas, strict=False)]
 
     def get_context(
         self, query_text: str, n_results: int = 3, include_metadata: bool = True
@@ -91,13 +150,11 @@ class CodeRetriever:
             logger.exception("Get by source failed")
             return []
 
-        formatted: list[dict[str, Any]] = []
         docs = results.get("documents")
         metas = results.get("metadatas")
-        if docs:
-            for doc, meta in zip(docs, metas, strict=False):
-                formatted.append({"document": doc, "metadata": meta})
-        return formatted
+        if not docs:
+            return []
+        return [{"document": doc, "metadata": meta} for doc, meta in zip(docs, metas, strict=False)]
 
     def get_collection_info(self) -> dict[str, Any]:
         try:
@@ -114,21 +171,36 @@ class MultiCollectionSearcher:
             name: CodeRetriever(name) for name in collection_names
         }
 
+    def _query_each(self, query_text: str, n_results: int) -> dict[str, list[dict[str, Any]]]:
+        """Query every collection concurrently, keyed by name in collection order.
+
+        Each query is a separate server round-trip, so running them on a thread
+        pool makes the total latency that of the slowest collection rather than
+        the sum.
+        """
+        if len(self.retrievers) <= 1:
+            return {
+                name: retriever.query(query_text, n_results=n_results)
+                for name, retriever in self.retrievers.items()
+            }
+        with ThreadPoolExecutor(max_workers=len(self.retrievers)) as pool:
+            futures = {
+                name: pool.submit(retriever.query, query_text, n_results=n_results)
+                for name, retriever in self.retrievers.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def search_all(self, query_text: str, n_results: int = 3) -> dict[str, list[dict[str, Any]]]:
-        out: dict[str, list[dict[str, Any]]] = {}
-        for name, retriever in self.retrievers.items():
-            out[name] = retriever.query(query_text, n_results=n_results)
-        return out
+        return self._query_each(query_text, n_results)
 
     def search_ranked(self, query_text: str, n_results: int = 5) -> list[dict[str, Any]]:
         all_results: list[dict[str, Any]] = []
-        for name, retriever in self.retrievers.items():
-            res = retriever.query(query_text, n_results=n_results * 2)
+        for name, res in self._query_each(query_text, n_results * 2).items():
             for r in res:
                 r["collection"] = name
             all_results.extend(res)
-        all_results.sort(key=lambda r: r.get("distance", float("inf")))
-        return all_results[:n_results]
+        # Only the top n_results of the merged hits are needed; no full sort
+        return heapq.nsmallest(n_results, all_results, key=_distance)
 
     def get_context_multiway(self, query_text: str, n_results: int = 2) -> str:
         results = self.search_all(query_text, n_results=n_results)
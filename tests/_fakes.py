@@ -0,0 +1,33 @@
+"""In-memory stand-in for a Chroma collection.
+
+Shared by the logging tests that run a real `CodeIngester` end to end without
+a server.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class FakeCollection:
+    """Collection that counts upserted chunks without keeping them."""
+
+    _total: int = 0
+
+    def upsert(
+        self,
+        documents: list[str] | None = None,
+        ids: list[str] | None = None,
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self._total += len(documents or ())
+
+    def count(self) -> int:
+        """Return the number of stored chunks."""
+        return self._total
+
+    def get(self, limit: int = 5) -> dict[str, Any]:
+        # Return a minimal shape to satisfy callers
+        return {"ids": ["fake"], "documents": ["doc"], "metadatas": [{"filename": "f"}]}
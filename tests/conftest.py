@@ -6,11 +6,46 @@ including temporary files, mock clients, and database setup.
 
 from __future__ import annotations
 
+import logging
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
 from unittest.mock import MagicMock
 
 import pytest
 
+import chroma_ingestion.clients.chroma as chroma_clients
+import chroma_ingestion.config as chroma_config_module
+import chroma_ingestion.ingestion.base as ingestion_base
+from tests._fakes import FakeCollection
+
+FAKE_CHROMA_CONFIG = {"host": "testhost", "port": 12345}
+# The ingester's logger, resolved once rather than by name in every fixture setup
+_INGEST_LOGGER = logging.getLogger(ingestion_base.__name__)
+
+# Contents of the sample_folder inputs, by file name. "big" is a repeated
+# paragraph so the splitter produces multiple chunks
+SAMPLE_FILES = {
+    "example.md": b"# Example\n\nThis is a test document for chunking.",
+    "big.md": ("This is a repeated sentence. " * 50).encode(),
+}
+
+
+def _fake_chroma_config() -> dict:
+    """Stand-in for `get_chroma_config`; callers only read the shared dict."""
+    return FAKE_CHROMA_CONFIG
+
+
+def _fast_write(path: str, data: bytes) -> None:
+    """Write bytes to a file with raw os calls, skipping pathlib and buffered I/O."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 
 @pytest.fixture
 def tmp_code_folder(tmp_path: Path) -> Path:
@@ -209,3 +244,87 @@ def sample_query() -> str:
         Sample natural language query string.
     """
     return "How do I authenticate users in this codebase?"
+
+
+@pytest.fixture(scope="session")
+def sample_folder(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the sample Markdown inputs once per session.
+
+    Each file sits in its own subfolder (``example/`` and ``big/``) so a test
+    can ingest exactly one of them. Tests must not modify these files.
+
+    Returns:
+        Path to the folder holding the ``example`` and ``big`` subfolders.
+    """
+    root = tmp_path_factory.mktemp("sample")
+    for file_name, payload in SAMPLE_FILES.items():
+        folder = root / file_name.removesuffix(".md")
+        folder.mkdir()
+        _fast_write(str(folder / file_name), payload)
+    return root
+
+
+class _IngestLogHandler(logging.Handler):
+    """Keep only the ingester's audit and batch lines, already formatted."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.INFO)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        msg = record.msg
+        if isinstance(msg, str) and ("[INGEST]" in msg or "Batch " in msg):
+            self.messages.append(record.getMessage())
+
+
+class FakeChromaEnv(NamedTuple):
+    """What `fake_chroma_env` provides to a test."""
+
+    collection: FakeCollection
+    client: SimpleNamespace
+    messages: list[str]
+
+
+@pytest.fixture
+def fake_collection() -> FakeCollection:
+    """Provide an empty in-memory Chroma collection."""
+    return FakeCollection()
+
+
+@pytest.fixture
+def fake_client(fake_collection: FakeCollection) -> SimpleNamespace:
+    """Provide a client whose every collection is `fake_collection`."""
+    return SimpleNamespace(get_or_create_collection=lambda name, **kwargs: fake_collection)
+
+
+@pytest.fixture
+def fake_chroma_env(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_collection: FakeCollection,
+    fake_client: SimpleNamespace,
+) -> Iterator[FakeChromaEnv]:
+    """Route ingestion to an in-memory Chroma fake and collect ingester log lines.
+
+    `chroma_ingestion.ingestion.base` imports `get_chroma_client` and
+    `get_chroma_config` by name, so they are patched there as well as at
+    their source. The config reports host ``testhost`` and port ``12345``.
+    Only the ``[INGEST]`` audit and ``Batch`` lines are kept in `messages`,
+    so other INFO records are never formatted or stored.
+
+    Yields:
+        The fake collection, fake client and collected messages.
+    """
+    for module in (chroma_clients, ingestion_base):
+        monkeypatch.setattr(module, "get_chroma_client", lambda: fake_client)
+    for module in (chroma_config_module, ingestion_base):
+        monkeypatch.setattr(module, "get_chroma_config", _fake_chroma_config)
+
+    handler = _IngestLogHandler()
+    previous_level = _INGEST_LOGGER.level
+    _INGEST_LOGGER.setLevel(logging.INFO)
+    _INGEST_LOGGER.addHandler(handler)
+    try:
+        yield FakeChromaEnv(fake_collection, fake_client, handler.messages)
+    finally:
+        _INGEST_LOGGER.removeHandler(handler)
+        _INGEST_LOGGER.setLevel(previous_level)
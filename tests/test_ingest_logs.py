@@ -0,0 +1,73 @@
+import os
+import re
+
+import pytest
+
+import chroma_ingestion.ingestion.base as ingestion_base
+from chroma_ingestion.ingestion.base import CodeIngester
+from tests.conftest import SAMPLE_FILES
+
+# Every case reads the session-scoped sample_folder; under `--dist loadgroup`
+# they share one xdist worker so the folder is built once rather than per worker
+pytestmark = pytest.mark.xdist_group("ingest")
+
+# The audit line carrying the fake server's host/port and the target collection
+_AUDIT_RE = re.compile(r"\[INGEST\].*host=testhost.*port=12345.*collection=test_collection")
+
+
+@pytest.mark.parametrize(
+    ("sample", "chunk_size", "batch_size", "min_chunks", "expected_substrings"),
+    [
+        # One small file: a single batch
+        ("example", 50, 10, 1, ["Batch 1 complete (1 chunks)"]),
+        # A very small batch_size forces one batch per chunk
+        ("big", 100, 1, 2, ["Batch 1 complete (1 chunks)", "Batch 2 complete"]),
+    ],
+)
+def test_ingest_emits_audit_and_batch_logs(
+    fake_chroma_env,
+    fake_collection,
+    monkeypatch,
+    sample_folder,
+    sample,
+    chunk_size,
+    batch_size,
+    min_chunks,
+    expected_substrings,
+):
+    # Discovery still walks sample_folder, but contents come from memory so
+    # the run makes no open/read/close calls
+    monkeypatch.setattr(
+        ingestion_base, "_read_text", lambda path: SAMPLE_FILES[os.path.basename(path)].decode()
+    )
+
+    ingester = CodeIngester(
+        target_folder=str(sample_folder / sample),
+        collection_name="test_collection",
+        chunk_size=chunk_size,
+        chunk_overlap=10,
+        batch_size=batch_size,
+    )
+
+    files_processed, chunks_ingested = ingester.ingest_files()
+
+    assert files_processed == 1
+    assert chunks_ingested >= min_chunks
+    assert fake_collection.count() == chunks_ingested
+
+    # The audit line with host/port/collection and the batch lines come from the
+    # same run. One pass over the messages sets bit 0 for the audit line and bit
+    # i for the i-th expected substring, stopping once every bit is set
+    target = (1 << (len(expected_substrings) + 1)) - 1
+    seen = 0
+    for m in fake_chroma_env.messages:
+        if _AUDIT_RE.search(m):
+            seen |= 1
+        for bit, expected in enumerate(expected_substrings, start=1):
+            if expected in m:
+                seen |= 1 << bit
+        if seen == target:
+            break
+    wanted = ["ingest audit line", *expected_substrings]
+    missing = [name for bit, name in enumerate(wanted) if not seen >> bit & 1]
+    assert not missing, f"Not logged: {missing}"
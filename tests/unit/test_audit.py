@@ -0,0 +1,335 @@
+"""Unit tests for chroma_ingestion.audit module.
+
+Tests for AgentAuditor covering:
+- Loading and aggregating agent chunks (sync and async)
+- Consolidation candidate detection
+- Coverage analysis
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from chroma_ingestion.audit.agent_auditor import AgentAuditor
+
+
+def make_agent(path: str, category: str, tech_stack: list[str]) -> dict[str, Any]:
+    """Build an aggregated agent record shaped like `load_agents` output."""
+    return {
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "type": "agent",
+        "category": category,
+        "tech_stack": tech_stack,
+        "description": "",
+        "source": "unknown",
+        "complexity": "unknown",
+        "chunk_count": 1,
+        "raw_metadata": {},
+    }
+
+
+def make_auditor(agents: list[dict[str, Any]]) -> AgentAuditor:
+    """Create an auditor preloaded with agents (no Chroma access)."""
+    auditor = AgentAuditor(collection_name="test_collection")
+    auditor.agents = agents
+    return auditor
+
+
+def make_paged_collection(ids: list[str], metadatas: list[dict[str, Any]]) -> MagicMock:
+    """Create a mock collection whose `get` honours limit/offset paging."""
+    collection = MagicMock()
+
+    def fake_get(limit: int = 10, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        return {
+            "ids": ids[offset : offset + limit],
+            "metadatas": metadatas[offset : offset + limit],
+        }
+
+    collection.get.side_effect = fake_get
+    return collection
+
+
+class TestAgentAuditorInitialization:
+    """Test AgentAuditor initialization."""
+
+    def test_rag_chain_is_lazy(self) -> None:
+        """Test that the RAG chain is only built when first accessed."""
+        with patch("chroma_ingestion.audit.agent_auditor.RAGChain") as mock_rag:
+            auditor = AgentAuditor(collection_name="test_collection")
+            mock_rag.assert_not_called()
+
+            rag = auditor.rag
+            assert auditor.rag is rag
+            mock_rag.assert_called_once_with(collection_name="test_collection")
+
+
+class TestLoadAgents:
+    """Test AgentAuditor.load_agents."""
+
+    def test_aggregates_chunks_across_pages(self) -> None:
+        """Test that chunks of one file fetched on different pages merge into one agent."""
+        ids = [
+            "/agents/react.md:0",
+            "/agents/react.md:1",
+            "/agents/python.md:0",
+            "/agents/react.md:2",
+            "/agents/sql.md:0",
+        ]
+        metadatas = [
+            {"category": "frontend", "tech_stack": '["react", "css"]'},
+            {"category": "frontend", "tech_stack": "react, nextjs"},
+            {"category": "backend", "tech_stack": "python"},
+            {"category": "frontend", "tech_stack": ""},
+            {"category": "database", "tech_stack": ["sql"]},
+        ]
+        collection = make_paged_collection(ids, metadatas)
+        auditor = make_auditor([])
+
+        with patch("chroma_ingestion.audit.agent_auditor.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            count = auditor.load_agents(limit=100, page_size=2)
+
+        assert count == 3
+        assert collection.get.call_count == 3
+        assert all(c.kwargs["include"] == ["metadatas"] for c in collection.get.call_args_list)
+        react = next(a for a in auditor.agents if a["name"] == "react.md")
+        assert react["chunk_count"] == 3
+        assert sorted(react["tech_stack"]) == ["css", "nextjs", "react"]
+        assert react["category"] == "frontend"
+
+    def test_respects_limit(self) -> None:
+        """Test that no more than `limit` chunks are fetched."""
+        ids = [f"/agents/a{i}.md:0" for i in range(10)]
+        metadatas = [{"category": "general"} for _ in ids]
+        collection = make_paged_collection(ids, metadatas)
+        auditor = make_auditor([])
+
+        with patch("chroma_ingestion.audit.agent_auditor.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            count = auditor.load_agents(limit=5, page_size=3)
+
+        assert count == 5
+
+    def test_no_limit_streams_whole_collection(self) -> None:
+        """Test that limit=None keeps paging until the collection is exhausted."""
+        ids = [f"/agents/a{i}.md:0" for i in range(7)]
+        metadatas = [{"category": "general"} for _ in ids]
+        collection = make_paged_collection(ids, metadatas)
+        auditor = make_auditor([])
+
+        with patch("chroma_ingestion.audit.agent_auditor.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            count = auditor.load_agents(limit=None, page_size=3)
+
+        assert count == 7
+        assert [c.kwargs["limit"] for c in collection.get.call_args_list] == [3, 3, 3]
+
+    def test_empty_collection(self) -> None:
+        """Test that an empty collection loads no agents."""
+        collection = make_paged_collection([], [])
+        auditor = make_auditor([])
+
+        with patch("chroma_ingestion.audit.agent_auditor.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            assert auditor.load_agents() == 0
+
+        assert auditor.agents == []
+
+
+class TestAsyncLoadAgents:
+    """Test AgentAuditor.aload_agents."""
+
+    def test_matches_sync_aggregation(self) -> None:
+        """Test that concurrent page fetches aggregate like the sync loader."""
+        ids = [f"/agents/a{i % 3}.md:{i}" for i in range(7)]
+        metadatas = [{"category": "testing", "tech_stack": f"pytest, t{i}"} for i in range(7)]
+        sync_collection = make_paged_collection(ids, metadatas)
+
+        async_collection = MagicMock()
+        async_collection.count = AsyncMock(return_value=len(ids))
+        async_collection.get = AsyncMock(side_effect=sync_collection.get.side_effect)
+        async_client = MagicMock()
+        async_client.get_collection = AsyncMock(return_value=async_collection)
+
+        auditor = make_auditor([])
+        auditor.async_client = async_client
+
+        count = asyncio.run(auditor.aload_agents(page_size=2, max_concurrency=2))
+
+        assert count == 3
+        assert async_collection.get.await_count == 4
+        a0 = next(a for a in auditor.agents if a["name"] == "a0.md")
+        assert a0["chunk_count"] == 3
+        assert a0["tech_stack"] == ["pytest", "t0", "t3", "t6"]
+
+    def test_error_returns_zero(self) -> None:
+        """Test that client errors are logged and reported as zero agents."""
+        async_client = MagicMock()
+        async_client.get_collection = AsyncMock(side_effect=Exception("boom"))
+
+        auditor = make_auditor([])
+        auditor.async_client = async_client
+
+        assert asyncio.run(auditor.aload_agents()) == 0
+
+
+class TestFindConsolidationCandidates:
+    """Test AgentAuditor.find_consolidation_candidates."""
+
+    def test_overlapping_agents_are_candidates(self) -> None:
+        """Test that agents sharing most of their tech stack are paired."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/react-expert.md", "frontend", ["react", "nextjs", "css"]),
+                make_agent("/b/nextjs-expert.md", "frontend", ["react", "nextjs", "html"]),
+                make_agent("/c/python-expert.md", "backend", ["python", "fastapi"]),
+            ]
+        )
+
+        candidates = auditor.find_consolidation_candidates(similarity_threshold=0.6)
+
+        assert len(candidates) == 1
+        cand = candidates[0]
+        assert {cand["agent1"], cand["agent2"]} == {"react-expert.md", "nextjs-expert.md"}
+        assert cand["category"] == "frontend"
+        assert abs(cand["overlap_score"] - 2 / 3) < 1e-9
+        assert sorted(cand["shared_techs"]) == ["nextjs", "react"]
+
+    def test_disjoint_agents_are_not_candidates(self) -> None:
+        """Test that agents with no shared techs are never paired."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/one.md", "frontend", ["react"]),
+                make_agent("/b/two.md", "frontend", ["vue"]),
+            ]
+        )
+
+        assert auditor.find_consolidation_candidates(similarity_threshold=0.1) == []
+
+    def test_agents_in_different_categories_are_not_paired(self) -> None:
+        """Test that pairing happens only within a category."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/one.md", "frontend", ["react", "css"]),
+                make_agent("/b/two.md", "backend", ["react", "css"]),
+            ]
+        )
+
+        assert auditor.find_consolidation_candidates(similarity_threshold=0.5) == []
+
+    def test_same_name_full_overlap_is_skipped(self) -> None:
+        """Test that same-named agents with identical stacks are treated as duplicates."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/expert.md", "testing", ["pytest", "playwright"]),
+                make_agent("/b/expert.md", "testing", ["pytest", "playwright"]),
+            ]
+        )
+
+        assert auditor.find_consolidation_candidates(similarity_threshold=0.5) == []
+
+    def test_candidates_sorted_and_limited(self) -> None:
+        """Test that candidates are ordered by overlap and capped at max_candidates."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/one.md", "backend", ["python", "fastapi", "sql", "api"]),
+                make_agent("/b/two.md", "backend", ["python", "fastapi", "sql", "api"]),
+                make_agent("/c/three.md", "backend", ["python", "fastapi", "sql", "rest"]),
+            ]
+        )
+
+        candidates = auditor.find_consolidation_candidates(
+            similarity_threshold=0.5, max_candidates=2
+        )
+
+        assert len(candidates) == 2
+        assert candidates[0]["overlap_score"] == 1.0
+        assert candidates[0]["overlap_score"] >= candidates[1]["overlap_score"]
+
+
+class TestGenerateReport:
+    """Test AgentAuditor.generate_report."""
+
+    def test_candidates_show_their_own_paths(self) -> None:
+        """Test that same-named agents in different folders keep distinct paths."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/expert.md", "testing", ["pytest", "playwright", "vitest"]),
+                make_agent("/b/expert.md", "testing", ["pytest", "playwright", "jest"]),
+            ]
+        )
+
+        candidates = auditor.find_consolidation_candidates(similarity_threshold=0.6)
+        assert candidates[0]["agent1_path"] == "/a/expert.md"
+        assert candidates[0]["agent2_path"] == "/b/expert.md"
+
+        report = auditor.generate_report()
+        assert "1. /a/expert.md ↔\n   /b/expert.md" in report
+
+
+class TestAnalyzeCoverage:
+    """Test AgentAuditor.analyze_coverage."""
+
+    def test_counts_categories_and_techs(self) -> None:
+        """Test category/tech counting and gap detection."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/one.md", "frontend", ["react", "css"]),
+                make_agent("/b/two.md", "frontend", ["react"]),
+                make_agent("/c/three.md", "backend", ["python"]),
+            ]
+        )
+
+        coverage = auditor.analyze_coverage()
+
+        assert coverage["total_agents"] == 3
+        assert coverage["categories"] == {"frontend": 2, "backend": 1}
+        assert coverage["top_tech_stacks"]["react"] == 2
+        assert sorted(coverage["coverage_gaps"]) == ["css", "python"]
+        assert coverage["category_balance"]["most_common"] == ("frontend", 2)
+        assert coverage["category_balance"]["least_common"] == ("backend", 1)
+        assert coverage["category_balance"]["spread"] == 2
+
+
+class TestReportCaching:
+    """Test AgentAuditor report/analysis caching."""
+
+    def test_report_reused_until_agents_change(self) -> None:
+        """Test that repeated reports skip re-analysis until agents are replaced."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/one.md", "frontend", ["react", "css"]),
+                make_agent("/b/two.md", "frontend", ["react", "css"]),
+            ]
+        )
+
+        with patch.object(
+            auditor, "find_consolidation_candidates", wraps=auditor.find_consolidation_candidates
+        ) as spy:
+            first = auditor.generate_report()
+            second = auditor.generate_report()
+            assert first is second
+            assert spy.call_count == 1
+
+            auditor.agents = [make_agent("/c/three.md", "backend", ["python"])]
+            third = auditor.generate_report()
+            assert spy.call_count == 2
+
+        assert "Total Agents: 1" in third
+
+    def test_explicit_threshold_is_kept_for_report(self) -> None:
+        """Test that the report uses candidates computed with a custom threshold."""
+        auditor = make_auditor(
+            [
+                make_agent("/a/one.md", "frontend", ["react", "css", "html"]),
+                make_agent("/b/two.md", "frontend", ["react", "vue", "svelte"]),
+            ]
+        )
+
+        candidates = auditor.find_consolidation_candidates(similarity_threshold=0.3)
+        assert len(candidates) == 1
+
+        summary = auditor.get_audit_summary()
+        assert summary["consolidation_candidates"] == candidates
+        assert "Consolidation Candidates: 1" in auditor.generate_report()
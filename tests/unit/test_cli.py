@@ -0,0 +1,179 @@
+"""Unit tests for the chroma-ingest command-line entry point.
+
+Tests argument dispatch and the command handlers without a running
+Chroma server.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from chroma_ingestion.__main__ import run
+from chroma_ingestion._help import COMMAND_HELP, MAIN_HELP
+from chroma_ingestion._version import __version__
+from chroma_ingestion.cli import main
+
+
+class TestEntryPoint:
+    """Test suite for the `chroma-ingest` entry point."""
+
+    def test_version_skips_click(self, capsys) -> None:
+        """Test that --version is answered without importing the Click CLI."""
+        with patch.dict(sys.modules, {"chroma_ingestion.cli": None}):
+            run(["--version"])
+
+        assert capsys.readouterr().out == f"chroma-ingest, version {__version__}\n"
+
+    def test_help_skips_click(self, capsys) -> None:
+        """Test that top-level and per-command --help use the baked text."""
+        with patch.dict(sys.modules, {"chroma_ingestion.cli": None}):
+            run(["--help"])
+            assert capsys.readouterr().out == MAIN_HELP
+
+            run(["search", "--help"])
+            assert capsys.readouterr().out == COMMAND_HELP["search"]
+
+    def test_baked_help_matches_click(self) -> None:
+        """Test that the baked help text is in sync with the Click definitions.
+
+        If this fails after changing an option or docstring, regenerate
+        `chroma_ingestion/_help.py` from `ctx.get_help()` at 80 columns.
+        """
+        root = click.Context(main, info_name="chroma-ingest", terminal_width=80)
+        assert root.get_help() + "\n" == MAIN_HELP
+
+        assert COMMAND_HELP.keys() == main.commands.keys()
+        for name, command in main.commands.items():
+            ctx = click.Context(command, info_name=name, parent=root, terminal_width=80)
+            assert ctx.get_help() + "\n" == COMMAND_HELP[name], name
+
+    def test_dispatches_to_click_group(self) -> None:
+        """Test that other arguments are passed through to the Click group."""
+        with patch("chroma_ingestion.cli.main") as mock_main:
+            run(["info", "--collection", "demo"])
+
+        mock_main.assert_called_once_with(
+            args=["info", "--collection", "demo"], prog_name="chroma-ingest"
+        )
+
+
+class TestListCollections:
+    """Test suite for the `list-collections` command."""
+
+    def test_counts_every_collection(self, caplog) -> None:
+        """Test that counts are fetched per collection and failures are reported."""
+        good = MagicMock(metadata=None)
+        good.name = "agents"
+        good.count.return_value = 3
+        bad = MagicMock(metadata=None)
+        bad.name = "broken"
+        bad.count.side_effect = Exception("boom")
+
+        caplog.set_level(logging.INFO)
+        with (
+            patch("chroma_ingestion.cli.configure_logging"),
+            patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client,
+        ):
+            mock_client.return_value.list_collections.return_value = [good, bad]
+            result = CliRunner().invoke(main, ["list-collections"])
+
+        assert result.exit_code == 0
+        # caplog has already formatted each record into r.message
+        messages = [r.message for r in caplog.records]
+        assert any("1. agents (docs: 3)" in m for m in messages)
+        assert any("2. broken (error: boom)" in m for m in messages)
+
+
+class TestSearch:
+    """Test suite for the `search` command."""
+
+    def test_renders_results_to_stdout(self) -> None:
+        """Test that hits are rendered in one block on stdout."""
+        results = [
+            {
+                "document": "  def login(): ...  ",
+                "metadata": {"filename": "auth.py", "source": "/src/auth.py"},
+                "distance": 0.25,
+            },
+            {"document": "far away", "metadata": None, "distance": 0.9},
+        ]
+
+        with (
+            patch("chroma_ingestion.cli.configure_logging"),
+            patch("chroma_ingestion.retrieval.CodeRetriever") as mock_retriever,
+        ):
+            mock_retriever.return_value.query.return_value = results
+            result = CliRunner().invoke(main, ["search", "login", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "✅ Found 1 results:" in result.output
+        assert (
+            "1. auth.py (confidence: 75.00%)\n   📍 /src/auth.py\n   def login(): ......\n"
+            in result.output
+        )
+        assert "far away" not in result.output
+
+    def test_json_output_is_valid_json(self, caplog) -> None:
+        """Test that --json logs the filtered hits as indented JSON."""
+        results = [{"document": "doc", "metadata": {"filename": "a.py"}, "distance": 0.1}]
+
+        caplog.set_level(logging.INFO)
+        with (
+            patch("chroma_ingestion.cli.configure_logging"),
+            patch("chroma_ingestion.retrieval.CodeRetriever") as mock_retriever,
+        ):
+            mock_retriever.return_value.query.return_value = results
+            result = CliRunner().invoke(main, ["search", "q", "--json", "--no-cache"])
+
+        assert result.exit_code == 0
+        payload = next(r.message for r in caplog.records if r.message.startswith("["))
+        assert json.loads(payload) == results
+        assert '\n  {\n    "document": "doc",' in payload
+
+
+class TestErrorHandling:
+    """Test suite for the group-level error handler."""
+
+    def test_user_error_is_one_line(self, caplog) -> None:
+        """Test that expected errors exit 1 without a traceback."""
+        with (
+            patch("chroma_ingestion.cli.configure_logging"),
+            patch("chroma_ingestion.retrieval.CodeRetriever") as mock_retriever,
+        ):
+            mock_retriever.return_value.get_collection_info.return_value = {}
+            result = CliRunner().invoke(main, ["info", "--collection", "missing"])
+
+        assert result.exit_code == 1
+        record = next(r for r in caplog.records if r.levelno == logging.ERROR)
+        assert record.getMessage() == "❌ Could not read collection 'missing'"
+        assert record.exc_info is None
+
+    def test_unexpected_error_logs_traceback(self, caplog) -> None:
+        """Test that unexpected errors are logged with their traceback."""
+        with (
+            patch("chroma_ingestion.cli.configure_logging"),
+            patch("chroma_ingestion.retrieval.CodeRetriever") as mock_retriever,
+        ):
+            mock_retriever.side_effect = RuntimeError("boom")
+            result = CliRunner().invoke(main, ["search", "q", "--no-cache"])
+
+        assert result.exit_code == 1
+        record = next(r for r in caplog.records if r.levelno == logging.ERROR)
+        assert record.getMessage() == "❌ search error: boom"
+        assert record.exc_info is not None
+
+    def test_non_positive_concurrency_is_usage_error(self) -> None:
+        """Test that --concurrency 0 is rejected by Click before enrichment runs."""
+        with patch("chroma_ingestion.cli.configure_logging"):
+            result = CliRunner().invoke(
+                main, ["enrich-collection", "agents_raw", "--concurrency", "0"]
+            )
+
+        assert result.exit_code == 2
+        assert "x>=1" in result.output
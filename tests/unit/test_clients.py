@@ -8,7 +8,8 @@ Tests for ChromaDB client initialization and singleton pattern covering:
 - Client reset functionality
 """
 
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -71,6 +72,7 @@ class TestGetChromaClientSingleton:
             mock_http.assert_called_once_with(
                 host="localhost",
                 port=9500,
+                settings=ANY,
             )
 
     def test_get_chroma_client_uses_custom_config(self) -> None:
@@ -94,6 +96,7 @@ class TestGetChromaClientSingleton:
             mock_http.assert_called_once_with(
                 host="custom-host.example.com",
                 port=9500,
+                settings=ANY,
             )
 
 
@@ -138,7 +141,7 @@ class TestResetClient:
             mock_config.return_value = {"host": "host1", "port": 9500}
             mock_http.return_value = MagicMock()
             _client1 = get_chroma_client()
-            mock_http.assert_called_with(host="host1", port=9500)
+            mock_http.assert_called_with(host="host1", port=9500, settings=ANY)
 
             # Reset and change config
             reset_client()
@@ -148,7 +151,7 @@ class TestResetClient:
             _client2 = get_chroma_client()
 
             # Should use new config
-            mock_http.assert_called_with(host="host2", port=9500)
+            mock_http.assert_called_with(host="host2", port=9500, settings=ANY)
 
 
 class TestClientInitialization:
@@ -174,6 +177,16 @@ class TestClientInitialization:
             assert isinstance(call_kwargs["host"], str)
             assert isinstance(call_kwargs["port"], int)
 
+    def test_client_disables_telemetry(self) -> None:
+        """Test that the client is created with anonymized telemetry off."""
+        with patch("chroma_ingestion.clients.chroma.chromadb.HttpClient") as mock_http:
+            reset_client()
+            mock_http.return_value = MagicMock()
+
+            get_chroma_client()
+
+            assert mock_http.call_args[1]["settings"].anonymized_telemetry is False
+
     def test_client_config_with_env_variables(self) -> None:
         """Test client initialization respects environment variables."""
         with (
@@ -338,6 +351,33 @@ class TestClientThreadSafety:
             # Constructor should only be called once
             assert mock_http.call_count == 1
 
+    def test_concurrent_first_calls_create_one_client(self) -> None:
+        """Test that threads racing on first access share a single client."""
+        barrier = threading.Barrier(8)
+        clients: list[object] = []
+
+        def worker() -> None:
+            barrier.wait()
+            clients.append(get_chroma_client())
+
+        def slow_client(**kwargs: object) -> MagicMock:
+            # Widen the race window between the check and the assignment
+            threading.Event().wait(0.01)
+            return MagicMock()
+
+        with patch("chroma_ingestion.clients.chroma.chromadb.HttpClient") as mock_http:
+            reset_client()
+            mock_http.side_effect = slow_client
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert mock_http.call_count == 1
+            assert all(c is clients[0] for c in clients)
+
 
 class TestClientIntegration:
     """Integration tests for client module."""
@@ -0,0 +1,251 @@
+"""Unit tests for chroma_ingestion.enrichment module.
+
+Tests for MetadataInferrer covering:
+- Keyword inference of category and tech stack
+- Paged reads and batched write-back in enrich_collection
+- Per-document failures and process-pool inference
+"""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from chroma_ingestion.enrichment.metadata_inferrer import (
+    MetadataInferrer,
+    content_hash,
+    tech_stack_json,
+)
+
+
+def make_collection(docs: list[str], metadatas: list[dict[str, Any]]) -> MagicMock:
+    """Create a mock collection whose `get` lists all IDs or fetches by ID."""
+    doc_ids = [f"doc{i}" for i in range(len(docs))]
+    collection = MagicMock()
+
+    def fake_get(ids: list[str] | None = None, **kwargs: Any) -> dict[str, Any]:
+        if ids is None:
+            return {"ids": list(doc_ids)}
+        rows = [doc_ids.index(doc_id) for doc_id in ids]
+        return {
+            "ids": ids,
+            "documents": [docs[i] for i in rows],
+            "metadatas": [metadatas[i] for i in rows],
+        }
+
+    collection.get.side_effect = fake_get
+    return collection
+
+
+class TestKeywordInference:
+    """Test MetadataInferrer keyword-based inference."""
+
+    DOC = "# Frontend Agent\nBuilds React components with Tailwind; tested with Playwright."
+
+    def test_precomputed_lowercase_matches_default(self) -> None:
+        """Test that passing text_lower gives the same result as computing it."""
+        inferrer = MetadataInferrer()
+        text_lower = self.DOC.lower()
+
+        assert inferrer.infer_category(self.DOC, text_lower) == inferrer.infer_category(self.DOC)
+        assert inferrer.infer_tech_stack(self.DOC, text_lower) == inferrer.infer_tech_stack(
+            self.DOC
+        )
+
+    def test_category_score_is_fraction_of_keywords_matched(self) -> None:
+        """Test that the best category is scored by its share of matched keywords."""
+        category, confidence = MetadataInferrer().infer_category("Docker, Kubernetes, deploy")
+
+        assert category == "devops"
+        assert confidence == 3 / 5
+
+    def test_tech_stack_ranked_by_frequency(self) -> None:
+        """Test that techs are ordered by count, with ties in keyword order."""
+        doc = "pytest, jest. More pytest and pytest. React with jest."
+
+        tech_stack, _ = MetadataInferrer().infer_tech_stack(doc)
+
+        # "test" is matched as a substring of "pytest"
+        assert tech_stack == ["pytest", "test", "jest", "react"]
+
+    def test_description_skips_headings_and_stops_at_max_length(self) -> None:
+        """Test that the description joins body lines up to max_length."""
+        doc = "# Title\n\n## Role\nFirst line.\nSecond line.\n" + "filler\n" * 100
+
+        description, confidence = MetadataInferrer().infer_description(doc, max_length=30)
+
+        assert description == "First line. Second line. fille"
+        assert confidence == 1.0
+
+    def test_repeated_text_reuses_keyword_inference(self) -> None:
+        """Test that identical documents are scanned once and get separate lists."""
+        inferrer = MetadataInferrer()
+
+        with patch.object(
+            inferrer, "infer_tech_stack", wraps=inferrer.infer_tech_stack
+        ) as infer_tech_stack:
+            first = inferrer.enrich_document("doc0", self.DOC)
+            second = inferrer.enrich_document("doc1", self.DOC)
+
+        assert infer_tech_stack.call_count == 1
+        assert second.tech_stack == first.tech_stack
+        assert second.tech_stack is not first.tech_stack
+
+    def test_enrich_document_infers_from_content(self) -> None:
+        """Test that enrich_document combines category and tech stack inference."""
+        enriched = MetadataInferrer().enrich_document("doc0", self.DOC)
+
+        assert enriched.category == "frontend"
+        assert {"react", "tailwind", "playwright"} <= set(enriched.tech_stack)
+
+
+class TestEnrichCollection:
+    """Test MetadataInferrer.enrich_collection."""
+
+    def test_pages_without_embeddings_and_batches_updates(self) -> None:
+        """Test that reads skip embeddings and writes are grouped per batch."""
+        docs = [f"# Agent {i}\nA react testing agent with pytest." for i in range(5)]
+        collection = make_collection(docs, [{"filename": f"a{i}.md"} for i in range(5)])
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            result = MetadataInferrer().enrich_collection(
+                "agents_raw", batch_size=2, page_size=3, concurrency=1
+            )
+
+        assert result["enriched"] == 5
+        assert result["failed_count"] == 0
+        listing, *pages = collection.get.call_args_list
+        assert listing.kwargs == {"include": []}
+        assert [c.kwargs["ids"] for c in pages] == [["doc0", "doc1", "doc2"], ["doc3", "doc4"]]
+        assert all(c.kwargs["include"] == ["documents", "metadatas"] for c in pages)
+        batches = [c.kwargs["ids"] for c in collection.update.call_args_list]
+        assert batches == [["doc0", "doc1"], ["doc2", "doc3"], ["doc4"]]
+        assert "documents" not in collection.update.call_args.kwargs
+        assert collection.update.call_args.kwargs["metadatas"][0]["enriched"] == "true"
+
+    def test_updates_send_only_enriched_fields(self) -> None:
+        """Test that stored metadata is left for Chroma to merge, not re-sent."""
+        collection = make_collection(["# One\nreact"], [{"filename": "one.md", "source": "x"}])
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            MetadataInferrer().enrich_collection("agents_raw")
+
+        (metadata,) = collection.update.call_args.kwargs["metadatas"]
+        assert set(metadata) == {
+            "category",
+            "tech_stack",
+            "description",
+            "enrichment_confidence",
+            "enriched",
+            "content_hash",
+        }
+
+    def test_tech_stack_stored_as_compact_json(self) -> None:
+        """Test that the ranked tech stack is written as compact JSON."""
+        collection = make_collection(["# One\npytest pytest react"], [{}])
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            MetadataInferrer().enrich_collection("agents_raw")
+
+        (metadata,) = collection.update.call_args.kwargs["metadatas"]
+        assert metadata["tech_stack"] == '["pytest","test","react"]'
+        assert tech_stack_json(("pytest", "test", "react")) is metadata["tech_stack"]
+
+    def test_unchanged_enriched_documents_are_skipped(self) -> None:
+        """Test that a stored content_hash matching the text skips re-enrichment."""
+        docs = ["# One\nreact", "# Two\npython"]
+        metadatas = [
+            {"enriched": "true", "content_hash": content_hash(docs[0])},
+            {"enriched": "true", "content_hash": content_hash("# Two\nold text")},
+        ]
+        collection = make_collection(docs, metadatas)
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            result = MetadataInferrer().enrich_collection("agents_raw")
+
+        assert result["skipped"] == 1
+        assert collection.update.call_args.kwargs["ids"] == ["doc1"]
+        (metadata,) = collection.update.call_args.kwargs["metadatas"]
+        assert metadata["content_hash"] == content_hash(docs[1])
+
+    def test_concurrent_pages_cover_every_document(self) -> None:
+        """Test that prefetched pages and parallel writes still enrich each doc once."""
+        docs = [f"# Agent {i}\nA python api agent." for i in range(23)]
+        collection = make_collection(docs, [{} for _ in docs])
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            result = MetadataInferrer().enrich_collection(
+                "agents_raw", batch_size=4, page_size=5, concurrency=3
+            )
+
+        assert result["processed"] == 23
+        assert result["enriched"] == 23
+        written = [i for c in collection.update.call_args_list for i in c.kwargs["ids"]]
+        assert sorted(written) == sorted(f"doc{i}" for i in range(23))
+
+    def test_skips_existing_and_dry_run_writes_nothing(self) -> None:
+        """Test that categorised docs are skipped and dry runs never update."""
+        docs = ["# One\nreact", "# Two\npython"]
+        collection = make_collection(docs, [{"category": "frontend"}, {}])
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            result = MetadataInferrer().enrich_collection("agents_raw", dry_run=True)
+
+        assert result["skipped"] == 1
+        assert result["enriched"] == 1
+        collection.update.assert_not_called()
+
+    def test_failed_update_marks_batch_failed(self) -> None:
+        """Test that a failing batch write reports every id in the batch."""
+        docs = ["# One\nreact", "# Two\npython"]
+        collection = make_collection(docs, [{}, {}])
+        collection.update.side_effect = Exception("boom")
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            result = MetadataInferrer().enrich_collection("agents_raw")
+
+        assert result["enriched"] == 0
+        assert [doc_id for doc_id, _ in result["failed_ids"]] == ["doc0", "doc1"]
+
+    def test_inference_error_fails_only_that_document(self) -> None:
+        """Test that a document whose inference raises is reported and the rest saved."""
+        docs = ["# One\nreact", "# Two\npython"]
+        collection = make_collection(docs, [{}, {}])
+        inferrer = MetadataInferrer()
+        enrich_document = inferrer.enrich_document
+
+        def flaky(doc_id: str, doc_text: str, filename: str | None = None) -> Any:
+            if doc_id == "doc0":
+                raise ValueError("bad doc")
+            return enrich_document(doc_id, doc_text, filename=filename)
+
+        with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+            mock_client.return_value.get_collection.return_value = collection
+            with patch.object(inferrer, "enrich_document", side_effect=flaky):
+                result = inferrer.enrich_collection("agents_raw")
+
+        assert result["failed_ids"] == [("doc0", "bad doc")]
+        assert collection.update.call_args.kwargs["ids"] == ["doc1"]
+
+    def test_worker_processes_match_in_process_results(self) -> None:
+        """Test that inference in a process pool writes the same metadata."""
+        docs = [f"# Agent {i}\nA react frontend agent tested with playwright." for i in range(6)]
+
+        written = []
+        for workers in (1, 2):
+            collection = make_collection(docs, [{} for _ in docs])
+            with patch("chroma_ingestion.clients.chroma.get_chroma_client") as mock_client:
+                mock_client.return_value.get_collection.return_value = collection
+                result = MetadataInferrer().enrich_collection(
+                    "agents_raw", batch_size=4, workers=workers
+                )
+            assert result["enriched"] == 6
+            calls = collection.update.call_args_list
+            written.append([m for c in calls for m in c.kwargs["metadatas"]])
+
+        assert written[0] == written[1]
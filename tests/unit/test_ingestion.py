@@ -8,13 +8,20 @@ Tests for CodeIngester and AgentIngester classes covering:
 - Error handling
 """
 
+import os
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Any, ClassVar
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_text_splitters import Language
 
 from chroma_ingestion.ingestion.agents import AgentIngester
-from chroma_ingestion.ingestion.base import CodeIngester
+from chroma_ingestion.ingestion.base import CodeIngester, _read_files, _read_text
+from chroma_ingestion.ingestion.chunk_cache import ChunkCache
 
 
 class TestCodeIngesterInitialization:
@@ -143,6 +150,21 @@ class TestCodeIngesterFileDiscovery:
             assert any(f.endswith("test.txt") for f in files)
             assert not any(f.endswith("test.py") for f in files)
 
+    def test_discover_files_wildcard_names_use_fnmatch(self, tmp_path: Path) -> None:
+        """Test that names with wildcards beyond a leading * still match like fnmatch."""
+        for name in ("test_a.py", "a_test.py", "test_b.md"):
+            (tmp_path / name).write_text("x")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = CodeIngester(
+                target_folder=str(tmp_path),
+                collection_name="test",
+                file_patterns=["**/test_*.py", "**/*.md"],
+            )
+            files = ingester.discover_files()
+
+        assert [os.path.basename(f) for f in files] == ["test_a.py", "test_b.md"]
+
     def test_discover_files_recursive(self, tmp_path: Path) -> None:
         """Test recursive file discovery."""
         # Create nested structure
@@ -180,6 +202,16 @@ class TestCodeIngesterChunking:
             assert ingester.splitter is not None
             assert hasattr(ingester.splitter, "split_text")
 
+    def test_splitter_shared_between_ingesters_with_same_settings(self, tmp_path: Path) -> None:
+        """Test that ingesters with equal chunk settings reuse one splitter."""
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            first = CodeIngester(target_folder=str(tmp_path), collection_name="a")
+            second = CodeIngester(target_folder=str(tmp_path), collection_name="b")
+            other = CodeIngester(target_folder=str(tmp_path), collection_name="c", chunk_size=500)
+
+        assert first.splitter is second.splitter
+        assert other.splitter is not first.splitter
+
     def test_split_text_returns_chunks(self, tmp_path: Path) -> None:
         """Test that text splitting returns chunks."""
         with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
@@ -198,6 +230,261 @@ class TestCodeIngesterChunking:
             assert all(len(chunk) > 0 for chunk in chunks)
 
 
+class TestCodeIngesterIngest:
+    """Test CodeIngester.ingest_files."""
+
+    def test_each_chunk_gets_its_own_metadata(self, tmp_path: Path) -> None:
+        """Test that chunks share path fields but carry their own chunk_index."""
+        (tmp_path / "notes.md").write_text("word " * 100)
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = CodeIngester(
+                target_folder=str(tmp_path), collection_name="test", chunk_size=100
+            )
+            ingester.ingest_files()
+
+        metadatas = collection.upsert.call_args.kwargs["metadatas"]
+        assert len(metadatas) > 1
+        assert [m["chunk_index"] for m in metadatas] == list(range(len(metadatas)))
+        assert all(m["filename"] == "notes.md" and m["file_type"] == ".md" for m in metadatas)
+
+    def test_unreadable_file_is_skipped_in_order(self, tmp_path: Path) -> None:
+        """Test that a file failing to decode is skipped and the rest keep file order."""
+        (tmp_path / "a.md").write_text("alpha")
+        (tmp_path / "b.md").write_bytes(b"\xff\xfe not utf-8")
+        (tmp_path / "c.md").write_text("gamma")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = CodeIngester(target_folder=str(tmp_path), collection_name="test")
+            files_processed, chunks = ingester.ingest_files()
+
+        assert (files_processed, chunks) == (2, 2)
+        assert collection.upsert.call_args.kwargs["documents"] == ["alpha", "gamma"]
+
+    def test_python_files_use_code_splitter(self, tmp_path: Path) -> None:
+        """Test that .py files are split on code boundaries and others as Markdown."""
+        # No blank lines, so a Markdown split would cut functions mid-body
+        source = "".join(f"def f{n}():\n    x = {n}\n    return x\n" for n in range(8))
+        (tmp_path / "mod.py").write_text(source)
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = CodeIngester(
+                target_folder=str(tmp_path), collection_name="test", chunk_size=60
+            )
+            ingester.ingest_files()
+
+        documents = collection.upsert.call_args.kwargs["documents"]
+        assert all(doc.startswith("def f") for doc in documents)
+        assert documents == ingester.split_content(source, Language.PYTHON)
+
+    def test_batches_are_split_across_files(self, tmp_path: Path) -> None:
+        """Test that chunks from several files are upserted in batches of batch_size."""
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text(name)
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = CodeIngester(target_folder=str(tmp_path), collection_name="test")
+            assert ingester.ingest_files(batch_size=2) == (3, 3)
+
+        # Batches are written concurrently, so their completion order varies
+        batches = sorted(c.kwargs["documents"] for c in collection.upsert.call_args_list)
+        assert batches == [["a.md", "b.md"], ["c.md"]]
+
+    def test_batches_are_upserted_concurrently(self, tmp_path: Path) -> None:
+        """Test that upsert_workers batches are in flight at the same time."""
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text(name)
+        # Each upsert waits until both are in flight; a serial writer would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            collection.upsert.side_effect = lambda **kwargs: barrier.wait()
+            ingester = CodeIngester(
+                target_folder=str(tmp_path), collection_name="test", upsert_workers=2
+            )
+            assert ingester.ingest_files(batch_size=1) == (2, 2)
+
+    def test_batches_flush_at_max_batch_bytes(self, tmp_path: Path) -> None:
+        """Test that a batch is flushed once its text reaches max_batch_bytes."""
+        (tmp_path / "a.md").write_text("é" * 5)  # 10 bytes of UTF-8
+        (tmp_path / "b.md").write_text("bb")
+        (tmp_path / "c.md").write_text("cc")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = CodeIngester(
+                target_folder=str(tmp_path), collection_name="test", max_batch_bytes=4
+            )
+            assert ingester.ingest_files(batch_size=100) == (3, 3)
+
+        batches = sorted(c.kwargs["documents"] for c in collection.upsert.call_args_list)
+        assert batches == [["bb", "cc"], ["ééééé"]]
+
+    def test_reads_do_not_run_ahead_of_upserts(self, tmp_path: Path) -> None:
+        """Test that a stalled upsert stops file reads after a bounded window."""
+        n_files = 100
+        for n in range(n_files):
+            (tmp_path / f"{n:03}.md").write_text(f"file {n}")
+        reads = 0
+        lock = threading.Lock()
+
+        def counting_read(path: str) -> str:
+            nonlocal reads
+            with lock:
+                reads += 1
+            return os.path.basename(path)
+
+        reads_after_stall: list[int] = []
+
+        def stalled_upsert(**kwargs: Any) -> None:
+            if not reads_after_stall:
+                # Long enough for unbounded readers to get through every file
+                time.sleep(0.2)
+                reads_after_stall.append(reads)
+
+        with (
+            patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client,
+            patch("chroma_ingestion.ingestion.base._read_text", side_effect=counting_read),
+        ):
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            collection.upsert.side_effect = stalled_upsert
+            ingester = CodeIngester(
+                target_folder=str(tmp_path), collection_name="test", upsert_workers=1
+            )
+            assert ingester.ingest_files(batch_size=1) == (n_files, n_files)
+
+        # 32 readers x 2 read ahead, plus the few batches queued to the writer
+        assert reads_after_stall[0] <= 64 + 8 < n_files
+
+    def test_upsert_error_propagates(self, tmp_path: Path) -> None:
+        """Test that an error raised on the writer thread surfaces from ingest_files."""
+        (tmp_path / "a.md").write_text("alpha")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            collection.upsert.side_effect = ConnectionError("server down")
+            ingester = CodeIngester(target_folder=str(tmp_path), collection_name="test")
+            with pytest.raises(ConnectionError, match="server down"):
+                ingester.ingest_files()
+
+
+class TestReadText:
+    """Test the _read_text file reader."""
+
+    def test_matches_text_mode_read(self, tmp_path: Path) -> None:
+        """Test that content, empty files and line endings match open().read()."""
+        cases = {"plain.md": b"caf\xc3\xa9\n", "empty.md": b"", "crlf.md": b"a\r\nb\rc\n"}
+        for name, data in cases.items():
+            (tmp_path / name).write_bytes(data)
+            path = str(tmp_path / name)
+            with open(path, encoding="utf-8") as f:
+                assert _read_text(path) == f.read()
+
+    def test_errors_are_returned(self, tmp_path: Path) -> None:
+        """Test that missing and non-UTF-8 files yield the exception instead of raising."""
+        (tmp_path / "bad.md").write_bytes(b"\xff\xfe")
+
+        assert isinstance(_read_text(str(tmp_path / "missing.md")), FileNotFoundError)
+        assert isinstance(_read_text(str(tmp_path / "bad.md")), UnicodeDecodeError)
+
+    def test_read_files_bounds_read_ahead(self) -> None:
+        """Test that reads come back in order with at most `window` submitted ahead."""
+        paths = [f"{n}.md" for n in range(10)]
+
+        def submit(fn: Any, path: str) -> Future[str]:
+            future: Future[str] = Future()
+            future.set_result(f"text of {path}")
+            return future
+
+        pool = MagicMock()
+        pool.submit.side_effect = submit
+        results = _read_files(pool, paths, window=3)
+
+        assert next(results) == ("0.md", "text of 0.md")
+        # The window is refilled one read per result consumed
+        assert pool.submit.call_count == 4
+        assert [path for path, _ in results] == paths[1:]
+        assert pool.submit.call_count == len(paths)
+
+
+class TestChunkCache:
+    """Test ChunkCache and cached splitting."""
+
+    def test_round_trip_keyed_by_settings(self, tmp_path: Path) -> None:
+        """Test that entries are found only for the same content and settings."""
+        cache = ChunkCache(tmp_path / "chunks")
+
+        assert cache.get("text", 100, 10) is None
+        cache.put("text", 100, 10, ["te", "xt"])
+
+        assert cache.get("text", 100, 10) == ["te", "xt"]
+        assert cache.get("text", 200, 10) is None
+        assert cache.get("other", 100, 10) is None
+        assert cache.get("text", 100, 10, language="python") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that an unreadable or wrongly shaped entry degrades to a cache miss."""
+        cache = ChunkCache(tmp_path)
+        cache.put("text", 100, 10, ["text"])
+        entry = next(tmp_path.glob("*.json"))
+
+        for bad in ("{not json", '{"chunks": ["text"]}', "[1, 2]"):
+            entry.write_text(bad)
+            assert cache.get("text", 100, 10) is None
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        """Test that a write failing after mkstemp (e.g. a full disk) cleans up."""
+        cache = ChunkCache(tmp_path)
+
+        with patch(
+            "chroma_ingestion.ingestion.chunk_cache.os.replace", side_effect=OSError("disk full")
+        ):
+            cache.put("text", 100, 10, ["text"])
+
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get("text", 100, 10) is None
+
+    def test_split_content_short_text_bypasses_splitter(self, tmp_path: Path) -> None:
+        """Test that text within one chunk is returned stripped without splitting."""
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = CodeIngester(
+                target_folder=str(tmp_path), collection_name="test", chunk_size=100
+            )
+        text = "\n# Title\n\nShort body.\n"
+
+        with patch.object(ingester.splitter, "split_text") as split_text:
+            chunks = ingester.split_content(text)
+            empty = ingester.split_content(" \n ")
+
+        split_text.assert_not_called()
+        assert chunks == ingester.splitter.split_text(text) == ["# Title\n\nShort body."]
+        assert empty == []
+
+    def test_split_content_reuses_cached_chunks(self, tmp_path: Path) -> None:
+        """Test that a second split of the same content skips the splitter."""
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = CodeIngester(
+                target_folder=str(tmp_path),
+                collection_name="test",
+                chunk_size=100,
+                chunk_cache=ChunkCache(tmp_path / "chunks"),
+            )
+        content = "word " * 200
+
+        first = ingester.split_content(content)
+        with patch.object(ingester.splitter, "split_text") as split_text:
+            second = ingester.split_content(content)
+
+        assert len(first) > 1
+        assert second == first
+        split_text.assert_not_called()
+
+
 class TestCodeIngesterMetadata:
     """Test CodeIngester metadata handling."""
 
@@ -250,6 +537,70 @@ class TestAgentIngesterInitialization:
             assert "agent" in patterns_str.lower()
 
 
+class TestAgentIngesterDiscovery:
+    """Test AgentIngester file discovery."""
+
+    def test_discover_files_prunes_and_dedupes(self, tmp_path: Path) -> None:
+        """Test that the walk skips pruned/hidden dirs and lists each file once."""
+        for rel in [
+            "root.md",
+            "team/planner.agent.md",
+            "team/deep/writer.prompt.md",
+            "team/README.md",
+            "node_modules/pkg/dep.md",
+            ".git/info.md",
+            "notes.txt",
+        ]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("# doc")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = AgentIngester(target_folder=[tmp_path, tmp_path])
+            files = ingester.discover_files()
+
+        assert files == [
+            str(tmp_path / "root.md"),
+            str(tmp_path / "team" / "deep" / "writer.prompt.md"),
+            str(tmp_path / "team" / "planner.agent.md"),
+        ]
+
+
+class TestAgentIngesterIngest:
+    """Test AgentIngester.ingest_agents."""
+
+    def test_ingest_reads_files_in_order_and_counts_failures(self, tmp_path: Path) -> None:
+        """Test that every readable file is chunked and unreadable ones are counted."""
+        (tmp_path / "alpha.md").write_text("---\nname: alpha\n---\n# Alpha\nReact agent.")
+        (tmp_path / "beta.md").write_text("# Beta\nPython agent.")
+        (tmp_path / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = AgentIngester(target_folder=tmp_path)
+            files_processed, chunks = ingester.ingest_agents(verbose=False)
+
+        assert (files_processed, chunks) == (2, 2)
+        ids = collection.upsert.call_args.kwargs["ids"]
+        assert ids == [
+            f"alpha:{tmp_path / 'alpha.md'}:0",
+            f"beta:{tmp_path / 'beta.md'}:0",
+        ]
+
+    def test_ingest_streams_batches(self, tmp_path: Path) -> None:
+        """Test that chunks are upserted in batches of batch_size as files are chunked."""
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text(f"# {name}")
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client") as mock_client:
+            collection = mock_client.return_value.get_or_create_collection.return_value
+            ingester = AgentIngester(target_folder=tmp_path, upsert_workers=1)
+            assert ingester.ingest_agents(batch_size=2, verbose=False) == (3, 3)
+
+        batches = [c.kwargs["documents"] for c in collection.upsert.call_args_list]
+        assert batches == [["# a.md", "# b.md"], ["# c.md"]]
+
+
 class TestAgentIngesterParsing:
     """Test AgentIngester YAML front matter parsing."""
 
@@ -295,27 +646,104 @@ This is the body of the agent.
             # Should return minimal metadata
             assert isinstance(metadata, dict)
 
+    def test_extract_metadata_classifies_content(self, tmp_path: Path) -> None:
+        """Test that category and tech stack come from the case-folded content."""
+        content = "---\nname: ui-builder\n---\n# UI Builder\nBuilds React and Tailwind UIs."
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = AgentIngester(target_folder=str(tmp_path))
+
+            metadata, _ = ingester.extract_metadata(str(tmp_path / "ui.agent.md"), content)
+
+        assert metadata["category"] == "frontend"
+        # Keywords match as substrings: "ai" is found inside "tailwind"
+        assert metadata["tech_stack"] == "ai,react,tailwind,ui"
+        assert ingester.extract_tech_stack(content) == ["ai", "react", "tailwind", "ui"]
+
+    def test_subclass_keyword_tables_are_compiled(self, tmp_path: Path) -> None:
+        """Test that a subclass overriding the keyword tables uses its own."""
+
+        class DocsIngester(AgentIngester):
+            TECH_KEYWORDS: ClassVar[dict[str, list[str]]] = {"docs": ["mkdocs", "sphinx"]}
+            CATEGORY_KEYWORDS: ClassVar[dict[str, list[str]]] = {
+                "writing": ["docs"],
+                "frontend": ["react"],
+            }
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = DocsIngester(target_folder=str(tmp_path))
+
+        assert ingester.extract_tech_stack("Sphinx and React") == ["sphinx"]
+        assert ingester.classify_category("guide.md", "React docs") == "writing"
+        assert AgentIngester._TECH_TERMS != DocsIngester._TECH_TERMS
+
+    def test_parse_frontmatter_splits_body(self, tmp_path: Path) -> None:
+        """Test that frontmatter is parsed and the stripped body returned."""
+        content = "---\nname: planner\nmodel: opus\n---\n\n# Planner\nPlans tasks.\n"
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = AgentIngester(target_folder=str(tmp_path))
+
+            frontmatter, body = ingester.parse_frontmatter(content)
+
+        assert frontmatter == {"name": "planner", "model": "opus"}
+        assert body == "# Planner\nPlans tasks."
+
+    def test_parse_frontmatter_invalid_yaml_keeps_content(self, tmp_path: Path) -> None:
+        """Test that malformed YAML frontmatter is ignored rather than raised."""
+        content = "---\nname: [unclosed\n---\n# Body"
+
+        with patch("chroma_ingestion.ingestion.base.get_chroma_client"):
+            ingester = AgentIngester(target_folder=str(tmp_path))
+
+            frontmatter, body = ingester.parse_frontmatter(content)
+
+        assert frontmatter == {}
+        assert body == content
+
 
 class TestCodeIngesterErrorHandling:
     """Test CodeIngester error handling."""
 
     def test_discover_files_with_permission_error(self, tmp_path: Path) -> None:
-        """Test handling of permission errors during file discovery."""
+        """Test that an unreadable directory is skipped, as glob would skip it."""
         restricted_dir = tmp_path / "restricted"
         restricted_dir.mkdir()
+        (restricted_dir / "hidden.py").write_text("# hidden")
+        (tmp_path / "visible.py").write_text("# visible")
+        real_scandir = os.scandir
+
+        def scandir(path: str) -> Any:
+            if path == str(restricted_dir):
+                raise PermissionError("Permission denied")
+            return real_scandir(path)
 
         with (
             patch("chroma_ingestion.ingestion.base.get_chroma_client"),
-            patch("glob.glob") as mock_glob,
+            patch("chroma_ingestion.ingestion.base.os.scandir", side_effect=scandir),
+        ):
+            ingester = CodeIngester(
+                target_folder=str(tmp_path),
+                collection_name="test",
+            )
+
+            # Should handle error gracefully
+            assert ingester.discover_files() == [str(tmp_path / "visible.py")]
+
+    def test_discover_files_custom_path_patterns_use_glob(self, tmp_path: Path) -> None:
+        """Test that patterns with directory parts still go through glob."""
+        with (
+            patch("chroma_ingestion.ingestion.base.get_chroma_client"),
+            patch("chroma_ingestion.ingestion.base.glob.iglob") as mock_glob,
         ):
             mock_glob.side_effect = PermissionError("Permission denied")
 
             ingester = CodeIngester(
                 target_folder=str(tmp_path),
                 collection_name="test",
+                file_patterns=["src/**/*.py"],
             )
 
-            # Should handle error gracefully
             with pytest.raises(PermissionError):
                 ingester.discover_files()
 
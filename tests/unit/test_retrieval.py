@@ -9,9 +9,16 @@ Tests for CodeRetriever and MultiCollectionSearcher classes covering:
 - Error handling
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
-from chroma_ingestion.retrieval.retriever import CodeRetriever, MultiCollectionSearcher
+from chroma_ingestion.retrieval.cache import QueryCache
+from chroma_ingestion.retrieval.rag_chain import RAGChain
+from chroma_ingestion.retrieval.retriever import (
+    CodeRetriever,
+    MultiCollectionSearcher,
+    clear_cache,
+)
 
 
 class TestCodeRetrieverInitialization:
@@ -43,6 +50,36 @@ class TestCodeRetrieverInitialization:
             assert retriever.client == mock_http_client
             assert retriever.collection == mock_collection
 
+    def test_collection_handle_is_shared(self) -> None:
+        """Test that retrievers for one collection fetch its handle only once."""
+        with patch("chroma_ingestion.retrieval.retriever.get_chroma_client") as mock_client:
+            first = CodeRetriever("shared")
+            second = CodeRetriever("shared")
+            clear_cache()
+            third = CodeRetriever("shared")
+
+        assert first.collection is second.collection is third.collection
+        assert mock_client.return_value.get_or_create_collection.call_count == 2
+
+    def test_collection_handles_follow_the_client(self) -> None:
+        """Test that a new client fetches its own handles and clearing is per collection."""
+        with patch("chroma_ingestion.retrieval.retriever.get_chroma_client") as mock_client:
+            old_client = mock_client.return_value
+            CodeRetriever("a")
+            CodeRetriever("b")
+            mock_client.return_value = new_client = MagicMock()
+            CodeRetriever("a")
+            clear_cache("a")
+            CodeRetriever("a")
+            CodeRetriever("b")
+
+        assert old_client.get_or_create_collection.call_count == 2
+        assert [c.kwargs["name"] for c in new_client.get_or_create_collection.call_args_list] == [
+            "a",
+            "a",
+            "b",
+        ]
+
 
 class TestCodeRetrieverQuery:
     """Test CodeRetriever query operations."""
@@ -372,6 +409,33 @@ class TestMultiCollectionSearcher:
             if results:
                 assert results[0]["distance"] <= 0.1
 
+    def test_search_all_queries_collections_concurrently(self) -> None:
+        """Test that collections are queried in parallel and keyed in input order."""
+        # Each query waits until both are in flight; sequential queries would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_collection(doc: str) -> MagicMock:
+            collection = MagicMock()
+
+            def query(**kwargs: object) -> dict:
+                barrier.wait()
+                return {"documents": [[doc]], "metadatas": [[{}]], "distances": [[0.1]]}
+
+            collection.query.side_effect = query
+            return collection
+
+        with patch("chroma_ingestion.retrieval.retriever.get_chroma_client") as mock_client:
+            collections = {"col1": make_collection("a"), "col2": make_collection("b")}
+            mock_client.return_value.get_or_create_collection.side_effect = (
+                lambda name: collections[name]
+            )
+
+            searcher = MultiCollectionSearcher(["col1", "col2"])
+            results = searcher.search_all("query", n_results=1)
+
+        assert list(results) == ["col1", "col2"]
+        assert [r[0]["document"] for r in results.values()] == ["a", "b"]
+
 
 class TestCodeRetrieverEdgeCases:
     """Test CodeRetriever edge cases."""
@@ -421,3 +485,125 @@ class TestCodeRetrieverEdgeCases:
 
             # Zero threshold should reject all
             assert len(results) == 0
+
+
+class TestQueryCache:
+    """Test the on-disk QueryCache used by search and rag-query."""
+
+    def test_roundtrip_persists_across_instances(self, tmp_path) -> None:
+        """Test that cached results survive a new cache instance (new CLI run)."""
+        path = tmp_path / "queries.json"
+        results = [{"document": "doc", "metadata": {"f": "a"}, "distance": 0.1}]
+
+        QueryCache(path).put("coll", "auth  middleware", 3, results)
+
+        assert QueryCache(path).get("coll", " auth middleware ", 3) == results
+        assert QueryCache(path).get("coll", "auth middleware", 5) is None
+        assert QueryCache(path).get("other", "auth middleware", 3) is None
+
+    def test_expired_entries_miss(self, tmp_path) -> None:
+        """Test that entries older than the TTL are ignored."""
+        cache = QueryCache(tmp_path / "queries.json", ttl=60)
+        with patch("chroma_ingestion.retrieval.cache.time.time", return_value=1000.0):
+            cache.put("coll", "q", 3, [{"document": "doc"}])
+        with patch("chroma_ingestion.retrieval.cache.time.time", return_value=1061.0):
+            assert cache.get("coll", "q", 3) is None
+
+    def test_evicts_least_recently_used(self, tmp_path) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = QueryCache(tmp_path / "queries.json", max_entries=2)
+        cache.put("coll", "a", 3, [{"document": "a"}])
+        cache.put("coll", "b", 3, [{"document": "b"}])
+        cache.get("coll", "a", 3)
+        cache.put("coll", "c", 3, [{"document": "c"}])
+
+        assert cache.get("coll", "a", 3) is not None
+        assert cache.get("coll", "b", 3) is None
+
+    def test_get_does_not_rewrite_file(self, tmp_path) -> None:
+        """Test that hits and expired misses leave the file to the next write."""
+        cache = QueryCache(tmp_path / "queries.json", ttl=60)
+        with patch("chroma_ingestion.retrieval.cache.time.time", return_value=1000.0):
+            cache.put("coll", "q", 3, [{"document": "doc"}])
+
+        with patch.object(QueryCache, "_save") as mock_save:
+            with patch("chroma_ingestion.retrieval.cache.time.time", return_value=1001.0):
+                assert cache.get("coll", "q", 3) is not None
+            with patch("chroma_ingestion.retrieval.cache.time.time", return_value=1061.0):
+                assert cache.get("coll", "q", 3) is None
+
+        mock_save.assert_not_called()
+
+    def test_unserializable_results_do_not_raise(self, tmp_path) -> None:
+        """Test that a failed write is swallowed and leaves no temp file behind."""
+        cache = QueryCache(tmp_path / "queries.json")
+
+        cache.put("coll", "q", 3, [{"document": "doc", "metadata": {"tags": {"a"}}}])
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalidate_drops_only_that_collection(self, tmp_path) -> None:
+        """Test that invalidation is scoped to the modified collection."""
+        path = tmp_path / "queries.json"
+        cache = QueryCache(path)
+        cache.put("coll", "q", 3, [{"document": "a"}])
+        cache.put("other", "q", 3, [{"document": "b"}])
+
+        cache.invalidate("coll")
+
+        assert QueryCache(path).get("coll", "q", 3) is None
+        assert QueryCache(path).get("other", "q", 3) is not None
+
+    def test_retriever_skips_chroma_on_hit(self, tmp_path) -> None:
+        """Test that a cached query does not reach the collection again."""
+        with patch("chroma_ingestion.retrieval.retriever.get_chroma_client") as mock_client:
+            mock_collection = MagicMock()
+            mock_collection.query.return_value = {
+                "documents": [["doc1"]],
+                "metadatas": [[{"f": "f1"}]],
+                "distances": [[0.2]],
+            }
+            mock_client.return_value.get_or_create_collection.return_value = mock_collection
+
+            retriever = CodeRetriever("test_collection", cache=QueryCache(tmp_path / "q.json"))
+            first = retriever.query("test", n_results=1)
+            second = retriever.query("test", n_results=1)
+
+            assert first == second
+            mock_collection.query.assert_called_once()
+
+
+class TestRAGChainRetrieve:
+    """Test RAGChain threshold filtering."""
+
+    def test_keeps_results_within_threshold(self) -> None:
+        """Test that results past the threshold are dropped, or all kept if none pass."""
+        with patch("chroma_ingestion.retrieval.retriever.get_chroma_client"):
+            rag = RAGChain(collection_name="test_collection", distance_threshold=0.5)
+
+        results = [{"distance": 0.1}, {"distance": 0.4}, {"distance": 0.7}]
+        with patch.object(rag.retriever, "query", return_value=results):
+            assert rag.retrieve("q") == results[:2]
+            assert rag.retrieve("q", threshold=0.05) == results
+
+
+class TestRAGChainFormatting:
+    """Test RAGChain result formatting."""
+
+    def test_structured_output_tolerates_missing_metadata(self) -> None:
+        """Test that results without metadata fall back to placeholders."""
+        with patch("chroma_ingestion.retrieval.retriever.get_chroma_client"):
+            rag = RAGChain(collection_name="test_collection")
+
+        results = [
+            {"document": "doc", "metadata": {"agent_name": "a", "source": "s"}, "distance": 0.2},
+            {"document": "doc", "metadata": None, "distance": 0.3},
+        ]
+        with patch.object(rag, "retrieve", return_value=results):
+            output = rag.query("q", format_output=False)
+
+        assert output["results"] == [
+            {"agent_name": "a", "source": "s", "confidence": 0.8, "distance": 0.2},
+            {"agent_name": "Unknown", "source": "Unknown", "confidence": 0.7, "distance": 0.3},
+        ]
+        assert "2. Unknown\n   📍 Source: Unknown" in rag.format_results(results)